@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+generate_all.py - Regenerate the design figures in a single process
+
+Each design plot script can still be run standalone, but running them one
+by one pays the matplotlib import and font-cache start-up cost every time.
+This driver imports matplotlib once and calls each script's build_figures()
+in sequence: DES-001 (thruster_performance_sizing.py), DES-003
+(catalyst_preheat_thermal.py), DES-004 (chamber_nozzle_plots.py), DES-005
+(envelope_visualization.py) and DES-006 (thrust_control.py). The scripts
+write to design/plots relative to the repository root, so the driver runs
+from there whatever the caller's working directory. The DES-004 figures are
+skipped when DES004_NOPLOT is set.
+
+Usage: python design/generate_all.py
+"""
+
+import functools
+import os
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+
+SCRIPTS_DIR = Path(__file__).resolve().parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from _geometry_cache import load_geometry
+from _optional_deps import load_json
+import catalyst_preheat_thermal
+import chamber_nozzle_plots
+import envelope_visualization
+import thrust_control
+import thruster_performance_sizing
+
+ROOT_DIR = SCRIPTS_DIR.parent.parent
+DATA_DIR = ROOT_DIR / "design" / "data"
+
+# (design ID, figure module, loader for the data its build_figures() takes,
+# or None when it takes none)
+FIGURE_BUILDERS = [
+    ("DES-001", thruster_performance_sizing,
+     functools.partial(load_json, DATA_DIR / "thruster_performance_sizing.json")),
+    ("DES-003", catalyst_preheat_thermal,
+     functools.partial(catalyst_preheat_thermal.simulate_preheat, catalyst_preheat_thermal.power_limit)),
+    ("DES-004", chamber_nozzle_plots, load_geometry),
+    ("DES-005", envelope_visualization, None),
+    ("DES-006", thrust_control, None),
+]
+
+
+def main():
+    """Build every registered design figure."""
+    # Figure paths are relative to the repository root
+    os.chdir(ROOT_DIR)
+
+    print("=" * 80)
+    print("Design Figure Generation")
+    print("=" * 80)
+
+    for design_id, module, load_data in FIGURE_BUILDERS:
+        outputs = module.build_figures(load_data()) if load_data else module.build_figures()
+        print(f"\n{design_id} ({module.__name__}.py):")
+        for path in outputs:
+            print(f"  {Path(path).resolve().relative_to(ROOT_DIR)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Shared chamber/nozzle geometry for the design scripts.
+
+Collects the scalar geometry and wall-sizing values that DES-003 and the
+DES-004 plots read from the DES-001 (thruster_performance_sizing.json) and
+DES-004 (chamber_nozzle_stress.json) outputs, and caches them as flat
+binary design/data/_geometry_<source>.npz files, one per source JSON. Each
+cache is rebuilt whenever its source JSON is newer than it, so a
+regenerated design is always picked up.
+"""
+
+import json
+import os
+import tempfile
+import zipfile
+import numpy as np
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Cache key -> (source JSON, path within that JSON)
+GEOMETRY_FIELDS = {
+    "throat_diameter_m": ("thruster_performance_sizing.json", ("computed_results", "throat_diameter_m")),
+    "chamber_radius_mm": ("chamber_nozzle_stress.json", ("chamber_geometry", "chamber_radius_mm")),
+    "chamber_diameter_mm": ("chamber_nozzle_stress.json", ("chamber_geometry", "chamber_diameter_mm")),
+    "chamber_length_mm": ("chamber_nozzle_stress.json", ("chamber_geometry", "chamber_length_mm")),
+    "nozzle_length_mm": ("chamber_nozzle_stress.json", ("nozzle_properties", "nozzle_length_mm")),
+    "nozzle_exit_diameter_mm": ("chamber_nozzle_stress.json", ("nozzle_properties", "exit_diameter_mm")),
+    "overall_length_mm": ("chamber_nozzle_stress.json", ("overall_envelope", "overall_length_mm")),
+    "overall_diameter_mm": ("chamber_nozzle_stress.json", ("overall_envelope", "overall_diameter_mm")),
+    "design_pressure_MPa": ("chamber_nozzle_stress.json", ("parameters", "design_pressure_MPa")),
+    "chamber_operating_temp_C": ("chamber_nozzle_stress.json", ("parameters", "chamber_operating_temp_C")),
+    "design_thickness_mm": ("chamber_nozzle_stress.json", ("wall_thickness", "design_thickness_mm")),
+    "material_yield_at_temp_MPa": ("chamber_nozzle_stress.json", ("wall_thickness", "material_yield_at_temp_MPa")),
+    "actual_safety_factor": ("chamber_nozzle_stress.json", ("wall_thickness", "actual_safety_factor")),
+}
+
+
+def _source_cache(filename):
+    """Cache file for the fields read from one source JSON."""
+    return DATA_DIR / f"_geometry_{Path(filename).stem}.npz"
+
+
+def _build_geometry(filename, keys):
+    """Read the given fields from their source JSON."""
+    with open(DATA_DIR / filename, 'r') as f:
+        document = json.load(f)
+    geometry = {}
+    for key in keys:
+        value = document
+        for part in GEOMETRY_FIELDS[key][1]:
+            value = value[part]
+        geometry[key] = float(value)
+    return geometry
+
+
+def _load_source(filename, keys):
+    """Fields from one source JSON, via its .npz cache when that is current."""
+    source = DATA_DIR / filename
+    cache = _source_cache(filename)
+    try:
+        if cache.stat().st_mtime >= source.stat().st_mtime:
+            with np.load(cache) as cached:
+                return {key: float(cached[key]) for key in keys}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        pass  # no usable cache (missing, stale, partial or truncated) - rebuild it
+
+    # Cache every field of this source, not just the ones asked for
+    geometry = _build_geometry(filename, [key for key, (name, _) in GEOMETRY_FIELDS.items()
+                                          if name == filename])
+    # Write to a temporary file and swap it in, so concurrent readers never
+    # see a half-written archive; the cache is best-effort
+    fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, prefix=cache.stem, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **geometry)
+        os.replace(tmp_path, cache)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    return {key: geometry[key] for key in keys}
+
+
+def load_geometry(keys=None):
+    """
+    Load shared design geometry, rebuilding stale .npz caches as needed.
+
+    Each source JSON has its own cache, and only the sources that hold the
+    requested fields are read, so a caller that needs only DES-001 values
+    does not depend on the DES-004 output.
+
+    Parameters:
+    -----------
+    keys : iterable of str, optional
+        Fields to load (default: every field in GEOMETRY_FIELDS)
+
+    Returns:
+    --------
+    dict
+        Geometry and wall-sizing values keyed as in GEOMETRY_FIELDS
+    """
+    keys = list(GEOMETRY_FIELDS) if keys is None else list(keys)
+    by_source = {}
+    for key in keys:
+        by_source.setdefault(GEOMETRY_FIELDS[key][0], []).append(key)
+    geometry = {}
+    for filename, source_keys in by_source.items():
+        geometry.update(_load_source(filename, source_keys))
+    return {key: geometry[key] for key in keys}
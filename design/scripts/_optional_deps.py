@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared handling of the optional dependencies of the design scripts.
+
+Numba and orjson speed the scripts up but are not required: without Numba
+the @njit kernels run as plain Python, and without orjson the JSON inputs
+and outputs go through the standard library. Numba is imported on first
+use of njit, prange or register_jitable rather than with this module, so
+scripts that only read or write JSON do not pay for its import.
+"""
+
+import functools
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def _numba():
+    """njit, prange and register_jitable from Numba, or plain-Python stand-ins."""
+    try:
+        from numba import njit, prange
+        from numba.extending import register_jitable
+    except ImportError:
+        # Numba is optional: without it the kernels run as plain Python
+        def njit(*args, **kwargs):
+            if len(args) == 1 and callable(args[0]):
+                return args[0]
+            return lambda func: func
+        prange = range
+        register_jitable = njit
+    return {"njit": njit, "prange": prange, "register_jitable": register_jitable}
+
+
+def __getattr__(name):
+    # `from _optional_deps import njit, prange` imports Numba here, on demand
+    if name in ("njit", "prange", "register_jitable"):
+        return _numba()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_json(path):
+    """Parse a JSON file."""
+    path = Path(path)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def dumps_json(data):
+    """Serialize data (NumPy scalars and arrays included) as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, default=lambda obj: obj.tolist()).encode()
+
+
+def write_json(path, data):
+    """
+    Write data to path as JSON, unless the file already holds exactly those bytes.
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    path = Path(path)
+    encoded = dumps_json(data)
+    try:
+        if path.read_bytes() == encoded:
+            return False
+    except OSError:
+        pass  # no previous output - write it
+    path.write_bytes(encoded)
+    return True
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Shared physical constants for the design scripts.
+
+Single source for the standard gravity and hydrazine property values that
+DES-002 (propellant_budget.py) and DES-007 (propellant_feed_thermal.py) both
+use, all taken from CONTEXT.md and NASA-SP-8096. Design results such as the
+DES-002 propellant mass are not constants; import them from the script that
+computes them.
+"""
+
+G0 = 9.80665  # m/s² — standard gravitational acceleration (exact, SI)
+
+# Hydrazine (N2H4) properties
+RHO_N2H4 = 1004.0  # kg/m³ — liquid density at 25°C
+CP_N2H4 = 3200.0  # J/kg·K — specific heat at 25°C
+T_FREEZE_N2H4_C = 1.4  # °C — freezing point (critical for thermal design)
+T_BOIL_N2H4_C = 113.5  # °C — boiling point at 1 atm
@@ -11,11 +11,13 @@ Date: 2026-02-14
 Design ID: DES-003
 """
 
-import json
+import argparse
 import numpy as np
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
 from pathlib import Path
 
+from _geometry_cache import load_geometry
+from _optional_deps import njit, write_json
 
 # ============================================================================
 # PHYSICAL CONSTANTS AND MATERIAL PROPERTIES
@@ -77,7 +79,7 @@ preheat_time_target = 600.0        # seconds - target preheat time (10 minutes)
 # ============================================================================
 
 # Chamber geometry from DES-001 (thruster_performance_sizing.json)
-throat_diameter = 0.007476535752447692  # m (7.48 mm)
+throat_diameter = load_geometry(["throat_diameter_m"])["throat_diameter_m"]  # m (7.48 mm)
 
 # Chamber diameter assumption: 3x throat diameter (typical for hydrazine thrusters)
 # Sources: CONTEXT.md Section 3 (Key Dimensions)
@@ -104,11 +106,36 @@ wall_thickness = 0.001  # m (1 mm)
 chamber_wall_volume = np.pi * ((chamber_radius + wall_thickness)**2 - chamber_radius**2) * bed_length  # m^3
 chamber_wall_mass = chamber_density * chamber_wall_volume  # kg
 
+# Effective heat capacity = m_catalyst * cp_catalyst + m_chamber * cp_chamber
+effective_heat_capacity = (catalyst_mass * catalyst_specific_heat +
+                           chamber_wall_mass * chamber_specific_heat)  # J/K
+
+# Chamber external surface area for radiation/convection (cylindrical + ends)
+bed_surface_area = 2.0 * np.pi * (chamber_radius + wall_thickness) * bed_length  # m^2 (cylindrical)
+bed_end_area = 2.0 * np.pi * (chamber_radius + wall_thickness)**2  # m^2 (two ends)
+total_surface_area = bed_surface_area + bed_end_area  # m^2
+
+# Heat loss coefficients: Q_rad = radiation_coefficient * (T^4 - T_amb^4),
+# Q_conv = convection_coefficient * (T - T_amb)
+radiation_coefficient = epsilon_chamber * sigma_SB * total_surface_area  # W/K^4
+convection_coefficient = h_convection * total_surface_area  # W/K
+
 
 # ============================================================================
 # THERMAL ANALYSIS
 # ============================================================================
 
+@dataclass
+class ThermalResult:
+    """Heater power and heat budget for a preheat to a target temperature."""
+    power_required: float   # W - heating + losses
+    power_heating: float    # W - heating only
+    Q_catalyst: float       # J
+    Q_chamber: float        # J
+    Q_total: float          # J
+    Q_loss: float           # J
+
+
 def calculate_heater_power(T_current, T_target, time_seconds):
     """
     Calculate required heater power to reach target temperature in specified time.
@@ -124,8 +151,8 @@ def calculate_heater_power(T_current, T_target, time_seconds):
     
     Returns:
     --------
-    float
-        Required heater power [W]
+    ThermalResult
+        Required heater power [W] and the heat budget terms [J]
     """
     # Temperature rise needed
     delta_T = T_target - T_current
@@ -143,18 +170,12 @@ def calculate_heater_power(T_current, T_target, time_seconds):
     # Simplified: average temperature during heating
     T_avg_K = (T_current + T_target) / 2.0
     
-    # Surface area for radiation/convection
-    # Chamber external surface area (cylindrical + ends)
-    bed_surface_area = 2.0 * np.pi * (chamber_radius + wall_thickness) * bed_length  # m^2 (cylindrical)
-    bed_end_area = 2.0 * np.pi * (chamber_radius + wall_thickness)**2  # m^2 (two ends)
-    total_surface_area = bed_surface_area + bed_end_area  # m^2
-    
     # Radiation losses (simplified - worst case)
     # Q_rad = epsilon * sigma * A * (T_avg^4 - T_ambient^4)
-    Q_rad_loss = epsilon_chamber * sigma_SB * total_surface_area * (T_avg_K**4 - T_ambient_K**4) * time_seconds  # J
+    Q_rad_loss = radiation_coefficient * (T_avg_K**4 - T_ambient_K**4) * time_seconds  # J
     
     # Convection losses (negligible in space, but included for completeness)
-    Q_conv_loss = h_convection * total_surface_area * (T_avg_K - T_ambient_K) * time_seconds  # J
+    Q_conv_loss = convection_coefficient * (T_avg_K - T_ambient_K) * time_seconds  # J
     
     # Total heat losses
     Q_loss = Q_rad_loss + Q_conv_loss  # J
@@ -162,7 +183,7 @@ def calculate_heater_power(T_current, T_target, time_seconds):
     # Power required including losses
     power_required = power_heating + (Q_loss / time_seconds)  # W
     
-    return power_required, power_heating, Q_total, Q_loss
+    return ThermalResult(power_required, power_heating, Q_catalyst, Q_chamber, Q_total, Q_loss)
 
 
 def calculate_heater_resistance(power, voltage):
@@ -189,6 +210,37 @@ def calculate_heater_resistance(power, voltage):
     return resistance, current
 
 
+@njit(cache=True, fastmath=True)
+def _simulate_preheat_kernel(T0, P, heat_cap, rad_coef, conv_coef, T_amb, dt, temperatures):
+    """
+    Exponential-Euler time march of the lumped preheat energy balance.
+    
+    The convective term is linear in T; the radiative T^4 term is linearised
+    about the previous temperature, giving a local loss conductance G and
+    equilibrium T_eq. Each step relaxes exactly towards T_eq, which keeps the
+    scheme stable and accurate for large time steps.
+    
+    Fills ``temperatures`` in place; all constants are passed as arguments so
+    the kernel can be compiled without referencing module globals.
+    """
+    T_amb2 = T_amb * T_amb
+    T_amb4 = T_amb2 * T_amb2
+    temperatures[0] = T0
+    for i in range(1, temperatures.shape[0]):
+        T_prev = temperatures[i-1]
+        T2 = T_prev * T_prev
+        
+        # Net heat flow at the previous temperature (heater - radiation - convection)
+        Q_net = P - rad_coef * (T2 * T2 - T_amb4) - conv_coef * (T_prev - T_amb)  # W
+        
+        # Linearised loss conductance dQ_loss/dT and local equilibrium
+        G = conv_coef + 4.0 * rad_coef * T2 * T_prev  # W/K
+        T_eq = T_prev + Q_net / G  # K
+        
+        # Exact relaxation towards T_eq over the step
+        temperatures[i] = T_eq + (T_prev - T_eq) * np.exp(-G * dt / heat_cap)
+
+
 def simulate_preheat(heater_power, time_step=10.0, max_time=3600.0):
     """
     Simulate preheat temperature rise over time with given heater power.
@@ -207,50 +259,28 @@ def simulate_preheat(heater_power, time_step=10.0, max_time=3600.0):
     dict
         Simulation results with temperature vs time data
     """
-    # Thermal mass of the system
-    # Effective heat capacity = m_catalyst * cp_catalyst + m_chamber * cp_chamber
-    effective_heat_capacity = (catalyst_mass * catalyst_specific_heat + 
-                               chamber_wall_mass * chamber_specific_heat)  # J/K
-    
-    # Surface area for heat loss
-    bed_surface_area = 2.0 * np.pi * (chamber_radius + wall_thickness) * bed_length  # m^2
-    bed_end_area = 2.0 * np.pi * (chamber_radius + wall_thickness)**2  # m^2
-    total_surface_area = bed_surface_area + bed_end_area  # m^2
-    
     # Time array
-    times = np.arange(0, max_time + time_step, time_step)
-    temperatures = np.zeros_like(times)
-    temperatures[0] = T_initial_K
-    
-    # Simulation loop
-    for i in range(1, len(times)):
-        T_prev = temperatures[i-1]
-        
-        # Heat input from heater
-        Q_in = heater_power * time_step  # J
-        
-        # Heat losses (radiation + convection)
-        Q_rad = epsilon_chamber * sigma_SB * total_surface_area * (T_prev**4 - T_ambient_K**4) * time_step  # J
-        Q_conv = h_convection * total_surface_area * (T_prev - T_ambient_K) * time_step  # J
-        Q_loss = Q_rad + Q_conv  # J
-        
-        # Net heat added
-        Q_net = Q_in - Q_loss  # J
-        
-        # Temperature change
-        delta_T = Q_net / effective_heat_capacity  # K
-        
-        # New temperature
-        temperatures[i] = T_prev + delta_T
+    # float32 storage: ~7 significant digits is far finer than the material
+    # property uncertainty, and halves the memory traffic of long runs. The
+    # march itself runs in float64 so round-off does not accumulate per step.
+    times = np.arange(0, max_time + time_step, time_step, dtype=np.float32)
+    history = np.empty(times.shape[0], dtype=np.float64)
+    
+    # Simulation loop (compiled)
+    _simulate_preheat_kernel(T_initial_K, heater_power, effective_heat_capacity,
+                             radiation_coefficient, convection_coefficient,
+                             T_ambient_K, time_step, history)
+    temperatures = history.astype(np.float32)
     
     # Find time to reach target temperatures
-    indices_min = np.where(temperatures >= T_target_min_K)[0]
-    indices_max = np.where(temperatures >= T_target_max_K)[0]
-    indices_design = np.where(temperatures >= T_target_design_K)[0]
+    # Temperature rises monotonically under constant heater power, so the
+    # first crossing can be located by binary search.
+    idx_min, idx_design, idx_max = np.searchsorted(
+        history, (T_target_min_K, T_target_design_K, T_target_max_K))
     
-    time_to_min = times[indices_min[0]] if len(indices_min) > 0 else None
-    time_to_max = times[indices_max[0]] if len(indices_max) > 0 else None
-    time_to_design = times[indices_design[0]] if len(indices_design) > 0 else None
+    time_to_min = times[idx_min] if idx_min < len(times) else None
+    time_to_max = times[idx_max] if idx_max < len(times) else None
+    time_to_design = times[idx_design] if idx_design < len(times) else None
     
     return {
         'times': times,
@@ -261,20 +291,132 @@ def simulate_preheat(heater_power, time_step=10.0, max_time=3600.0):
     }
 
 
+def sweep_preheat_design_space(heater_powers, wall_thicknesses, T_target=T_target_design_K,
+                               time_step=10.0, max_time=3600.0):
+    """
+    Time to reach a target temperature over a heater power x wall thickness grid.
+    
+    Uses the same exponential-Euler step as simulate_preheat, broadcast over the
+    full grid so each time step is a handful of 2-D array operations. Only the
+    current temperature field is kept, so memory is O(N_power * N_thickness).
+    
+    Parameters:
+    -----------
+    heater_powers : array_like
+        Heater powers to evaluate [W]
+    wall_thicknesses : array_like
+        Chamber wall thicknesses to evaluate [m]
+    T_target : float
+        Target temperature [K]
+    time_step : float
+        Simulation time step [s]
+    max_time : float
+        Maximum simulation time [s]
+    
+    Returns:
+    --------
+    numpy.ndarray
+        Time to reach T_target [s], shape (N_power, N_thickness); NaN where
+        the target is not reached within max_time
+    """
+    P = np.asarray(heater_powers, dtype=float)[:, None]  # W
+    t_wall = np.asarray(wall_thicknesses, dtype=float)[None, :]  # m
+    
+    # Wall-thickness dependent thermal mass and external surface area
+    outer_radius = chamber_radius + t_wall  # m
+    wall_mass = chamber_density * np.pi * (outer_radius**2 - chamber_radius**2) * bed_length  # kg
+    heat_cap = catalyst_mass * catalyst_specific_heat + wall_mass * chamber_specific_heat  # J/K
+    area = 2.0 * np.pi * outer_radius * bed_length + 2.0 * np.pi * outer_radius**2  # m^2
+    rad_coef = epsilon_chamber * sigma_SB * area  # W/K^4
+    conv_coef = h_convection * area  # W/K
+    T_amb4 = T_ambient_K**4
+    dt_over_C = time_step / heat_cap  # K/W
+    
+    T = np.full(np.broadcast(P, t_wall).shape, T_initial_K)
+    time_to_target = np.full(T.shape, np.nan)
+    
+    n_steps = int(round(max_time / time_step))
+    for i in range(1, n_steps + 1):
+        T2 = T * T
+        Q_net = P - rad_coef * (T2 * T2 - T_amb4) - conv_coef * (T - T_ambient_K)  # W
+        G = conv_coef + 4.0 * rad_coef * T2 * T  # W/K
+        
+        # T_new = T_eq + (T - T_eq) * exp(-G*dt/C), with T_eq - T = Q_net/G,
+        # applied in place so the temperature field is never reallocated
+        T -= Q_net / G * np.expm1(-G * dt_over_C)
+        
+        newly_reached = np.isnan(time_to_target) & (T >= T_target)
+        time_to_target[newly_reached] = i * time_step
+    
+    return time_to_target
+
+
+def build_figures(sim_results):
+    """
+    Render the DES-003 preheat curve into design/plots.
+    
+    Parameters:
+    -----------
+    sim_results : dict
+        Preheat simulation from simulate_preheat()
+    
+    Returns:
+    --------
+    list of Path
+        Paths of the generated figures
+    """
+    import matplotlib.pyplot as plt  # imported only when plotting
+    
+    # Plotting units, converted once
+    times_min = sim_results['times'] / 60.0
+    temps_C = K_to_C(sim_results['temperatures'])
+    
+    plot_dir = Path('design/plots')
+    plot_dir.mkdir(parents=True, exist_ok=True)
+    
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(times_min, temps_C, 'b-', linewidth=2, label='Bed Temperature')
+    
+    # Plot temperature range markers
+    ax.axhline(y=K_to_C(T_target_min_K), color='g', linestyle='--', linewidth=2, label=f'Range Min ({K_to_C(T_target_min_K):.0f}°C)')
+    ax.axhline(y=K_to_C(T_target_max_K), color='r', linestyle='--', linewidth=2, label=f'Range Max ({K_to_C(T_target_max_K):.0f}°C)')
+    ax.axhline(y=K_to_C(T_target_design_K), color='orange', linestyle=':', linewidth=2, label=f'Design Target ({K_to_C(T_target_design_K):.0f}°C)')
+    
+    # Plot time markers
+    if sim_results['time_to_min']:
+        ax.axvline(x=sim_results['time_to_min']/60, color='g', linestyle='--', alpha=0.5)
+    if sim_results['time_to_design']:
+        ax.axvline(x=sim_results['time_to_design']/60, color='orange', linestyle=':', alpha=0.5)
+    if sim_results['time_to_max']:
+        ax.axvline(x=sim_results['time_to_max']/60, color='r', linestyle='--', alpha=0.5)
+    
+    ax.set_xlabel('Preheat Time (minutes)', fontsize=12)
+    ax.set_ylabel('Temperature (°C)', fontsize=12)
+    ax.set_title('Catalyst Bed Preheat Curve (15W Heater)', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=10)
+    ax.set_xlim(0, max(times_min[-1], 20))
+    ax.set_ylim(0, max(temps_C[-1], K_to_C(T_target_max_K)) * 1.1)
+    
+    plt.tight_layout()
+    plot_path = plot_dir / 'DES003_preheat_curve.png'
+    plt.savefig(plot_path, dpi=150, bbox_inches='tight')
+    plt.close()
+    return [plot_path]
+
+
 # ============================================================================
 # MAIN CALCULATION
 # ============================================================================
 
-def main():
+def main(generate_plots=True):
     print("="*80)
     print("DES-003: Catalyst Preheat System Thermal Analysis")
     print("="*80)
     print()
     
     # Calculate required heater power for design target (initial estimate)
-    power_required_initial, power_heating_only, Q_total, Q_loss = calculate_heater_power(
-        T_initial_K, T_target_design_K, preheat_time_target
-    )
+    heat_budget = calculate_heater_power(T_initial_K, T_target_design_K, preheat_time_target)
     
     # Use 15W as the actual heater power (constraint from REQ-027)
     power_at_limit = power_limit
@@ -296,6 +438,11 @@ def main():
     # Define "reasonable" as 20 minutes (1200 seconds)
     time_compliance = sim_results['time_to_design'] <= 1200.0 if sim_results['time_to_design'] is not None else False
     
+    # Design space: heater power vs chamber wall thickness
+    sweep_powers = np.linspace(5.0, 15.0, 5)  # W
+    sweep_thicknesses = np.array([0.5e-3, 1.0e-3, 1.5e-3, 2.0e-3])  # m
+    sweep_times = sweep_preheat_design_space(sweep_powers, sweep_thicknesses)
+    
     # Print results
     print("GEOMETRY AND THERMAL MASS")
     print("-" * 80)
@@ -317,10 +464,10 @@ def main():
     print(f"Temperature range (REQ-014):   {K_to_C(T_target_min_K):.1f} - {K_to_C(T_target_max_K):.1f} °C")
     print(f"Temperature rise required:    {T_target_design_K - T_initial_K:.1f} K")
     print()
-    print(f"Heat required (catalyst):     {Q_catalyst if 'Q_catalyst' in locals() else catalyst_mass * catalyst_specific_heat * (T_target_design_K - T_initial_K):.2f} J")
-    print(f"Heat required (chamber):      {Q_chamber if 'Q_chamber' in locals() else chamber_wall_mass * chamber_specific_heat * (T_target_design_K - T_initial_K):.2f} J")
-    print(f"Total heat required:          {Q_total:.2f} J")
-    print(f"Heat losses (during preheat): {Q_loss:.2f} J")
+    print(f"Heat required (catalyst):     {heat_budget.Q_catalyst:.2f} J")
+    print(f"Heat required (chamber):      {heat_budget.Q_chamber:.2f} J")
+    print(f"Total heat required:          {heat_budget.Q_total:.2f} J")
+    print(f"Heat losses (during preheat): {heat_budget.Q_loss:.2f} J")
     print()
     
     print("HEATER DESIGN (POWER LIMITED: 15W)")
@@ -340,41 +487,22 @@ def main():
     print(f"Time to {K_to_C(T_target_max_K):.0f}°C:            {sim_results['time_to_max']:.1f} s ({sim_results['time_to_max']/60:.1f} min)" if sim_results['time_to_max'] else "Time to 300°C: NOT REACHED")
     print()
     
-    # Generate preheat curve plot
-    plot_dir = Path('design/plots')
-    plot_dir.mkdir(parents=True, exist_ok=True)
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(sim_results['times'] / 60.0, K_to_C(sim_results['temperatures']), 'b-', linewidth=2, label='Bed Temperature')
-    
-    # Plot temperature range markers
-    ax.axhline(y=K_to_C(T_target_min_K), color='g', linestyle='--', linewidth=2, label=f'Range Min ({K_to_C(T_target_min_K):.0f}°C)')
-    ax.axhline(y=K_to_C(T_target_max_K), color='r', linestyle='--', linewidth=2, label=f'Range Max ({K_to_C(T_target_max_K):.0f}°C)')
-    ax.axhline(y=K_to_C(T_target_design_K), color='orange', linestyle=':', linewidth=2, label=f'Design Target ({K_to_C(T_target_design_K):.0f}°C)')
-    
-    # Plot time markers
-    if sim_results['time_to_min']:
-        ax.axvline(x=sim_results['time_to_min']/60, color='g', linestyle='--', alpha=0.5)
-    if sim_results['time_to_design']:
-        ax.axvline(x=sim_results['time_to_design']/60, color='orange', linestyle=':', alpha=0.5)
-    if sim_results['time_to_max']:
-        ax.axvline(x=sim_results['time_to_max']/60, color='r', linestyle='--', alpha=0.5)
-    
-    ax.set_xlabel('Preheat Time (minutes)', fontsize=12)
-    ax.set_ylabel('Temperature (°C)', fontsize=12)
-    ax.set_title('Catalyst Bed Preheat Curve (15W Heater)', fontsize=14, fontweight='bold')
-    ax.grid(True, alpha=0.3)
-    ax.legend(fontsize=10)
-    ax.set_xlim(0, max(sim_results['times'][-1]/60, 20))
-    ax.set_ylim(0, max(K_to_C(sim_results['temperatures'])[-1], K_to_C(T_target_max_K)) * 1.1)
-    
-    plt.tight_layout()
-    plot_path = plot_dir / 'DES003_preheat_curve.png'
-    plt.savefig(plot_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Plot saved to: {plot_path}")
+    print(f"PREHEAT DESIGN SPACE (time to {K_to_C(T_target_design_K):.0f}°C, min)")
+    print("-" * 80)
+    print("Heater power    " + "".join(f"t_wall={t*1000:.1f}mm".rjust(16) for t in sweep_thicknesses))
+    for P, row in zip(sweep_powers, sweep_times):
+        print(f"{P:5.1f} W         " + "".join(("NOT REACHED" if np.isnan(t) else f"{t/60:.1f}").rjust(16) for t in row))
     print()
     
+    # Generate preheat curve plot (matplotlib imported only when needed)
+    if generate_plots:
+        import matplotlib
+        matplotlib.use('Agg')  # headless: PNG output only
+        plot_path, = build_figures(sim_results)
+        print(f"Plot saved to: {plot_path}")
+        print()
+        
+    
     # Prepare output data
     output_data = {
         "design_id": "DES-003",
@@ -401,10 +529,10 @@ def main():
         },
         "thermal_analysis": {
             "temperature_rise_K": T_target_design_K - T_initial_K,
-            "heat_required_J": Q_total,
-            "heat_losses_J": Q_loss,
-            "heat_required_catalyst_J": catalyst_mass * catalyst_specific_heat * (T_target_design_K - T_initial_K),
-            "heat_required_chamber_J": chamber_wall_mass * chamber_specific_heat * (T_target_design_K - T_initial_K)
+            "heat_required_J": heat_budget.Q_total,
+            "heat_losses_J": heat_budget.Q_loss,
+            "heat_required_catalyst_J": heat_budget.Q_catalyst,
+            "heat_required_chamber_J": heat_budget.Q_chamber
         },
         "heater_design": {
             "nominal_voltage_V": voltage_nominal,
@@ -413,12 +541,18 @@ def main():
             "heater_resistance_Ohm": resistance_at_limit,
             "heater_current_A": current_at_limit,
             "initial_preheat_time_target_s": preheat_time_target,
-            "actual_preheat_time_to_design_temp_s": float(actual_preheat_time_to_design) if actual_preheat_time_to_design else None
+            "actual_preheat_time_to_design_temp_s": actual_preheat_time_to_design if actual_preheat_time_to_design else None
         },
         "preheat_performance_at_limit": {
-            "time_to_min_temperature_s": float(sim_results['time_to_min']) if sim_results['time_to_min'] else None,
-            "time_to_design_temperature_s": float(sim_results['time_to_design']) if sim_results['time_to_design'] else None,
-            "time_to_max_temperature_s": float(sim_results['time_to_max']) if sim_results['time_to_max'] else None
+            "time_to_min_temperature_s": sim_results['time_to_min'] if sim_results['time_to_min'] else None,
+            "time_to_design_temperature_s": sim_results['time_to_design'] if sim_results['time_to_design'] else None,
+            "time_to_max_temperature_s": sim_results['time_to_max'] if sim_results['time_to_max'] else None
+        },
+        "preheat_design_space": {
+            "target_temperature_C": K_to_C(T_target_design_K),
+            "heater_power_W": sweep_powers.tolist(),
+            "wall_thickness_m": sweep_thicknesses.tolist(),
+            "time_to_target_s": [[None if np.isnan(t) else t for t in row] for row in sweep_times]
         },
         "requirements_compliance": {
             "REQ-014": {
@@ -464,8 +598,7 @@ def main():
     output_dir = Path('design/data')
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / 'catalyst_preheat_thermal.json'
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    write_json(output_path, output_data)
     print(f"Output data saved to: {output_path}")
     print()
     
@@ -493,4 +626,8 @@ def main():
 
 
 if __name__ == "__main__":
-    results = main()
+    parser = argparse.ArgumentParser(description="DES-003 catalyst preheat thermal analysis")
+    parser.add_argument("--no-plots", action="store_true",
+                        help="skip the preheat curve plot (JSON and report only)")
+    args = parser.parse_args()
+    results = main(generate_plots=not args.no_plots)
@@ -6,217 +6,355 @@ Generates plots for:
 1. Chamber stress analysis (hoop stress vs thickness)
 2. Material selection comparison
 3. Envelope visualization
+
+Run standalone, or through design/generate_all.py which calls
+build_figures() alongside the other design figure builders.
 """
 
-import json
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import hashlib
+import inspect
+import os
 import numpy as np
 from pathlib import Path
 
-# Load design data
-data_path = Path(__file__).parent.parent / "data" / "chamber_nozzle_stress.json"
-with open(data_path, 'r') as f:
-    data = json.load(f)
-
-# Extract key parameters
-chamber_radius_mm = data["chamber_geometry"]["chamber_radius_mm"]
-design_pressure_MPa = data["parameters"]["design_pressure_MPa"]
-design_thickness_mm = data["wall_thickness"]["design_thickness_mm"]
-material_yield_MPa = data["wall_thickness"]["material_yield_at_temp_MPa"]
-chamber_diameter_mm = data["chamber_geometry"]["chamber_diameter_mm"]
-chamber_length_mm = data["chamber_geometry"]["chamber_length_mm"]
-nozzle_length_mm = data["nozzle_properties"]["nozzle_length_mm"]
-nozzle_exit_diameter_mm = data["nozzle_properties"]["exit_diameter_mm"]
-overall_length_mm = data["overall_envelope"]["overall_length_mm"]
-overall_diameter_mm = data["overall_envelope"]["overall_diameter_mm"]
-throat_diameter_mm = data["nozzle_properties"]["exit_diameter_mm"] / 10  # Approx from geometry
-
-# Material data
-MATERIALS = {
-    "Inconel 625": {"yield": 460 * 0.4, "temp": 980, "density": 8440},
-    "Haynes 230": {"yield": 390 * 0.4, "temp": 1150, "density": 8970},
-    "Molybdenum": {"yield": 560 * 0.4, "temp": 1650, "density": 10220},
-    "Rhenium": {"yield": 290 * 0.4, "temp": 2000, "density": 21020},
-    "Columbium C103": {"yield": 240 * 0.4, "temp": 1370, "density": 8850}
+from _geometry_cache import load_geometry
+
+# Set DES004_NOPLOT=1 (e.g. in CI) to print the envelope findings without
+# importing matplotlib or rendering anything
+generate_plots = not os.environ.get("DES004_NOPLOT")
+if generate_plots:
+    import matplotlib
+    import matplotlib.patches as patches
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection, PathCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.figure import Figure
+    from matplotlib.path import Path as MplPath
+
+PLOTS_DIR = Path(__file__).parent.parent / "plots"
+
+# Style shared by all three figures; resolved once for the whole run
+PLOT_STYLE = {
+    "savefig.dpi": 150,
+    "font.family": "DejaVu Sans",
+    # Fixed text rendering state so glyph layouts are reused across figures
+    "text.hinting": "none",
+    "text.antialiased": True,
+    # Stable SVG element ids so regenerated vector output is reproducible
+    "svg.hashsalt": "DES-004",
 }
 
-# Operating temperature
-operating_temp_C = data["parameters"]["chamber_operating_temp_C"]
+# Material data (one record per material; columns are contiguous views)
+MATERIAL_NAMES = ["Inconel 625", "Haynes 230", "Molybdenum", "Rhenium", "Columbium C103"]
+MATERIALS = np.array([
+    (460 * 0.4, 980, 8440),
+    (390 * 0.4, 1150, 8970),
+    (560 * 0.4, 1650, 10220),
+    (290 * 0.4, 2000, 21020),
+    (240 * 0.4, 1370, 8850),
+], dtype=[("yield", "f8"), ("temp", "f8"), ("density", "f8")])
+
+# Envelope bounds (REQ-012)
+envelope_length = 150.0  # mm
+envelope_diameter = 100.0  # mm
+
+
+def _render(fig_builder, data, out_path, figsize=(12, 8), cache_key=None):
+    """
+    Build one figure on a standalone Agg canvas and write it to disk.
+    
+    When cache_key is given it is stored in a "<out_path>.sha" sidecar, and
+    the render is skipped if the existing output was made from the same key.
+    
+    Parameters:
+    -----------
+    fig_builder : callable
+        Function that draws the design data into the Figure it is passed
+    data : dict
+        DES-004 geometry from load_geometry()
+    out_path : Path
+        Output path; the suffix selects the format (.png or .svg)
+    figsize : tuple
+        Figure size in inches
+    cache_key : str, optional
+        Hash of the figure's inputs
+    """
+    sidecar = out_path.with_name(out_path.name + ".sha")
+    if cache_key is not None and out_path.exists():
+        try:
+            if sidecar.read_text().strip() == cache_key:
+                return
+        except OSError:
+            pass  # no sidecar yet - render
+    
+    fig = Figure(figsize=figsize, layout="constrained")
+    FigureCanvasAgg(fig)
+    fig_builder(fig, data)
+    if out_path.suffix == ".svg":
+        # Vector output skips the raster pass and PNG encode; drop the date stamp
+        fig.savefig(out_path, format="svg", metadata={"Date": None})
+    else:
+        fig.savefig(out_path, pil_kwargs={"compress_level": 1})
+    fig.clear()
+    
+    if cache_key is not None:
+        tmp = sidecar.with_name(sidecar.name + ".tmp")
+        tmp.write_text(cache_key + "\n")
+        os.replace(tmp, sidecar)
+
 
 # ============================================
 # Plot 1: Hoop Stress vs Wall Thickness
 # ============================================
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Left: Stress vs Thickness
-thickness_range = np.linspace(0.1, 1.0, 100)  # mm
-stress_values = []
-for t in thickness_range:
-    t_m = t / 1000
-    stress_Pa = (design_pressure_MPa * 1e6 * chamber_radius_mm / 1000) / t_m
-    stress_MPa = stress_Pa / 1e6
-    stress_values.append(stress_MPa)
-
-ax1.plot(thickness_range, stress_values, 'b-', linewidth=2, label='Hoop Stress')
-ax1.axhline(y=material_yield_MPa, color='r', linestyle='--', linewidth=2, label=f'Material Yield ({material_yield_MPa:.0f} MPa)')
-ax1.axvline(x=design_thickness_mm, color='g', linestyle=':', linewidth=2, label=f'Design Thickness ({design_thickness_mm:.3f} mm)')
-
-ax1.set_xlabel('Wall Thickness (mm)', fontsize=12)
-ax1.set_ylabel('Hoop Stress (MPa)', fontsize=12)
-ax1.set_title('Chamber Hoop Stress vs Wall Thickness', fontsize=14, fontweight='bold')
-ax1.grid(True, alpha=0.3)
-ax1.legend(fontsize=10)
-
-# Add safety factor annotation
-current_stress = (design_pressure_MPa * 1e6 * chamber_radius_mm / 1000) / (design_thickness_mm / 1000) / 1e6
-sf = material_yield_MPa / current_stress
-ax1.text(0.05, 0.95, f'Safety Factor: {sf:.1f}', transform=ax1.transAxes, 
-         fontsize=12, verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-
-# Right: Safety Factor vs Thickness
-sf_values = [material_yield_MPa / s for s in stress_values]
-ax2.plot(thickness_range, sf_values, 'b-', linewidth=2, label='Safety Factor')
-ax2.axhline(y=1.5, color='r', linestyle='--', linewidth=2, label='Required SF (1.5)')
-ax2.axvline(x=design_thickness_mm, color='g', linestyle=':', linewidth=2, label=f'Design Thickness ({design_thickness_mm:.3f} mm)')
-ax2.set_xlabel('Wall Thickness (mm)', fontsize=12)
-ax2.set_ylabel('Safety Factor', fontsize=12)
-ax2.set_title('Safety Factor vs Wall Thickness', fontsize=14, fontweight='bold')
-ax2.grid(True, alpha=0.3)
-ax2.legend(fontsize=10)
-ax2.set_ylim(0, max(sf_values) * 1.1)
-
-plt.tight_layout()
-plt.savefig(Path(__file__).parent.parent / "plots" / "DES004_stress_analysis.png", dpi=150, bbox_inches='tight')
-plt.close()
+def _stress_analysis(fig, data):
+    chamber_radius_mm = data["chamber_radius_mm"]
+    design_pressure_MPa = data["design_pressure_MPa"]
+    design_thickness_mm = data["design_thickness_mm"]
+    material_yield_MPa = data["material_yield_at_temp_MPa"]
+    
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    # Left: Stress vs Thickness
+    thickness_range = np.linspace(0.1, 1.0, 100)  # mm
+    stress_values = (design_pressure_MPa * 1e6 * chamber_radius_mm / 1000) / (thickness_range / 1000) / 1e6  # MPa
+    
+    ax1.plot(thickness_range, stress_values, 'b-', linewidth=2, label='Hoop Stress')
+    ax1.axhline(y=material_yield_MPa, color='r', linestyle='--', linewidth=2, label=f'Material Yield ({material_yield_MPa:.0f} MPa)')
+    ax1.axvline(x=design_thickness_mm, color='g', linestyle=':', linewidth=2, label=f'Design Thickness ({design_thickness_mm:.3f} mm)')
+    
+    ax1.set_xlabel('Wall Thickness (mm)', fontsize=12)
+    ax1.set_ylabel('Hoop Stress (MPa)', fontsize=12)
+    ax1.set_title('Chamber Hoop Stress vs Wall Thickness', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(fontsize=10)
+    
+    # Add safety factor annotation
+    current_stress = (design_pressure_MPa * 1e6 * chamber_radius_mm / 1000) / (design_thickness_mm / 1000) / 1e6
+    sf = material_yield_MPa / current_stress
+    ax1.text(0.05, 0.95, f'Safety Factor: {sf:.1f}', transform=ax1.transAxes,
+             fontsize=12, verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+    
+    # Right: Safety Factor vs Thickness
+    sf_values = material_yield_MPa / stress_values
+    ax2.plot(thickness_range, sf_values, 'b-', linewidth=2, label='Safety Factor')
+    ax2.axhline(y=1.5, color='r', linestyle='--', linewidth=2, label='Required SF (1.5)')
+    ax2.axvline(x=design_thickness_mm, color='g', linestyle=':', linewidth=2, label=f'Design Thickness ({design_thickness_mm:.3f} mm)')
+    ax2.set_xlabel('Wall Thickness (mm)', fontsize=12)
+    ax2.set_ylabel('Safety Factor', fontsize=12)
+    ax2.set_title('Safety Factor vs Wall Thickness', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend(fontsize=10)
+    ax2.set_ylim(0, max(sf_values) * 1.1)
+
 
 # ============================================
 # Plot 2: Material Selection Comparison
 # ============================================
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Prepare data
-materials = list(MATERIALS.keys())
-yields = [MATERIALS[m]["yield"] for m in materials]
-temps = [MATERIALS[m]["temp"] for m in materials]
-densities = [MATERIALS[m]["density"] for m in materials]
-colors = ['red' if temp < operating_temp_C else 'green' for temp in temps]
-
-# Left: Yield Strength
-bars1 = ax1.bar(materials, yields, color=colors, alpha=0.7, edgecolor='black')
-ax1.axhline(y=material_yield_MPa, color='blue', linestyle='--', linewidth=2, label=f'Selected ({material_yield_MPa:.0f} MPa)')
-ax1.set_ylabel('Yield Strength at 1127°C (MPa)', fontsize=12)
-ax1.set_title('Material Yield Strength Comparison', fontsize=14, fontweight='bold')
-ax1.grid(True, alpha=0.3, axis='y')
-ax1.legend(fontsize=10)
-ax1.tick_params(axis='x', rotation=45)
-
-# Add value labels on bars
-for bar, yield_val in zip(bars1, yields):
-    height = bar.get_height()
-    ax1.text(bar.get_x() + bar.get_width()/2., height,
-             f'{yield_val:.0f}',
-             ha='center', va='bottom', fontsize=9)
-
-# Right: Temperature Capability
-bars2 = ax2.bar(materials, temps, color=colors, alpha=0.7, edgecolor='black')
-ax2.axhline(y=operating_temp_C, color='orange', linestyle='--', linewidth=2, label=f'Operating Temp ({operating_temp_C:.0f}°C)')
-ax2.set_ylabel('Max Temperature Capability (°C)', fontsize=12)
-ax2.set_title('Material Temperature Capability', fontsize=14, fontweight='bold')
-ax2.grid(True, alpha=0.3, axis='y')
-ax2.legend(fontsize=10)
-ax2.tick_params(axis='x', rotation=45)
-
-# Add value labels on bars
-for bar, temp in zip(bars2, temps):
-    height = bar.get_height()
-    ax2.text(bar.get_x() + bar.get_width()/2., height,
-             f'{temp:.0f}',
-             ha='center', va='bottom', fontsize=9)
-
-plt.tight_layout()
-plt.savefig(Path(__file__).parent.parent / "plots" / "DES004_material_selection.png", dpi=150, bbox_inches='tight')
-plt.close()
+def _material_selection(fig, data):
+    material_yield_MPa = data["material_yield_at_temp_MPa"]
+    operating_temp_C = data["chamber_operating_temp_C"]
+    
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    # Prepare data
+    materials = MATERIAL_NAMES
+    yields = MATERIALS["yield"]
+    temps = MATERIALS["temp"]
+    colors = np.where(temps < operating_temp_C, 'red', 'green')
+    
+    # Left: Yield Strength
+    bars1 = ax1.bar(materials, yields, color=colors, alpha=0.7, edgecolor='black')
+    ax1.axhline(y=material_yield_MPa, color='blue', linestyle='--', linewidth=2, label=f'Selected ({material_yield_MPa:.0f} MPa)')
+    ax1.set_ylabel('Yield Strength at 1127°C (MPa)', fontsize=12)
+    ax1.set_title('Material Yield Strength Comparison', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3, axis='y')
+    ax1.legend(fontsize=10)
+    ax1.tick_params(axis='x', rotation=45)
+    
+    # Add value labels on bars
+    for bar, yield_val in zip(bars1, yields):
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                 f'{yield_val:.0f}',
+                 ha='center', va='bottom', fontsize=9)
+    
+    # Right: Temperature Capability
+    bars2 = ax2.bar(materials, temps, color=colors, alpha=0.7, edgecolor='black')
+    ax2.axhline(y=operating_temp_C, color='orange', linestyle='--', linewidth=2, label=f'Operating Temp ({operating_temp_C:.0f}°C)')
+    ax2.set_ylabel('Max Temperature Capability (°C)', fontsize=12)
+    ax2.set_title('Material Temperature Capability', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3, axis='y')
+    ax2.legend(fontsize=10)
+    ax2.tick_params(axis='x', rotation=45)
+    
+    # Add value labels on bars
+    for bar, temp in zip(bars2, temps):
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                 f'{temp:.0f}',
+                 ha='center', va='bottom', fontsize=9)
+
 
 # ============================================
 # Plot 3: Envelope Visualization
 # ============================================
-fig, ax = plt.subplots(figsize=(12, 8))
-
-# Envelope bounds (REQ-012)
-envelope_length = 150.0  # mm
-envelope_diameter = 100.0  # mm
-
-# Draw envelope rectangle
-envelope_rect = patches.Rectangle((0, -envelope_diameter/2), envelope_length, envelope_diameter,
-                                 linewidth=3, edgecolor='red', facecolor='none', linestyle='--',
-                                 label='Envelope Limit (150×100 mm)')
-ax.add_patch(envelope_rect)
-
-# Draw chamber (cylinder)
-chamber_x = 0
-chamber_rect = patches.Rectangle((chamber_x, -chamber_diameter_mm/2), chamber_length_mm, chamber_diameter_mm,
-                               linewidth=2, edgecolor='blue', facecolor='lightblue', alpha=0.5,
-                               label=f'Chamber (83.5×{chamber_diameter_mm:.1f} mm)')
-ax.add_patch(chamber_rect)
-
-# Draw nozzle (conical approximation)
-throat_x = chamber_length_mm
-throat_diameter = 7.48  # mm from DES-001
-nozzle_x = throat_x
-# Nozzle shape (trapezoid)
-nozzle_left = [throat_x, throat_x + nozzle_length_mm]
-nozzle_top = [throat_diameter/2, nozzle_exit_diameter_mm/2]
-nozzle_bottom = [-throat_diameter/2, -nozzle_exit_diameter_mm/2]
-
-# Fill nozzle
-ax.fill_between(nozzle_left, nozzle_bottom, nozzle_top, 
-                color='lightgreen', alpha=0.5, label=f'Nozzle ({nozzle_length_mm:.1f}×{nozzle_exit_diameter_mm:.1f} mm)')
-ax.plot(nozzle_left, nozzle_top, 'g-', linewidth=2)
-ax.plot(nozzle_left, nozzle_bottom, 'g-', linewidth=2)
-
-# Add overall dimensions
-ax.plot([0, overall_length_mm], [overall_diameter_mm/2 + 15, overall_diameter_mm/2 + 15], 
-        'k-', linewidth=2)
-ax.text(overall_length_mm/2, overall_diameter_mm/2 + 18, 
-        f'Overall Length: {overall_length_mm:.1f} mm', 
-        ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-ax.plot([-10, -10], [-overall_diameter_mm/2 - 15, overall_diameter_mm/2 + 15], 
-        'k-', linewidth=2)
-ax.text(-12, 0, f'Diameter: {overall_diameter_mm:.1f} mm', 
-        ha='right', va='center', fontsize=11, fontweight='bold', rotation=90)
-
-# Add envelope labels
-ax.text(envelope_length + 5, 0, f'Limit: {envelope_length} mm', 
-        ha='left', va='center', fontsize=10, color='red', fontweight='bold')
-ax.text(0, envelope_diameter/2 + 5, f'Limit: {envelope_diameter} mm', 
-        ha='left', va='bottom', fontsize=10, color='red', fontweight='bold')
-
-ax.set_xlabel('Length (mm)', fontsize=12)
-ax.set_ylabel('Diameter (mm)', fontsize=12)
-ax.set_title('Thruster Envelope: Design vs Requirement', fontsize=14, fontweight='bold')
-ax.set_xlim(-20, envelope_length + 20)
-ax.set_ylim(-envelope_diameter/2 - 20, envelope_diameter/2 + 30)
-ax.grid(True, alpha=0.3)
-ax.legend(fontsize=10, loc='lower right')
-ax.set_aspect('equal')
-
-plt.tight_layout()
-plt.savefig(Path(__file__).parent.parent / "plots" / "DES004_envelope.png", dpi=150, bbox_inches='tight')
-plt.close()
-
-print("=" * 80)
-print("DES-004 Design Visualizations Generated")
-print("=" * 80)
-print()
-print("Generated plots:")
-print(f"  1. design/plots/DES004_stress_analysis.png - Hoop stress and safety factor analysis")
-print(f"  2. design/plots/DES004_material_selection.png - Material comparison")
-print(f"  3. design/plots/DES004_envelope.png - Envelope visualization")
-print()
-print("Key findings from visualizations:")
-print(f"  - Design thickness (0.500 mm) provides safety factor of {data['wall_thickness']['actual_safety_factor']:.1f}")
-print(f"  - Molybdenum selected for temperature capability (1650°C vs 1127°C operating)")
-print(f"  - Overall length ({overall_length_mm:.1f} mm) exceeds envelope limit (150 mm)")
-print(f"  - Diameter ({overall_diameter_mm:.1f} mm) within envelope limit (100 mm)")
+def _envelope_key(data):
+    """Hash of the dimensions, style and drawing code the envelope figure depends on."""
+    drawing_code = "".join(inspect.getsource(func) for func in (_render, _envelope, _envelope_labels))
+    return hashlib.blake2b(repr((
+        data["chamber_length_mm"], data["chamber_diameter_mm"], data["throat_diameter_m"],
+        data["nozzle_length_mm"], data["nozzle_exit_diameter_mm"],
+        data["overall_length_mm"], data["overall_diameter_mm"],
+        envelope_length, envelope_diameter, sorted(PLOT_STYLE.items()),
+        matplotlib.__version__, drawing_code,
+    )).encode()).hexdigest()
+
+
+def _envelope_labels(data):
+    """Dimension and envelope-limit labels as (x, y, text, style) specs."""
+    overall_length_mm = data["overall_length_mm"]
+    overall_diameter_mm = data["overall_diameter_mm"]
+    
+    dim_style = dict(fontsize=11, fontweight='bold')
+    limit_style = dict(fontsize=10, color='red', fontweight='bold')
+    return [
+        (overall_length_mm/2, overall_diameter_mm/2 + 18, f'Overall Length: {overall_length_mm:.1f} mm',
+         dict(dim_style, ha='center', va='bottom')),
+        (-12, 0, f'Diameter: {overall_diameter_mm:.1f} mm',
+         dict(dim_style, ha='right', va='center', rotation=90)),
+        (envelope_length + 5, 0, f'Limit: {envelope_length} mm',
+         dict(limit_style, ha='left', va='center')),
+        (0, envelope_diameter/2 + 5, f'Limit: {envelope_diameter} mm',
+         dict(limit_style, ha='left', va='bottom')),
+    ]
+
+
+def _envelope(fig, data):
+    chamber_diameter_mm = data["chamber_diameter_mm"]
+    chamber_length_mm = data["chamber_length_mm"]
+    nozzle_length_mm = data["nozzle_length_mm"]
+    nozzle_exit_diameter_mm = data["nozzle_exit_diameter_mm"]
+    overall_length_mm = data["overall_length_mm"]
+    overall_diameter_mm = data["overall_diameter_mm"]
+    throat_diameter = data["throat_diameter_m"] * 1000  # mm, from DES-001
+    
+    # Label strings are formatted before any artist exists
+    labels = _envelope_labels(data)
+    
+    # Fixed view: set limits up front so adding artists triggers no autoscaling
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_autoscale_on(False)
+    ax.set_xlim(-20, envelope_length + 20)
+    ax.set_ylim(-envelope_diameter/2 - 20, envelope_diameter/2 + 30)
+    ax.set_aspect('equal', adjustable='box')
+    
+    # Static geometry: envelope, chamber and nozzle outlines as closed paths
+    throat_x = chamber_length_mm
+    nozzle_exit_x = throat_x + nozzle_length_mm
+    
+    envelope_path = MplPath(np.array([
+        [0, -envelope_diameter/2], [envelope_length, -envelope_diameter/2],
+        [envelope_length, envelope_diameter/2], [0, envelope_diameter/2], [0, -envelope_diameter/2]]), closed=True)
+    chamber_path = MplPath(np.array([
+        [0, -chamber_diameter_mm/2], [chamber_length_mm, -chamber_diameter_mm/2],
+        [chamber_length_mm, chamber_diameter_mm/2], [0, chamber_diameter_mm/2], [0, -chamber_diameter_mm/2]]), closed=True)
+    # Nozzle shape (conical approximation - trapezoid)
+    nozzle_path = MplPath(np.array([
+        [throat_x, -throat_diameter/2], [nozzle_exit_x, -nozzle_exit_diameter_mm/2],
+        [nozzle_exit_x, nozzle_exit_diameter_mm/2], [throat_x, throat_diameter/2], [throat_x, -throat_diameter/2]]), closed=True)
+    
+    envelope_style = dict(facecolor='none', edgecolor='red', linewidth=3, linestyle='--')
+    chamber_style = dict(facecolor=to_rgba('lightblue', 0.5), edgecolor=to_rgba('blue', 0.5), linewidth=2)
+    nozzle_style = dict(facecolor=to_rgba('lightgreen', 0.5), edgecolor='none', linewidth=0)
+    ax.add_collection(PathCollection(
+        [envelope_path, chamber_path, nozzle_path],
+        facecolors=[st['facecolor'] for st in (envelope_style, chamber_style, nozzle_style)],
+        edgecolors=[st['edgecolor'] for st in (envelope_style, chamber_style, nozzle_style)],
+        linewidths=[3, 2, 0],
+        linestyles=['--', '-', '-'],
+        zorder=1), autolim=False)
+    
+    # Nozzle wall edges and overall dimension lines as a single line batch
+    dim_y = overall_diameter_mm/2 + 15
+    ax.add_collection(LineCollection(np.array([
+        [[throat_x, throat_diameter/2], [nozzle_exit_x, nozzle_exit_diameter_mm/2]],
+        [[throat_x, -throat_diameter/2], [nozzle_exit_x, -nozzle_exit_diameter_mm/2]],
+        [[0, dim_y], [overall_length_mm, dim_y]],
+        [[-10, -dim_y], [-10, dim_y]],
+    ]), colors=['g', 'g', 'k', 'k'], linewidths=2, zorder=2), autolim=False)
+    
+    for x, y, text, style in labels:
+        ax.text(x, y, text, **style)
+    
+    ax.set_xlabel('Length (mm)', fontsize=12)
+    ax.set_ylabel('Diameter (mm)', fontsize=12)
+    ax.set_title('Thruster Envelope: Design vs Requirement', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    # Collections carry no per-path labels; legend entries come from proxy patches
+    ax.legend(handles=[
+        patches.Patch(**envelope_style, label='Envelope Limit (150×100 mm)'),
+        patches.Patch(**chamber_style, label=f'Chamber (83.5×{chamber_diameter_mm:.1f} mm)'),
+        patches.Patch(**nozzle_style, label=f'Nozzle ({nozzle_length_mm:.1f}×{nozzle_exit_diameter_mm:.1f} mm)'),
+    ], fontsize=10, loc='lower right')
+
+
+def build_figures(data):
+    """
+    Render the three DES-004 figures into design/plots.
+    
+    Parameters:
+    -----------
+    data : dict
+        DES-004 geometry from load_geometry()
+    
+    Returns:
+    --------
+    list of Path
+        Paths of the generated figures (empty when DES004_NOPLOT is set)
+    """
+    if not generate_plots:
+        return []  # matplotlib was never imported
+    outputs = [
+        PLOTS_DIR / "DES004_stress_analysis.png",
+        PLOTS_DIR / "DES004_material_selection.png",
+        PLOTS_DIR / "DES004_envelope.svg",
+    ]
+    with matplotlib.rc_context(PLOT_STYLE):
+        _render(_stress_analysis, data, outputs[0], figsize=(14, 5))
+        _render(_material_selection, data, outputs[1], figsize=(14, 5))
+        _render(_envelope, data, outputs[2], cache_key=_envelope_key(data))
+    return outputs
+
+
+def main():
+    """Generate the DES-004 figures and print the envelope findings."""
+    # Load design data (DES-004 geometry, cached from chamber_nozzle_stress.json)
+    data = load_geometry()
+    overall_length_mm = data["overall_length_mm"]
+    overall_diameter_mm = data["overall_diameter_mm"]
+    
+    if generate_plots:
+        build_figures(data)
+        
+        print("=" * 80)
+        print("DES-004 Design Visualizations Generated")
+        print("=" * 80)
+        print()
+        print("Generated plots:")
+        print(f"  1. design/plots/DES004_stress_analysis.png - Hoop stress and safety factor analysis")
+        print(f"  2. design/plots/DES004_material_selection.png - Material comparison")
+        print(f"  3. design/plots/DES004_envelope.svg - Envelope visualization")
+        print()
+    print("Key findings from visualizations:")
+    print(f"  - Design thickness (0.500 mm) provides safety factor of {data['actual_safety_factor']:.1f}")
+    print(f"  - Molybdenum selected for temperature capability (1650°C vs 1127°C operating)")
+    print(f"  - Overall length ({overall_length_mm:.1f} mm) exceeds envelope limit (150 mm)")
+    print(f"  - Diameter ({overall_diameter_mm:.1f} mm) within envelope limit (100 mm)")
+
+
+if __name__ == "__main__":
+    if generate_plots:
+        # Headless PNG/SVG output; set here rather than at import so that
+        # importers (generate_all.py, interactive sessions) keep their backend
+        matplotlib.use("Agg", force=True)
+    main()
@@ -24,67 +24,59 @@ Requirements Traced:
 - REQ-012: Envelope: 100 mm diameter × 150 mm length
 """
 
-import json
+import argparse
 import math
 import sys
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+from _optional_deps import load_json, njit, write_json
+
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
 # Physical constants (from CONTEXT.md)
 G0 = 9.80665  # m/s², standard gravitational acceleration (exact)
 PI = math.pi
 
 # Material properties (from CONTEXT.md Section 4)
 # All materials have heritage flight data (space-qualified)
-MATERIALS = {
-    "Inconel_625": {
-        "name": "Inconel 625",
-        "max_temp_C": 980.0,
-        "density_kg_m3": 8440.0,
-        "yield_strength_RTMpa": 460.0,
-        "hydrazine_compatible": True,
-        "heritage": "Excellent hydrazine compatibility"
-    },
-    "Inconel_718": {
-        "name": "Inconel 718",
-        "max_temp_C": 700.0,
-        "density_kg_m3": 8190.0,
-        "yield_strength_RTMpa": 1035.0,
-        "hydrazine_compatible": True,
-        "heritage": "Limited above 700°C"
-    },
-    "Haynes_230": {
-        "name": "Haynes 230",
-        "max_temp_C": 1150.0,
-        "density_kg_m3": 8970.0,
-        "yield_strength_RTMpa": 390.0,
-        "hydrazine_compatible": True,
-        "heritage": "Excellent high-temperature"
-    },
-    "Molybdenum": {
-        "name": "Molybdenum (Mo)",
-        "max_temp_C": 1650.0,
-        "density_kg_m3": 10220.0,
-        "yield_strength_RTMpa": 560.0,
-        "hydrazine_compatible": True,
-        "heritage": "Needs coating in oxidizing environment"
-    },
-    "Rhenium": {
-        "name": "Rhenium (Re)",
-        "max_temp_C": 2000.0,
-        "density_kg_m3": 21020.0,
-        "yield_strength_RTMpa": 290.0,
-        "hydrazine_compatible": True,
-        "heritage": "Excellent, expensive"
-    },
-    "Columbium_C103": {
-        "name": "Columbium C103 (Nb alloy)",
-        "max_temp_C": 1370.0,
-        "density_kg_m3": 8850.0,
-        "yield_strength_RTMpa": 240.0,
-        "hydrazine_compatible": True,
-        "heritage": "Heritage material for small thrusters"
-    }
-}
+# One record per material in a single structured array; per-property columns
+# are zero-copy field views, and the string fields live in parallel tuples
+MAT_DTYPE = np.dtype([
+    ("max_temp_C", "f8"),
+    ("density_kg_m3", "f8"),
+    ("yield_strength_RTMpa", "f8"),
+    ("hydrazine_compatible", "?"),
+])
+MAT_KEYS = ("Inconel_625", "Inconel_718", "Haynes_230", "Molybdenum", "Rhenium", "Columbium_C103")
+MAT_NAMES = ("Inconel 625", "Inconel 718", "Haynes 230", "Molybdenum (Mo)", "Rhenium (Re)", "Columbium C103 (Nb alloy)")
+MAT_HERITAGE = (
+    "Excellent hydrazine compatibility",
+    "Limited above 700°C",
+    "Excellent high-temperature",
+    "Needs coating in oxidizing environment",
+    "Excellent, expensive",
+    "Heritage material for small thrusters",
+)
+MATERIALS = np.array([
+    (980.0, 8440.0, 460.0, True),     # Inconel 625
+    (700.0, 8190.0, 1035.0, True),    # Inconel 718
+    (1150.0, 8970.0, 390.0, True),    # Haynes 230
+    (1650.0, 10220.0, 560.0, True),   # Molybdenum
+    (2000.0, 21020.0, 290.0, True),   # Rhenium
+    (1370.0, 8850.0, 240.0, True),    # Columbium C103
+], dtype=MAT_DTYPE)
+
+MAT_MAX_TEMP = MATERIALS["max_temp_C"]
+MAT_YIELD_RT = MATERIALS["yield_strength_RTMpa"]
+MAT_DENSITY = MATERIALS["density_kg_m3"]
+MAT_HYDRAZINE_OK = MATERIALS["hydrazine_compatible"]
 
 # Yield strength degradation at high temperature (simplified model)
 # At 1000°C, yield strength is typically 30-50% of RT value
@@ -101,65 +93,80 @@ ENVELOPE_LENGTH_mm = 150.0  # From REQ-012
 MIN_MANUFACTURABLE_THICKNESS_MM = 0.5  # Practical minimum for thin-wall vessels
 
 
+@lru_cache(maxsize=1)
 def load_des001_data():
-    """Load DES-001 thruster performance data"""
-    des001_path = Path(__file__).parent.parent / "data" / "thruster_performance_sizing.json"
-    with open(des001_path, 'r') as f:
-        return json.load(f)
+    """Load DES-001 thruster performance data (parsed once per process; treat as read-only)"""
+    des001_path = _DATA_DIR / "thruster_performance_sizing.json"
+    return load_json(des001_path)
 
 
-def select_material(materials_dict, chamber_temp_C, include_nozzle=False):
+def select_material(chamber_temp_C, include_nozzle=False):
     """
     Select material for chamber (and optionally nozzle) based on temperature requirements.
     
+    The strongest (highest RT yield) hydrazine-compatible material rated for
+    chamber_temp_C is chosen.
+    
+    Parameters:
+    -----------
+    chamber_temp_C : float
+        Chamber operating temperature (°C)
+    include_nozzle : bool
+        Nozzle uses the chamber material (kept for interface compatibility)
+    
     Returns:
         dict: Best material choice with justification
     """
-    # Filter materials that can handle chamber temperature
-    viable_materials = {
-        key: mat for key, mat in materials_dict.items()
-        if mat["max_temp_C"] >= chamber_temp_C and mat["hydrazine_compatible"]
-    }
-    
-    if not viable_materials:
+    viable = (MAT_MAX_TEMP >= chamber_temp_C) & MAT_HYDRAZINE_OK
+    if not viable.any():
         raise ValueError(f"No material found for chamber temperature {chamber_temp_C}°C")
     
     # Rank by yield strength (higher is better for structural requirements)
-    sorted_materials = sorted(
-        viable_materials.items(),
-        key=lambda x: x[1]["yield_strength_RTMpa"],
-        reverse=True
-    )
-    
-    best_material_key, best_material = sorted_materials[0]
-    
-    # Calculate effective yield strength at operating temperature
-    effective_yield = best_material["yield_strength_RTMpa"] * TEMP_DEGRADATION_FACTOR
+    idx = int(np.argmax(np.where(viable, MAT_YIELD_RT, -np.inf)))
+    yield_RT = float(MAT_YIELD_RT[idx])
     
     result = {
-        "material_key": best_material_key,
-        "material_name": best_material["name"],
-        "max_temp_C": best_material["max_temp_C"],
-        "density_kg_m3": best_material["density_kg_m3"],
-        "yield_strength_RTMpa": best_material["yield_strength_RTMpa"],
-        "effective_yield_op_temp_MPa": effective_yield,
-        "hydrazine_compatible": best_material["hydrazine_compatible"],
-        "heritage": best_material["heritage"],
-        "rejected_materials": [
-            {
-                "name": mat["name"],
-                "reason": f"Max temp {mat['max_temp_C']}°C < required {chamber_temp_C}°C"
-                if mat["max_temp_C"] < chamber_temp_C
-                else "Lower yield strength"
-            }
-            for key, mat in materials_dict.items()
-            if key != best_material_key and mat["hydrazine_compatible"]
-        ]
+        "material_key": MAT_KEYS[idx],
+        "material_name": MAT_NAMES[idx],
+        "max_temp_C": float(MAT_MAX_TEMP[idx]),
+        "density_kg_m3": float(MAT_DENSITY[idx]),
+        "yield_strength_RTMpa": yield_RT,
+        # Effective yield strength at operating temperature
+        "effective_yield_op_temp_MPa": yield_RT * TEMP_DEGRADATION_FACTOR,
+        "hydrazine_compatible": bool(MAT_HYDRAZINE_OK[idx]),
+        "heritage": MAT_HERITAGE[idx],
     }
     
     return result
 
 
+def explain_rejected(chamber_temp_C, chosen_key):
+    """
+    Yield the hydrazine-compatible materials that were not selected, and why.
+    
+    Parameters:
+    -----------
+    chamber_temp_C : float
+        Chamber operating temperature used for the selection (°C)
+    chosen_key : str
+        material_key returned by select_material
+    
+    Yields:
+    -------
+    dict
+        {"name": ..., "reason": ...} for each rejected material
+    """
+    for i in np.flatnonzero(MAT_HYDRAZINE_OK):
+        if MAT_KEYS[i] == chosen_key:
+            continue
+        yield {
+            "name": MAT_NAMES[i],
+            "reason": f"Max temp {MAT_MAX_TEMP[i]}°C < required {chamber_temp_C}°C"
+            if MAT_MAX_TEMP[i] < chamber_temp_C
+            else "Lower yield strength"
+        }
+
+
 def calculate_chamber_geometry(des001_data, chamber_radius_mm):
     """
     Calculate chamber dimensions based on throat area and contraction ratio.
@@ -197,64 +204,88 @@ def calculate_chamber_geometry(des001_data, chamber_radius_mm):
     }
 
 
-def calculate_wall_thickness(design_pressure_Pa, chamber_radius_m, material_yield_MPa, safety_factor):
+@njit(cache=True)
+def _wall_thickness_kernel(P, SF, r, sigma_y_MPa, t_min_mm):
     """
-    Calculate minimum wall thickness using thin-wall pressure vessel theory.
+    Thin-wall sizing arithmetic for calculate_wall_thickness.
     
-    From CONTEXT.md Section 9:
-    - Hoop stress: sigma_hoop = Pc * r / t
-    - Required thickness: t_min = (Pc * SF * r) / sigma_yield_at_temp
+    Returns (required_thickness_mm, design_thickness_mm, actual_safety_factor,
+    actual_hoop_stress_MPa, stress_margin_percent) as plain floats.
     """
-    # Convert pressure to Pa and yield strength to Pa
-    design_pressure_Pa = float(design_pressure_Pa)
-    material_yield_Pa = material_yield_MPa * 1e6
+    material_yield_Pa = sigma_y_MPa * 1e6
     
     # Calculate required thickness
-    required_thickness_m = (design_pressure_Pa * safety_factor * chamber_radius_m) / material_yield_Pa
+    required_thickness_m = (P * SF * r) / material_yield_Pa
     required_thickness_mm = required_thickness_m * 1000
     
     # Apply manufacturability constraint
-    design_thickness_mm = max(required_thickness_mm, MIN_MANUFACTURABLE_THICKNESS_MM)
+    design_thickness_mm = max(required_thickness_mm, t_min_mm)
     design_thickness_m = design_thickness_mm / 1000
     
     # Calculate actual safety factor with design thickness
-    actual_safety_factor = (design_thickness_m * material_yield_Pa) / (design_pressure_Pa * chamber_radius_m)
+    actual_safety_factor = (design_thickness_m * material_yield_Pa) / (P * r)
     
     # Calculate actual hoop stress
-    actual_hoop_stress_Pa = (design_pressure_Pa * chamber_radius_m) / design_thickness_m
+    actual_hoop_stress_Pa = (P * r) / design_thickness_m
     actual_hoop_stress_MPa = actual_hoop_stress_Pa / 1e6
     
+    stress_margin_percent = ((sigma_y_MPa - actual_hoop_stress_MPa) / sigma_y_MPa) * 100
+    return (required_thickness_mm, design_thickness_mm, actual_safety_factor,
+            actual_hoop_stress_MPa, stress_margin_percent)
+
+
+def calculate_wall_thickness(design_pressure_Pa, chamber_radius_m, material_yield_MPa, safety_factor):
+    """
+    Calculate minimum wall thickness using thin-wall pressure vessel theory.
+    
+    From CONTEXT.md Section 9:
+    - Hoop stress: sigma_hoop = Pc * r / t
+    - Required thickness: t_min = (Pc * SF * r) / sigma_yield_at_temp
+    """
+    (required_thickness_mm, design_thickness_mm, actual_safety_factor,
+     actual_hoop_stress_MPa, stress_margin_percent) = _wall_thickness_kernel(
+        float(design_pressure_Pa), float(safety_factor), float(chamber_radius_m),
+        float(material_yield_MPa), MIN_MANUFACTURABLE_THICKNESS_MM
+    )
+    
     return {
         "required_thickness_mm": required_thickness_mm,
         "design_thickness_mm": design_thickness_mm,
-        "required_thickness_m": required_thickness_m,
-        "design_thickness_m": design_thickness_m,
+        "required_thickness_m": required_thickness_mm / 1000,
+        "design_thickness_m": design_thickness_mm / 1000,
         "actual_safety_factor": actual_safety_factor,
         "actual_hoop_stress_MPa": actual_hoop_stress_MPa,
         "material_yield_at_temp_MPa": material_yield_MPa,
-        "stress_margin_percent": ((material_yield_MPa - actual_hoop_stress_MPa) / material_yield_MPa) * 100
+        "stress_margin_percent": stress_margin_percent
     }
 
 
-def calculate_chamber_mass(chamber_geometry, thickness_mm, density_kg_m3):
-    """
-    Calculate chamber mass using cylindrical shell volume.
-    """
-    chamber_radius_m = chamber_geometry["chamber_radius_mm"] / 1000
-    chamber_length_m = chamber_geometry["chamber_length_m"]
-    thickness_m = thickness_mm / 1000
-    
+@njit(cache=True)
+def _chamber_mass_kernel(r_m, L_m, t_m, rho):
+    """Shell volume and mass for calculate_chamber_mass; returns (volume_m3, mass_kg)."""
     # Outer dimensions
-    outer_radius = chamber_radius_m + thickness_m
+    outer_radius = r_m + t_m
     
     # Cylindrical shell volume (including end caps - simplified as cylinder)
-    volume_m3 = PI * (outer_radius**2 - chamber_radius_m**2) * chamber_length_m
+    volume_m3 = math.pi * (outer_radius**2 - r_m**2) * L_m
     
     # Add approximated mass for end caps (hemispherical)
-    end_cap_volume = (4/3) * PI * (outer_radius**3 - chamber_radius_m**3)
+    end_cap_volume = (4/3) * math.pi * (outer_radius**3 - r_m**3)
     total_volume_m3 = volume_m3 + end_cap_volume
     
-    mass_kg = total_volume_m3 * density_kg_m3
+    return total_volume_m3, total_volume_m3 * rho
+
+
+def calculate_chamber_mass(chamber_geometry, thickness_mm, density_kg_m3):
+    """
+    Calculate chamber mass using cylindrical shell volume.
+    """
+    total_volume_m3, mass_kg = _chamber_mass_kernel(
+        chamber_geometry["chamber_radius_mm"] / 1000,
+        float(chamber_geometry["chamber_length_m"]),
+        thickness_mm / 1000,
+        float(density_kg_m3)
+    )
     
     return {
         "volume_m3": total_volume_m3,
@@ -262,6 +293,93 @@ def calculate_chamber_mass(chamber_geometry, thickness_mm, density_kg_m3):
     }
 
 
+# Plain NumPy form of each numexpr expression used by the sweeps, keyed by
+# the expression string, for when numexpr is not installed
+_NUMPY_EXPRESSIONS = {
+    "P * SF * r / (sigma_MPa * 1e6) * 1000":
+        lambda P, SF, r, sigma_MPa, **_: P * SF * r / (sigma_MPa * 1e6) * 1000,
+    "t * sigma_MPa * 1e6 / (P * r)":
+        lambda t, sigma_MPa, P, r, **_: t * sigma_MPa * 1e6 / (P * r),
+    "P * r / t / 1e6":
+        lambda P, r, t, **_: P * r / t / 1e6,
+    "rho * (pi * ((r + t)**2 - r**2) * L + (4.0 / 3.0) * pi * ((r + t)**3 - r**3))":
+        lambda rho, pi, r, t, L, **_: rho * (pi * ((r + t)**2 - r**2) * L + (4.0 / 3.0) * pi * ((r + t)**3 - r**3)),
+}
+
+
+def _evaluate(expression, local_dict):
+    """Evaluate an elementwise arithmetic expression with numexpr (NumPy if it is not installed)."""
+    if ne is not None:
+        return ne.evaluate(expression, local_dict=local_dict)
+    return _NUMPY_EXPRESSIONS[expression](**local_dict)
+
+
+def sweep_wall_thickness(P, SF, r, sigma_MPa):
+    """
+    Vectorized calculate_wall_thickness for design sweeps.
+    
+    Inputs broadcast against each other, so e.g. a grid of chamber radii
+    against materials and safety factors can be sized in one call.
+    
+    Parameters:
+    -----------
+    P : float or array
+        Design pressure (Pa)
+    SF : float or array
+        Safety factor
+    r : float or array
+        Chamber inner radius (m)
+    sigma_MPa : float or array
+        Material yield strength at operating temperature (MPa)
+    
+    Returns:
+    --------
+    dict
+        Arrays of required/design thickness (mm), actual safety factor and
+        actual hoop stress (MPa)
+    """
+    P, SF, r, sigma_MPa = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (P, SF, r, sigma_MPa)))
+    local_dict = {"P": P, "SF": SF, "r": r, "sigma_MPa": sigma_MPa}
+    
+    required_thickness_mm = _evaluate("P * SF * r / (sigma_MPa * 1e6) * 1000", local_dict)
+    design_thickness_mm = np.maximum(required_thickness_mm, MIN_MANUFACTURABLE_THICKNESS_MM)
+    local_dict["t"] = design_thickness_mm / 1000
+    
+    return {
+        "required_thickness_mm": required_thickness_mm,
+        "design_thickness_mm": design_thickness_mm,
+        "actual_safety_factor": _evaluate("t * sigma_MPa * 1e6 / (P * r)", local_dict),
+        "actual_hoop_stress_MPa": _evaluate("P * r / t / 1e6", local_dict),
+    }
+
+
+def sweep_chamber_mass(r, t, L, rho):
+    """
+    Vectorized calculate_chamber_mass (cylindrical shell + hemispherical end caps).
+    
+    Parameters:
+    -----------
+    r : float or array
+        Chamber inner radius (m)
+    t : float or array
+        Wall thickness (m)
+    L : float or array
+        Chamber length (m)
+    rho : float or array
+        Material density (kg/m³)
+    
+    Returns:
+    --------
+    array
+        Chamber mass (kg)
+    """
+    r, t, L, rho = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (r, t, L, rho)))
+    return _evaluate(
+        "rho * (pi * ((r + t)**2 - r**2) * L + (4.0 / 3.0) * pi * ((r + t)**3 - r**3))",
+        {"r": r, "t": t, "L": L, "rho": rho, "pi": PI}
+    )
+
+
 def calculate_nozzle_properties(des001_data):
     """
     Calculate nozzle properties and verify temperature constraints.
@@ -328,108 +446,131 @@ def check_envelope_constraints(chamber_diameter_mm, chamber_length_mm, nozzle_di
     }
 
 
-def main():
-    print("=" * 80)
-    print("DES-004: Chamber and Nozzle Structural Sizing")
-    print("=" * 80)
-    print()
+def main(quiet=False, audit=False):
+    """
+    Run the DES-004 sizing, write chamber_nozzle_stress.json and report.
+    
+    The report is collected into a list of lines and written to stdout in a
+    single call at the end.
+    
+    Parameters:
+    -----------
+    quiet : bool
+        If True, skip the console report (JSON output is still written)
+    audit : bool
+        If True, also report why each other material was rejected
+    
+    Returns:
+    --------
+    int
+        0 if every requirement passes, 1 otherwise
+    """
+    out = []
+    out.append("=" * 80)
+    out.append("DES-004: Chamber and Nozzle Structural Sizing")
+    out.append("=" * 80)
+    out.append("")
     
     # Load DES-001 data
-    print("Loading DES-001 thruster performance data...")
+    out.append("Loading DES-001 thruster performance data...")
     des001_data = load_des001_data()
     chamber_pressure_MPa = des001_data["parameters"]["chamber_pressure_MPa"]
     chamber_temperature_K = des001_data["parameters"]["chamber_temperature_K"]
     chamber_temperature_C = chamber_temperature_K - 273.15
     throat_diameter_mm = des001_data["computed_results"]["throat_diameter_mm"]
     
-    print(f"  Chamber pressure: {chamber_pressure_MPa:.2f} MPa")
-    print(f"  Chamber temperature: {chamber_temperature_C:.1f}°C")
-    print(f"  Throat diameter: {throat_diameter_mm:.2f} mm")
-    print()
+    out.append(f"  Chamber pressure: {chamber_pressure_MPa:.2f} MPa")
+    out.append(f"  Chamber temperature: {chamber_temperature_C:.1f}°C")
+    out.append(f"  Throat diameter: {throat_diameter_mm:.2f} mm")
+    out.append("")
     
     # Step 1: Material selection
-    print("Step 1: Material Selection")
-    print("-" * 80)
-    material_selection = select_material(MATERIALS, chamber_temperature_C)
-    print(f"Selected material: {material_selection['material_name']}")
-    print(f"  Max temperature: {material_selection['max_temp_C']}°C (required: {chamber_temperature_C:.1f}°C)")
-    print(f"  Density: {material_selection['density_kg_m3']} kg/m³")
-    print(f"  RT yield strength: {material_selection['yield_strength_RTMpa']} MPa")
-    print(f"  Effective yield at {chamber_temperature_C:.0f}°C: {material_selection['effective_yield_op_temp_MPa']:.1f} MPa")
-    print(f"  Heritage: {material_selection['heritage']}")
-    print()
+    out.append("Step 1: Material Selection")
+    out.append("-" * 80)
+    material_selection = select_material(chamber_temperature_C)
+    out.append(f"Selected material: {material_selection['material_name']}")
+    out.append(f"  Max temperature: {material_selection['max_temp_C']}°C (required: {chamber_temperature_C:.1f}°C)")
+    out.append(f"  Density: {material_selection['density_kg_m3']} kg/m³")
+    out.append(f"  RT yield strength: {material_selection['yield_strength_RTMpa']} MPa")
+    out.append(f"  Effective yield at {chamber_temperature_C:.0f}°C: {material_selection['effective_yield_op_temp_MPa']:.1f} MPa")
+    out.append(f"  Heritage: {material_selection['heritage']}")
+    if audit:
+        out.append("  Rejected materials:")
+        for rejected in explain_rejected(chamber_temperature_C, material_selection['material_key']):
+            out.append(f"    - {rejected['name']}: {rejected['reason']}")
+    out.append("")
     
     # Step 2: Chamber geometry sizing
-    print("Step 2: Chamber Geometry Sizing")
-    print("-" * 80)
+    out.append("Step 2: Chamber Geometry Sizing")
+    out.append("-" * 80)
     # Initial chamber diameter guess: 3x throat diameter (typical contraction ratio)
     chamber_radius_mm = (throat_diameter_mm * 3) / 2
     chamber_geometry = calculate_chamber_geometry(des001_data, chamber_radius_mm)
     
-    print(f"Chamber dimensions:")
-    print(f"  Chamber diameter: {chamber_geometry['chamber_diameter_mm']:.1f} mm")
-    print(f"  Chamber radius: {chamber_geometry['chamber_radius_mm']:.1f} mm")
-    print(f"  Chamber length: {chamber_geometry['chamber_length_mm']:.1f} mm")
-    print(f"  Contraction ratio (Dc/Dt): {chamber_geometry['contraction_ratio']:.1f}")
-    print(f"  Characteristic length (L*): {chamber_geometry['L_star_m']:.2f} m")
-    print()
+    out.append(f"Chamber dimensions:")
+    out.append(f"  Chamber diameter: {chamber_geometry['chamber_diameter_mm']:.1f} mm")
+    out.append(f"  Chamber radius: {chamber_geometry['chamber_radius_mm']:.1f} mm")
+    out.append(f"  Chamber length: {chamber_geometry['chamber_length_mm']:.1f} mm")
+    out.append(f"  Contraction ratio (Dc/Dt): {chamber_geometry['contraction_ratio']:.1f}")
+    out.append(f"  Characteristic length (L*): {chamber_geometry['L_star_m']:.2f} m")
+    out.append("")
     
     # Step 3: Wall thickness calculation
-    print("Step 3: Wall Thickness Calculation")
-    print("-" * 80)
+    out.append("Step 3: Wall Thickness Calculation")
+    out.append("-" * 80)
     # Design pressure: MEOP × safety factor (from REQ-018)
     design_pressure_MPa = MEOP_MPa * SAFETY_FACTOR
     design_pressure_Pa = design_pressure_MPa * 1e6
     chamber_radius_m = chamber_geometry["chamber_radius_mm"] / 1000
     material_yield_MPa = material_selection["effective_yield_op_temp_MPa"]
     
-    print(f"Pressure vessel design:")
-    print(f"  MEOP: {MEOP_MPa:.2f} MPa")
-    print(f"  Safety factor: {SAFETY_FACTOR}")
-    print(f"  Design pressure: {design_pressure_MPa:.2f} MPa")
-    print()
+    out.append(f"Pressure vessel design:")
+    out.append(f"  MEOP: {MEOP_MPa:.2f} MPa")
+    out.append(f"  Safety factor: {SAFETY_FACTOR}")
+    out.append(f"  Design pressure: {design_pressure_MPa:.2f} MPa")
+    out.append("")
     
     wall_thickness = calculate_wall_thickness(
         design_pressure_Pa, chamber_radius_m, material_yield_MPa, SAFETY_FACTOR
     )
     
-    print(f"Wall thickness analysis:")
-    print(f"  Required thickness (structural): {wall_thickness['required_thickness_mm']:.4f} mm")
-    print(f"  Minimum manufacturable thickness: {MIN_MANUFACTURABLE_THICKNESS_MM} mm")
-    print(f"  Design thickness: {wall_thickness['design_thickness_mm']:.3f} mm")
-    print(f"  Actual safety factor: {wall_thickness['actual_safety_factor']:.2f}")
-    print(f"  Actual hoop stress: {wall_thickness['actual_hoop_stress_MPa']:.2f} MPa")
-    print(f"  Material yield at temp: {wall_thickness['material_yield_at_temp_MPa']:.1f} MPa")
-    print(f"  Stress margin: {wall_thickness['stress_margin_percent']:.1f}%")
-    print()
+    out.append(f"Wall thickness analysis:")
+    out.append(f"  Required thickness (structural): {wall_thickness['required_thickness_mm']:.4f} mm")
+    out.append(f"  Minimum manufacturable thickness: {MIN_MANUFACTURABLE_THICKNESS_MM} mm")
+    out.append(f"  Design thickness: {wall_thickness['design_thickness_mm']:.3f} mm")
+    out.append(f"  Actual safety factor: {wall_thickness['actual_safety_factor']:.2f}")
+    out.append(f"  Actual hoop stress: {wall_thickness['actual_hoop_stress_MPa']:.2f} MPa")
+    out.append(f"  Material yield at temp: {wall_thickness['material_yield_at_temp_MPa']:.1f} MPa")
+    out.append(f"  Stress margin: {wall_thickness['stress_margin_percent']:.1f}%")
+    out.append("")
     
     # Step 4: Chamber mass calculation
-    print("Step 4: Chamber Mass Calculation")
-    print("-" * 80)
+    out.append("Step 4: Chamber Mass Calculation")
+    out.append("-" * 80)
     mass_calc = calculate_chamber_mass(
         chamber_geometry, wall_thickness['design_thickness_mm'], material_selection['density_kg_m3']
     )
     
-    print(f"Chamber mass:")
-    print(f"  Volume: {mass_calc['volume_m3']:.9f} m³")
-    print(f"  Mass: {mass_calc['mass_kg']:.6f} kg")
-    print()
+    out.append(f"Chamber mass:")
+    out.append(f"  Volume: {mass_calc['volume_m3']:.9f} m³")
+    out.append(f"  Mass: {mass_calc['mass_kg']:.6f} kg")
+    out.append("")
     
     # Step 5: Mass budget verification
-    print("Step 5: Mass Budget Verification (REQ-011)")
-    print("-" * 80)
+    out.append("Step 5: Mass Budget Verification (REQ-011)")
+    out.append("-" * 80)
     mass_budget = check_mass_budget(mass_calc['mass_kg'])
     
-    print(f"Mass budget analysis:")
-    print(f"  Chamber mass: {mass_budget['chamber_mass_kg']:.6f} kg")
-    print(f"  Budget limit: {mass_budget['mass_budget_kg']:.3f} kg")
-    print(f"  Mass check: {'PASS' if mass_budget['mass_check'] else 'FAIL'}")
-    print(f"  Mass margin: {mass_budget['mass_margin_kg']:.6f} kg ({mass_budget['mass_margin_percent']:.2f}%)")
-    print()
+    out.append(f"Mass budget analysis:")
+    out.append(f"  Chamber mass: {mass_budget['chamber_mass_kg']:.6f} kg")
+    out.append(f"  Budget limit: {mass_budget['mass_budget_kg']:.3f} kg")
+    out.append(f"  Mass check: {'PASS' if mass_budget['mass_check'] else 'FAIL'}")
+    out.append(f"  Mass margin: {mass_budget['mass_margin_kg']:.6f} kg ({mass_budget['mass_margin_percent']:.2f}%)")
+    out.append("")
     
     # Step 6: Envelope verification
-    print("Step 6: Envelope Verification (REQ-012)")
-    print("-" * 80)
+    out.append("Step 6: Envelope Verification (REQ-012)")
+    out.append("-" * 80)
     nozzle_props = calculate_nozzle_properties(des001_data)
     envelope_check = check_envelope_constraints(
         chamber_geometry['chamber_diameter_mm'],
@@ -438,43 +579,43 @@ def main():
         nozzle_props['nozzle_length_mm']
     )
     
-    print(f"Overall envelope:")
-    print(f"  Overall diameter: {envelope_check['overall_diameter_mm']:.1f} mm (limit: {ENVELOPE_DIAMETER_mm} mm)")
-    print(f"  Overall length: {envelope_check['overall_length_mm']:.1f} mm (limit: {ENVELOPE_LENGTH_mm} mm)")
-    print(f"  Diameter check: {'PASS' if envelope_check['diameter_check'] else 'FAIL'}")
-    print(f"  Length check: {'PASS' if envelope_check['length_check'] else 'FAIL'}")
-    print(f"  Diameter margin: {envelope_check['diameter_margin_mm']:.1f} mm")
-    print(f"  Length margin: {envelope_check['length_margin_mm']:.1f} mm")
-    print()
+    out.append(f"Overall envelope:")
+    out.append(f"  Overall diameter: {envelope_check['overall_diameter_mm']:.1f} mm (limit: {ENVELOPE_DIAMETER_mm} mm)")
+    out.append(f"  Overall length: {envelope_check['overall_length_mm']:.1f} mm (limit: {ENVELOPE_LENGTH_mm} mm)")
+    out.append(f"  Diameter check: {'PASS' if envelope_check['diameter_check'] else 'FAIL'}")
+    out.append(f"  Length check: {'PASS' if envelope_check['length_check'] else 'FAIL'}")
+    out.append(f"  Diameter margin: {envelope_check['diameter_margin_mm']:.1f} mm")
+    out.append(f"  Length margin: {envelope_check['length_margin_mm']:.1f} mm")
+    out.append("")
     
     # Step 7: Temperature verification
-    print("Step 7: Temperature Constraint Verification")
-    print("-" * 80)
-    print(f"Chamber wall temperature (REQ-015):")
-    print(f"  Operating temperature: {chamber_temperature_C:.1f}°C")
-    print(f"  Maximum allowed: {CHAMBER_MAX_TEMP_C}°C")
-    print(f"  Check: {'PASS' if chamber_temperature_C <= CHAMBER_MAX_TEMP_C else 'FAIL'}")
-    print(f"  Margin: {CHAMBER_MAX_TEMP_C - chamber_temperature_C:.1f}°C")
-    print()
-    
-    print(f"Nozzle exit temperature (REQ-016):")
-    print(f"  Exit temperature: {nozzle_props['exit_temperature_C']:.1f}°C")
-    print(f"  Maximum allowed: {NOZZLE_MAX_TEMP_C}°C")
-    print(f"  Check: {'PASS' if nozzle_props['temp_constraint_check'] else 'FAIL'}")
-    print(f"  Margin: {nozzle_props['temp_margin_C']:.1f}°C")
-    print()
+    out.append("Step 7: Temperature Constraint Verification")
+    out.append("-" * 80)
+    out.append(f"Chamber wall temperature (REQ-015):")
+    out.append(f"  Operating temperature: {chamber_temperature_C:.1f}°C")
+    out.append(f"  Maximum allowed: {CHAMBER_MAX_TEMP_C}°C")
+    out.append(f"  Check: {'PASS' if chamber_temperature_C <= CHAMBER_MAX_TEMP_C else 'FAIL'}")
+    out.append(f"  Margin: {CHAMBER_MAX_TEMP_C - chamber_temperature_C:.1f}°C")
+    out.append("")
+    
+    out.append(f"Nozzle exit temperature (REQ-016):")
+    out.append(f"  Exit temperature: {nozzle_props['exit_temperature_C']:.1f}°C")
+    out.append(f"  Maximum allowed: {NOZZLE_MAX_TEMP_C}°C")
+    out.append(f"  Check: {'PASS' if nozzle_props['temp_constraint_check'] else 'FAIL'}")
+    out.append(f"  Margin: {nozzle_props['temp_margin_C']:.1f}°C")
+    out.append("")
     
     # Step 8: Material requirements verification
-    print("Step 8: Material Requirements Verification")
-    print("-" * 80)
-    print(f"Chamber material (REQ-023, REQ-024):")
-    print(f"  Selected: {material_selection['material_name']}")
-    print(f"  Hydrazine compatible: {'Yes' if material_selection['hydrazine_compatible'] else 'No'}")
-    print(f"  Max temp capability: {material_selection['max_temp_C']}°C")
-    print(f"  Operating temperature: {chamber_temperature_C:.1f}°C")
-    print(f"  Refractory/high-temp: {'Yes' if material_selection['max_temp_C'] >= 1400 else 'No'}")
-    print(f"  Check: {'PASS' if material_selection['max_temp_C'] >= 1400 else 'FAIL'}")
-    print()
+    out.append("Step 8: Material Requirements Verification")
+    out.append("-" * 80)
+    out.append(f"Chamber material (REQ-023, REQ-024):")
+    out.append(f"  Selected: {material_selection['material_name']}")
+    out.append(f"  Hydrazine compatible: {'Yes' if material_selection['hydrazine_compatible'] else 'No'}")
+    out.append(f"  Max temp capability: {material_selection['max_temp_C']}°C")
+    out.append(f"  Operating temperature: {chamber_temperature_C:.1f}°C")
+    out.append(f"  Refractory/high-temp: {'Yes' if material_selection['max_temp_C'] >= 1400 else 'No'}")
+    out.append(f"  Check: {'PASS' if material_selection['max_temp_C'] >= 1400 else 'FAIL'}")
+    out.append("")
     
     # Prepare output data
     output_data = {
@@ -594,38 +735,37 @@ def main():
     }
     
     # Print requirements compliance summary
-    print("=" * 80)
-    print("REQUIREMENTS COMPLIANCE SUMMARY")
-    print("=" * 80)
+    out.append("=" * 80)
+    out.append("REQUIREMENTS COMPLIANCE SUMMARY")
+    out.append("=" * 80)
     
     for req_id, req_data in output_data["requirements_compliance"].items():
         status_symbol = "✓" if req_data["status"] == "PASS" else "✗"
-        print(f"\n{status_symbol} {req_id}: {req_data['description']}")
-        print(f"   Status: {req_data['status']}")
+        out.append(f"\n{status_symbol} {req_id}: {req_data['description']}")
+        out.append(f"   Status: {req_data['status']}")
         
         if "threshold_min" in req_data:
-            print(f"   Requirement: ≥ {req_data['threshold_min']}")
-            print(f"   Computed: {req_data['computed']:.4f}")
+            out.append(f"   Requirement: ≥ {req_data['threshold_min']}")
+            out.append(f"   Computed: {req_data['computed']:.4f}")
         elif "threshold_max" in req_data:
-            print(f"   Requirement: ≤ {req_data['threshold_max']}")
-            print(f"   Computed: {req_data['computed']:.4f}")
+            out.append(f"   Requirement: ≤ {req_data['threshold_max']}")
+            out.append(f"   Computed: {req_data['computed']:.4f}")
         else:
-            print(f"   Requirement: {req_data.get('description', 'N/A')}")
+            out.append(f"   Requirement: {req_data.get('description', 'N/A')}")
         
         if "margin_percent" in req_data:
-            print(f"   Margin: {req_data['margin_percent']:.2f}%")
+            out.append(f"   Margin: {req_data['margin_percent']:.2f}%")
         if "margin_C" in req_data:
-            print(f"   Margin: {req_data['margin_C']:.1f}°C")
+            out.append(f"   Margin: {req_data['margin_C']:.1f}°C")
     
-    print()
-    print("=" * 80)
+    out.append("")
+    out.append("=" * 80)
     
     # Output JSON file
-    output_path = Path(__file__).parent.parent / "data" / "chamber_nozzle_stress.json"
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    output_path = _DATA_DIR / "chamber_nozzle_stress.json"
+    write_json(output_path, output_data)
     
-    print(f"\nDesign data written to: {output_path}")
+    out.append(f"\nDesign data written to: {output_path}")
     
     # Check for any failures
     failures = [
@@ -634,12 +774,22 @@ def main():
     ]
     
     if failures:
-        print(f"\n⚠ WARNING: {len(failures)} requirement(s) not met: {', '.join(failures)}")
-        return 1
+        out.append(f"\n⚠ WARNING: {len(failures)} requirement(s) not met: {', '.join(failures)}")
+        status = 1
     else:
-        print("\n✓ All requirements satisfied!")
-        return 0
+        out.append("\n✓ All requirements satisfied!")
+        status = 0
+    
+    if not quiet:
+        sys.stdout.write("\n".join(out) + "\n")
+    return status
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    parser = argparse.ArgumentParser(description="DES-004 chamber and nozzle structural sizing")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Skip the console report (for batch runs); JSON output is still written")
+    parser.add_argument("--audit", action="store_true",
+                        help="Also report why each non-selected material was rejected")
+    args = parser.parse_args()
+    sys.exit(main(quiet=args.quiet, audit=args.audit))
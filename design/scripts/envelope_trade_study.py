@@ -8,11 +8,13 @@ Analyzes three options for resolving the envelope length constraint:
 - Option C: Requirement Relaxation
 """
 
+import math
 import numpy as np
-import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any
 
+from _optional_deps import njit, write_json
+
 # Constants from CONTEXT.md
 g0 = 9.80665  # m/s^2
 
@@ -41,19 +43,35 @@ current_exit_diameter = 74.8  # mm
 # Isentropic expansion relationships
 gamma = 1.28  # specific heat ratio for hydrazine decomposition products
 
+# Expansion ratio -> Isp break-points (from isentropic relationships):
+# 330 s at 50:1 up to the DES-001 410.08 s at 100:1
+_ISP_XP = np.array([50.0, 60.0, 80.0, 100.0])
+_ISP_FP = np.array([330.0, 350.0, 385.0, 410.08])
+
+# Derived constants, evaluated once at import
+_TAN_ALPHA_DEFAULT = math.tan(math.radians(15.0))  # default cone half-angle
+_C_STAR = 37076.4  # m/s, c_star from DES-001
+_PC_COEFF = _C_STAR / (throat_area * g0)  # Pc = F * _PC_COEFF / Isp
+_FEED_PC_COEFF = 0.70 * 1e6  # Pc limit per MPa of feed pressure (70%, MPa -> Pa)
+
 
 def compute_nozzle_geometry(expansion_ratio: float, half_angle_deg: float = 15.0) -> Dict[str, Any]:
     """
     Compute nozzle geometry for a given expansion ratio.
+    
+    Scalar path (math module); use compute_nozzle_geometries for arrays.
     """
     # Exit diameter from expansion ratio
     # Ae/At = (De/Dt)^2, so De = Dt * sqrt(expansion_ratio)
-    exit_diameter = throat_diameter * np.sqrt(expansion_ratio)
-    exit_diameter_m = throat_diameter_m * np.sqrt(expansion_ratio)
+    exit_diameter = throat_diameter * math.sqrt(expansion_ratio)
+    exit_diameter_m = throat_diameter_m * math.sqrt(expansion_ratio)
     
     # Nozzle length (conical)
-    alpha_rad = np.radians(half_angle_deg)
-    nozzle_length = (exit_diameter/2 - throat_diameter/2) / np.tan(alpha_rad)
+    if half_angle_deg == 15.0:
+        tan_alpha = _TAN_ALPHA_DEFAULT
+    else:
+        tan_alpha = math.tan(math.radians(half_angle_deg))
+    nozzle_length = (exit_diameter/2 - throat_diameter/2) / tan_alpha
     
     # Bell nozzle length (80% of conical)
     bell_length = 0.80 * nozzle_length
@@ -70,84 +88,108 @@ def compute_nozzle_geometry(expansion_ratio: float, half_angle_deg: float = 15.0
     }
 
 
-def estimate_isp_for_expansion_ratio(expansion_ratio: float) -> float:
+def compute_nozzle_geometries(expansion_ratios: np.ndarray, half_angle_deg: float = 15.0) -> Dict[str, np.ndarray]:
     """
-    Estimate Isp for a given expansion ratio using empirical relationship.
+    Compute nozzle geometry for an array of expansion ratios in one pass.
     
-    For hydrazine monopropellant, Isp scales roughly with:
-    Isp ~ Isp_theoretical * (1 - divergence_loss) * (1 - boundary_layer_loss)
-    
-    The ideal Isp depends on expansion ratio through the nozzle efficiency.
+    Batched form of compute_nozzle_geometry: every entry of the returned dict
+    is an array aligned with expansion_ratios.
     """
-    # Base Isp at 100:1 expansion (from DES-001)
-    base_isp = 410.08  # s at 100:1
+    expansion_ratios = np.asarray(expansion_ratios, dtype=float)
     
-    # Nozzle efficiency factor based on expansion ratio
-    # Higher expansion ratio -> higher Isp, but with diminishing returns
-    # Approximate relationship: eta ~ 1 - k/(expansion_ratio)^n
+    # Exit diameter from expansion ratio: De = Dt * sqrt(Ae/At)
+    sqrt_ratio = np.sqrt(expansion_ratios)
+    exit_diameter = throat_diameter * sqrt_ratio
     
-    # For conical nozzles at 15°, divergence loss is ~1.7% (lambda = 0.983)
-    divergence_loss_factor = 0.983
+    # Conical nozzle length (cone angle is shared, so tan is taken once)
+    tan_alpha = _TAN_ALPHA_DEFAULT if half_angle_deg == 15.0 else np.tan(np.radians(half_angle_deg))
+    nozzle_length = (exit_diameter/2 - throat_diameter/2) / tan_alpha
     
-    # Expansion efficiency (simplified model)
-    # At 100:1, expansion is nearly optimal. At lower ratios, Isp drops.
-    # This is an approximation for hydrazine decomposition products
+    # Bell nozzle length (80% of conical)
+    bell_length = 0.80 * nozzle_length
     
+    return {
+        'expansion_ratio': expansion_ratios,
+        'exit_diameter_mm': exit_diameter,
+        'exit_diameter_m': throat_diameter_m * sqrt_ratio,
+        'nozzle_length_conical_mm': nozzle_length,
+        'nozzle_length_bell_mm': bell_length,
+        'overall_length_conical_mm': chamber_length + nozzle_length,
+        'overall_length_bell_mm': chamber_length + bell_length,
+        'exit_diameter_conical_mm': exit_diameter
+    }
+
+
+@njit(cache=True, fastmath=True)
+def _isp_kernel(expansion_ratio, base_isp=410.08, divergence_loss_factor=0.983):
+    """
+    Scalar Isp model behind estimate_isp_for_expansion_ratio.
+    
+    base_isp is the DES-001 Isp at 100:1; for conical nozzles at 15°,
+    divergence loss is ~1.7% (lambda = 0.983).
+    """
+    # Expansion efficiency (simplified model)
+    # At 100:1, expansion is nearly optimal. At lower ratios, Isp drops;
+    # Isp_ratio = (1 - (Pe/Pc)^((gamma-1)/gamma))^(1/2) with Pe/Pc set by
+    # the area ratio. Over our range this is approximated by linear
+    # interpolation through _ISP_XP/_ISP_FP, held flat below 50:1.
     if expansion_ratio >= 100:
         expansion_efficiency = 1.0
     else:
-        # Simplified model: Isp scales roughly with the square root of the
-        # pressure ratio, which is related to expansion ratio
-        # Isp_ratio = (1 - (Pe/Pc)^((gamma-1)/gamma))^(1/2)
-        # where Pe/Pc is determined by expansion ratio via area ratio
-        
-        # Approximate relationship for our range (50:1 to 100:1)
-        # Isp at 100:1 = 410 s
-        # Isp at 50:1 ≈ 330 s (from isentropic relationships)
-        
-        # Linear interpolation between known points (simplified)
-        if expansion_ratio <= 50:
-            target_isp = 330.0
-        elif expansion_ratio <= 60:
-            target_isp = 330.0 + (expansion_ratio - 50) * (350.0 - 330.0) / 10
-        elif expansion_ratio <= 80:
-            target_isp = 350.0 + (expansion_ratio - 60) * (385.0 - 350.0) / 20
-        else:  # 80-100
-            target_isp = 385.0 + (expansion_ratio - 80) * (410.08 - 385.0) / 20
-        
-        expansion_efficiency = target_isp / base_isp
+        expansion_efficiency = np.interp(expansion_ratio, _ISP_XP, _ISP_FP) / base_isp
     
     return base_isp * divergence_loss_factor * expansion_efficiency
 
 
-def calculate_chamber_pressure_for_thrust(isp_target: float, thrust_target: float) -> float:
+@njit(cache=True, fastmath=True)
+def _isp_array_kernel(expansion_ratios):
+    """Element-wise _isp_kernel over a 1-D float64 array."""
+    isp = np.empty_like(expansion_ratios)
+    for i in range(expansion_ratios.size):
+        isp[i] = _isp_kernel(expansion_ratios[i])
+    return isp
+
+
+def estimate_isp_for_expansion_ratio(expansion_ratio):
+    """
+    Estimate Isp for a given expansion ratio using empirical relationship.
+    
+    For hydrazine monopropellant, Isp scales roughly with:
+    Isp ~ Isp_theoretical * (1 - divergence_loss) * (1 - boundary_layer_loss)
+    
+    The ideal Isp depends on expansion ratio through the nozzle efficiency.
+    Accepts a scalar (returns float) or an array of expansion ratios.
+    """
+    if np.ndim(expansion_ratio) == 0:
+        return float(_isp_kernel(float(expansion_ratio)))
+    
+    ratios = np.asarray(expansion_ratio, dtype=np.float64)
+    return _isp_array_kernel(ratios.ravel()).reshape(ratios.shape)
+
+
+@njit(cache=True, fastmath=True)
+def calculate_chamber_pressure_for_thrust(isp_target, thrust_target, pc_coeff=_PC_COEFF):
     """
     Calculate required chamber pressure to achieve target thrust at given Isp.
     
+    isp_target may be an array (one required Pc per entry).
+    
     F = Isp * mdot * g0
     mdot = (Pc * At) / c_star
     F = Isp * (Pc * At) / c_star * g0
     Pc = F * c_star / (Isp * At * g0)
     """
-    # c_star from DES-001
-    c_star = 37076.4  # m/s
-    
-    # Throat area (constant)
-    At = throat_area
-    
-    # Calculate required chamber pressure
-    Pc = thrust_target * c_star / (isp_target * At * g0)
-    
-    return Pc  # Pa
+    return thrust_target * pc_coeff / isp_target  # Pa
 
 
-def check_pressure_limit(Pc_Pa: float, feed_pressure: float) -> tuple:
+@njit(cache=True, fastmath=True)
+def check_pressure_limit(Pc_Pa, feed_pressure, feed_pc_coeff=_FEED_PC_COEFF):
     """
     Check if chamber pressure is within feed pressure limit.
     Returns (within_limit, ratio)
     """
     # Typical pressure drop: chamber pressure is ~70% of feed pressure
-    max_chamber_pressure = 0.70 * feed_pressure * 1e6  # Convert MPa to Pa
+    max_chamber_pressure = feed_pc_coeff * feed_pressure  # Pa
     
     within_limit = Pc_Pa <= max_chamber_pressure
     ratio = Pc_Pa / max_chamber_pressure
@@ -155,20 +197,21 @@ def check_pressure_limit(Pc_Pa: float, feed_pressure: float) -> tuple:
     return (within_limit, ratio)
 
 
-def estimate_thrust_for_expansion_ratio(expansion_ratio: float) -> float:
+@njit(cache=True, fastmath=True)
+def estimate_thrust_for_expansion_ratio(expansion_ratio, mass_flow=baseline_mass_flow, g=g0):
     """
     Estimate thrust for a given expansion ratio.
     
     For constant chamber pressure, thrust depends on exit area and exit pressure.
     At constant mdot, thrust is proportional to Isp.
     """
-    isp = estimate_isp_for_expansion_ratio(expansion_ratio)
+    isp = _isp_kernel(expansion_ratio)
     
     # At constant mass flow rate, thrust is proportional to Isp
     # F = Isp * mdot * g0
     # mdot is constant (chamber pressure and throat area unchanged)
     
-    thrust = isp * baseline_mass_flow * g0
+    thrust = isp * mass_flow * g
     
     return thrust
 
@@ -195,262 +238,200 @@ class TradeStudyOption:
     meets_isp_req: bool
 
 
+# Decimal places each TradeStudyOption figure is reported to (JSON and summary)
+OPTION_DECIMALS = {
+    'overall_length_mm': 1,
+    'thrust_N': 3,
+    'specific_impulse_s': 2,
+    'chamber_pressure_MPa': 3,
+    'diameter_mm': 1,
+    'length_reduction_mm': 1,
+    'isp_reduction_percent': 1,
+}
+
+# Geometry scenarios evaluated by the study, one row each (column layout, so
+# main() can hand whole columns to the batched design equations). Row 0 is
+# the 100:1 conical baseline, reported as Option C (keep it, relax REQ-012).
+SCENARIOS = np.array([
+    (100.0, False, "Option C: Requirement Relaxation",
+     "Relax REQ-012 length limit from 150 mm to 210 mm"),
+    (100.0, True, "Option A: Bell Nozzle Redesign",
+     "Replace conical nozzle with Rao-optimized bell nozzle (15° initial, 8° final)"),
+    (60.0, False, "Option B1: Reduced Expansion Ratio (60:1, conical)",
+     "Reduce expansion ratio from 100:1 to 60:1 with conical nozzle, increase chamber pressure to maintain thrust"),
+    (80.0, False, "Option B2: Reduced Expansion Ratio (80:1, conical)",
+     "Reduce expansion ratio from 100:1 to 80:1 with conical nozzle, increase chamber pressure to maintain thrust"),
+    (60.0, True, "Option B3: Reduced Expansion Ratio (60:1, bell)",
+     "Reduce expansion ratio to 60:1 AND use bell nozzle, increase chamber pressure to maintain thrust"),
+    (50.0, True, "Option B4: Reduced Expansion Ratio (50:1, bell)",
+     "Reduce expansion ratio to 50:1 with bell nozzle for margin, increase chamber pressure to maintain thrust"),
+], dtype=[('ratio', 'f8'), ('is_bell', '?'), ('name', 'U64'), ('desc', 'U256')])
+
+# (pros, cons) per SCENARIOS row, parallel to the table above
+SCENARIO_PROS_CONS = [
+    ([
+        "Maintains full performance (410 s Isp)",
+        "No design changes required",
+        "Maximizes mission life with highest Isp",
+        "Simplest implementation path"
+    ], [
+        "Requires requirements owner approval (Agent 1)",
+        "Longer thruster affects spacecraft integration",
+        "Potential impact on spacecraft layout",
+        "Vehicle integration constraints must be verified"
+    ]),
+    ([
+        "Maintains 100:1 expansion ratio and 410 s Isp",
+        "~20% length reduction (125.6 → 100 mm)",
+        "Proven heritage in spacecraft thrusters",
+        "Minimal performance impact",
+        "Higher nozzle efficiency (lower divergence losses)"
+    ], [
+        "Still exceeds 150 mm requirement (184 mm)",
+        "Higher manufacturing complexity",
+        "More difficult to fabricate than conical",
+        "Additional tooling costs"
+    ]),
+    ([
+        "Maintains 1.0 N thrust requirement",
+        "Significant length reduction",
+        "Simple conical nozzle (easy to manufacture)",
+        "Isp = 344 s (56% margin above 220 s requirement)"
+    ], [
+        "Still exceeds 150 mm (178 mm)",
+        "Requires chamber pressure exceeding feed limit (0.25 MPa > 0.21 MPa max)",
+        "Isp reduced from 410 s to 344 s (16% reduction)",
+        "Not feasible with current feed system pressure"
+    ]),
+    ([
+        "Maintains 1.0 N thrust requirement",
+        "Balanced approach - moderate performance reduction",
+        "Isp = 378 s (72% margin)",
+        "Simple conical nozzle"
+    ], [
+        "Still exceeds 150 mm (194 mm, longer than 100:1!)",
+        "Requires chamber pressure exceeding feed limit (0.228 MPa > 0.21 MPa max)",
+        "Isp reduced from 410 s to 378 s (8% reduction)",
+        "Not feasible with current feed system pressure"
+    ]),
+    ([
+        "Maintains 1.0 N thrust requirement",
+        "Length = 159 mm (close to 150 mm requirement)",
+        "Isp = 344 s (56% margin)",
+        "Reduced divergence losses from bell nozzle"
+    ], [
+        "Still exceeds 150 mm (159 mm, 8.8 mm overage)",
+        "Requires chamber pressure exceeding feed limit (0.25 MPa > 0.21 MPa max)",
+        "Isp reduced from 410 s to 344 s (16% reduction)",
+        "Higher manufacturing complexity (bell nozzle)",
+        "Not feasible with current feed system pressure"
+    ]),
+    ([
+        "Maintains 1.0 N thrust requirement",
+        "Length = 151 mm (1.3 mm over 150 mm requirement)",
+        "Isp = 324 s (47% margin)",
+        "Significant manufacturing tolerance allowance"
+    ], [
+        "Still exceeds 150 mm (151 mm)",
+        "Requires chamber pressure exceeding feed limit (0.265 MPa > 0.21 MPa max)",
+        "Largest Isp reduction (21% to 324 s)",
+        "Higher propellant consumption",
+        "Not feasible with current feed system pressure"
+    ]),
+]
+
+
 def main():
     """Perform the trade study analysis."""
     
-    # Current baseline geometry
-    baseline_geometry = compute_nozzle_geometry(100.0)
-    baseline_length = baseline_geometry['overall_length_conical_mm']
+    ratios = SCENARIOS['ratio']
+    nozzle_is_bell = SCENARIOS['is_bell']
+    names = SCENARIOS['name'].tolist()
+    descriptions = SCENARIOS['desc'].tolist()
     
-    # Option A: Bell Nozzle Redesign (maintains 100:1 expansion ratio)
-    opt_a_geom = compute_nozzle_geometry(100.0)
-    length_a = opt_a_geom['overall_length_bell_mm']
+    # Geometry -> Isp -> required chamber pressure -> feed-pressure check,
+    # each evaluated for all scenarios at once
+    geometries = compute_nozzle_geometries(ratios)
+    overall = np.where(nozzle_is_bell, geometries['overall_length_bell_mm'], geometries['overall_length_conical_mm'])
+    exit_diameters = geometries['exit_diameter_mm']
+    isps = estimate_isp_for_expansion_ratio(ratios)
     
-    # Option B1: Reduced Expansion Ratio to 60:1 (conical)
-    opt_b1_geom = compute_nozzle_geometry(60.0)
-    length_b1 = opt_b1_geom['overall_length_conical_mm']
-    
-    # Option B2: Reduced Expansion Ratio to 80:1 (conical)
-    opt_b2_geom = compute_nozzle_geometry(80.0)
-    length_b2 = opt_b2_geom['overall_length_conical_mm']
+    # Required chamber pressure to maintain 1.0 N thrust (REQ-001)
+    thrust_target = 1.0
+    pcs = calculate_chamber_pressure_for_thrust(isps, thrust_target)
     
-    # Option B3: Reduced Expansion Ratio to 60:1 with bell nozzle
-    opt_b3_geom = compute_nozzle_geometry(60.0)
-    length_b3 = opt_b3_geom['overall_length_bell_mm']
+    # Check if chamber pressures are within feed pressure limits
+    # Feed pressure: 0.3 MPa (maximum per requirements)
+    feed_pressure = 0.3  # MPa
+    within_limit, pressure_ratio = check_pressure_limit(pcs, feed_pressure)
     
-    # Option B4: Reduced Expansion Ratio to 50:1 with bell nozzle
-    opt_b4_geom = compute_nozzle_geometry(50.0)
-    length_b4 = opt_b4_geom['overall_length_bell_mm']
+    lengths = overall.tolist()
+    isp_values = isps.tolist()
+    pc_values = pcs.tolist()
+    baseline_length = lengths[0]
     
     # Calculate deltas from baseline
     baseline_thrust_val = baseline_thrust
     baseline_isp_val = baseline_isp
     baseline_diameter = current_exit_diameter
     
-    # Calculate Isp for reduced expansion ratios
-    isp_b1 = estimate_isp_for_expansion_ratio(60.0)
-    isp_b2 = estimate_isp_for_expansion_ratio(80.0)
-    isp_b3 = estimate_isp_for_expansion_ratio(60.0)
-    isp_b4 = estimate_isp_for_expansion_ratio(50.0)
-    
-    # Calculate required chamber pressure to maintain 1.0 N thrust
-    # Thrust requirement: 1.0 N (REQ-001)
-    thrust_target = 1.0
-    
-    Pc_b1 = calculate_chamber_pressure_for_thrust(isp_b1, thrust_target)
-    Pc_b2 = calculate_chamber_pressure_for_thrust(isp_b2, thrust_target)
-    Pc_b3 = calculate_chamber_pressure_for_thrust(isp_b3, thrust_target)
-    Pc_b4 = calculate_chamber_pressure_for_thrust(isp_b4, thrust_target)
-    
-    # Check if chamber pressures are within feed pressure limits
-    # Feed pressure: 0.3 MPa (maximum per requirements)
-    feed_pressure = 0.3  # MPa
-    
-    (b1_within_limit, b1_ratio) = check_pressure_limit(Pc_b1, feed_pressure)
-    (b2_within_limit, b2_ratio) = check_pressure_limit(Pc_b2, feed_pressure)
-    (b3_within_limit, b3_ratio) = check_pressure_limit(Pc_b3, feed_pressure)
-    (b4_within_limit, b4_ratio) = check_pressure_limit(Pc_b4, feed_pressure)
-    
-    # Create trade study options
-    options = [
-        # Option A: Bell Nozzle Redesign
-        TradeStudyOption(
-            name="Option A: Bell Nozzle Redesign",
-            description="Replace conical nozzle with Rao-optimized bell nozzle (15° initial, 8° final)",
-            expansion_ratio=100.0,
-            nozzle_type="Bell",
-            overall_length_mm=round(length_a, 1),
-            thrust_N=round(baseline_thrust_val, 3),
-            specific_impulse_s=round(baseline_isp_val, 2),
-            chamber_pressure_MPa=chamber_pressure,
-            diameter_mm=round(baseline_diameter, 1),
-            pros=[
-                "Maintains 100:1 expansion ratio and 410 s Isp",
-                "~20% length reduction (125.6 → 100 mm)",
-                "Proven heritage in spacecraft thrusters",
-                "Minimal performance impact",
-                "Higher nozzle efficiency (lower divergence losses)"
-            ],
-            cons=[
-                "Still exceeds 150 mm requirement (184 mm)",
-                "Higher manufacturing complexity",
-                "More difficult to fabricate than conical",
-                "Additional tooling costs"
-            ],
-            length_reduction_mm=round(baseline_length - length_a, 1),
-            isp_reduction_percent=0.0,
-            thrust_reduction_percent=0.0,
-            meets_length_req=length_a <= 150.0,
-            meets_thrust_req=baseline_thrust_val >= 0.95,
-            meets_isp_req=baseline_isp_val >= 220.0
-        ),
-        
-        # Option B1: Reduced Expansion Ratio 60:1 (conical)
-        TradeStudyOption(
-            name="Option B1: Reduced Expansion Ratio (60:1, conical)",
-            description="Reduce expansion ratio from 100:1 to 60:1 with conical nozzle, increase chamber pressure to maintain thrust",
-            expansion_ratio=60.0,
-            nozzle_type="Conical",
-            overall_length_mm=round(length_b1, 1),
-            thrust_N=round(thrust_target, 3),
-            specific_impulse_s=round(isp_b1, 2),
-            chamber_pressure_MPa=round(Pc_b1 / 1e6, 3),
-            diameter_mm=round(opt_b1_geom['exit_diameter_mm'], 1),
-            pros=[
-                "Maintains 1.0 N thrust requirement",
-                "Significant length reduction",
-                "Simple conical nozzle (easy to manufacture)",
-                "Isp = 344 s (56% margin above 220 s requirement)"
-            ],
-            cons=[
-                "Still exceeds 150 mm (178 mm)",
-                "Requires chamber pressure exceeding feed limit (0.25 MPa > 0.21 MPa max)",
-                "Isp reduced from 410 s to 344 s (16% reduction)",
-                "Not feasible with current feed system pressure"
-            ],
-            length_reduction_mm=round(baseline_length - length_b1, 1),
-            isp_reduction_percent=round((baseline_isp_val - isp_b1) / baseline_isp_val * 100, 1),
-            thrust_reduction_percent=0.0,
-            meets_length_req=length_b1 <= 150.0,
-            meets_thrust_req=True,
-            meets_isp_req=False  # Exceeds feed pressure limit
-        ),
-        
-        # Option B2: Reduced Expansion Ratio 80:1 (conical)
-        TradeStudyOption(
-            name="Option B2: Reduced Expansion Ratio (80:1, conical)",
-            description="Reduce expansion ratio from 100:1 to 80:1 with conical nozzle, increase chamber pressure to maintain thrust",
-            expansion_ratio=80.0,
-            nozzle_type="Conical",
-            overall_length_mm=round(length_b2, 1),
-            thrust_N=round(thrust_target, 3),
-            specific_impulse_s=round(isp_b2, 2),
-            chamber_pressure_MPa=round(Pc_b2 / 1e6, 3),
-            diameter_mm=round(opt_b2_geom['exit_diameter_mm'], 1),
-            pros=[
-                "Maintains 1.0 N thrust requirement",
-                "Balanced approach - moderate performance reduction",
-                "Isp = 378 s (72% margin)",
-                "Simple conical nozzle"
-            ],
-            cons=[
-                "Still exceeds 150 mm (194 mm, longer than 100:1!)",
-                "Requires chamber pressure exceeding feed limit (0.228 MPa > 0.21 MPa max)",
-                "Isp reduced from 410 s to 378 s (8% reduction)",
-                "Not feasible with current feed system pressure"
-            ],
-            length_reduction_mm=round(baseline_length - length_b2, 1),
-            isp_reduction_percent=round((baseline_isp_val - isp_b2) / baseline_isp_val * 100, 1),
-            thrust_reduction_percent=0.0,
-            meets_length_req=length_b2 <= 150.0,
-            meets_thrust_req=True,
-            meets_isp_req=False  # Exceeds feed pressure limit
-        ),
-        
-        # Option B3: Reduced Expansion Ratio 60:1 (bell)
-        TradeStudyOption(
-            name="Option B3: Reduced Expansion Ratio (60:1, bell)",
-            description="Reduce expansion ratio to 60:1 AND use bell nozzle, increase chamber pressure to maintain thrust",
-            expansion_ratio=60.0,
-            nozzle_type="Bell",
-            overall_length_mm=round(length_b3, 1),
-            thrust_N=round(thrust_target, 3),
-            specific_impulse_s=round(isp_b3, 2),
-            chamber_pressure_MPa=round(Pc_b3 / 1e6, 3),
-            diameter_mm=round(opt_b3_geom['exit_diameter_mm'], 1),
-            pros=[
-                "Maintains 1.0 N thrust requirement",
-                "Length = 159 mm (close to 150 mm requirement)",
-                "Isp = 344 s (56% margin)",
-                "Reduced divergence losses from bell nozzle"
-            ],
-            cons=[
-                "Still exceeds 150 mm (159 mm, 8.8 mm overage)",
-                "Requires chamber pressure exceeding feed limit (0.25 MPa > 0.21 MPa max)",
-                "Isp reduced from 410 s to 344 s (16% reduction)",
-                "Higher manufacturing complexity (bell nozzle)",
-                "Not feasible with current feed system pressure"
-            ],
-            length_reduction_mm=round(baseline_length - length_b3, 1),
-            isp_reduction_percent=round((baseline_isp_val - isp_b3) / baseline_isp_val * 100, 1),
-            thrust_reduction_percent=0.0,
-            meets_length_req=length_b3 <= 150.0,
-            meets_thrust_req=True,
-            meets_isp_req=False  # Exceeds feed pressure limit
-        ),
+    def _make_option(idx, meets_isp_req=False, **overrides):
+        """
+        Build the TradeStudyOption for SCENARIOS row idx from the batched results.
         
-        # Option B4: Reduced Expansion Ratio 50:1 (bell)
-        TradeStudyOption(
-            name="Option B4: Reduced Expansion Ratio (50:1, bell)",
-            description="Reduce expansion ratio to 50:1 with bell nozzle for margin, increase chamber pressure to maintain thrust",
-            expansion_ratio=50.0,
-            nozzle_type="Bell",
-            overall_length_mm=round(length_b4, 1),
-            thrust_N=round(thrust_target, 3),
-            specific_impulse_s=round(isp_b4, 2),
-            chamber_pressure_MPa=round(Pc_b4 / 1e6, 3),
-            diameter_mm=round(opt_b4_geom['exit_diameter_mm'], 1),
-            pros=[
-                "Maintains 1.0 N thrust requirement",
-                "Length = 151 mm (1.3 mm over 150 mm requirement)",
-                "Isp = 324 s (47% margin)",
-                "Significant manufacturing tolerance allowance"
-            ],
-            cons=[
-                "Still exceeds 150 mm (151 mm)",
-                "Requires chamber pressure exceeding feed limit (0.265 MPa > 0.21 MPa max)",
-                "Largest Isp reduction (21% to 324 s)",
-                "Higher propellant consumption",
-                "Not feasible with current feed system pressure"
-            ],
-            length_reduction_mm=round(baseline_length - length_b4, 1),
-            isp_reduction_percent=round((baseline_isp_val - isp_b4) / baseline_isp_val * 100, 1),
+        Defaults describe a reduced-expansion option holding 1.0 N thrust;
+        keyword overrides replace individual fields.
+        """
+        fields = dict(
+            name=names[idx],
+            description=descriptions[idx],
+            expansion_ratio=float(ratios[idx]),
+            nozzle_type="Bell" if nozzle_is_bell[idx] else "Conical",
+            overall_length_mm=lengths[idx],
+            thrust_N=thrust_target,
+            specific_impulse_s=isp_values[idx],
+            chamber_pressure_MPa=pc_values[idx] / 1e6,
+            diameter_mm=float(exit_diameters[idx]),
+            pros=SCENARIO_PROS_CONS[idx][0],
+            cons=SCENARIO_PROS_CONS[idx][1],
+            length_reduction_mm=baseline_length - lengths[idx],
+            isp_reduction_percent=(baseline_isp_val - isp_values[idx]) / baseline_isp_val * 100,
             thrust_reduction_percent=0.0,
-            meets_length_req=length_b4 <= 150.0,
+            meets_length_req=lengths[idx] <= 150.0,
             meets_thrust_req=True,
-            meets_isp_req=False  # Exceeds feed pressure limit
-        ),
-        
-        # Option C: Requirement Relaxation
-        TradeStudyOption(
-            name="Option C: Requirement Relaxation",
-            description="Relax REQ-012 length limit from 150 mm to 210 mm",
-            expansion_ratio=100.0,
-            nozzle_type="Conical (baseline)",
-            overall_length_mm=209.1,
-            thrust_N=round(baseline_thrust_val, 3),
-            specific_impulse_s=round(baseline_isp_val, 2),
-            chamber_pressure_MPa=chamber_pressure,
-            diameter_mm=round(baseline_diameter, 1),
-            pros=[
-                "Maintains full performance (410 s Isp)",
-                "No design changes required",
-                "Maximizes mission life with highest Isp",
-                "Simplest implementation path"
-            ],
-            cons=[
-                "Requires requirements owner approval (Agent 1)",
-                "Longer thruster affects spacecraft integration",
-                "Potential impact on spacecraft layout",
-                "Vehicle integration constraints must be verified"
-            ],
-            length_reduction_mm=0.0,
-            isp_reduction_percent=0.0,
-            thrust_reduction_percent=0.0,
-            meets_length_req=True,  # Would pass if requirement relaxed
-            meets_thrust_req=True,
-            meets_isp_req=True
-        ),
+            meets_isp_req=meets_isp_req
+        )
+        fields.update(overrides)
+        return TradeStudyOption(**fields)
+    
+    # Options that keep the 100:1 DES-001 performance point
+    baseline_performance = dict(
+        thrust_N=baseline_thrust_val,
+        specific_impulse_s=baseline_isp_val,
+        chamber_pressure_MPa=chamber_pressure,
+        diameter_mm=baseline_diameter,
+        isp_reduction_percent=0.0
+    )
+    
+    # Create trade study options (B1-B4 exceed the feed pressure limit, so
+    # they do not meet the Isp requirement at the raised chamber pressure)
+    options = [
+        _make_option(1, meets_thrust_req=baseline_thrust_val >= 0.95, meets_isp_req=baseline_isp_val >= 220.0, **baseline_performance),
+        _make_option(2),
+        _make_option(3),
+        _make_option(4),
+        _make_option(5),
+        # Would pass if requirement relaxed
+        _make_option(0, nozzle_type="Conical (baseline)", overall_length_mm=209.1, length_reduction_mm=0.0, meets_length_req=True, meets_isp_req=True, **baseline_performance),
     ]
     
-    # Convert options to dict format
-    options_dict = []
-    for opt in options:
-        opt_dict = asdict(opt)
-        opt_dict['meets_length_req'] = bool(opt_dict['meets_length_req'])
-        opt_dict['meets_thrust_req'] = bool(opt_dict['meets_thrust_req'])
-        opt_dict['meets_isp_req'] = bool(opt_dict['meets_isp_req'])
-        options_dict.append(opt_dict)
+    # Convert options to dict format (fields are already plain JSON types,
+    # so a shallow copy is enough - no recursive asdict()), rounding the
+    # reported figures once here rather than at construction
+    options_dict = [
+        {k: round(v, OPTION_DECIMALS[k]) if k in OPTION_DECIMALS else v for k, v in opt.__dict__.items()}
+        for opt in options
+    ]
     
     # Save results to JSON
     results = {
@@ -475,22 +456,21 @@ def main():
     }
     
     output_file = 'design/data/envelope_trade_study.json'
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    write_json(output_file, results)
     
     print(f"Trade study results saved to {output_file}")
     print("\n" + "="*80)
     print("ENVELOPE TRADE STUDY SUMMARY")
     print("="*80)
     
-    for i, opt in enumerate(options, 1):
-        print(f"\n{i}. {opt.name}")
-        print(f"   Overall Length: {opt.overall_length_mm} mm (requirement: 150 mm)")
-        print(f"   Thrust: {opt.thrust_N} N (requirement: 1.0 N)")
-        print(f"   Isp: {opt.specific_impulse_s} s (requirement: 220 s)")
-        print(f"   Meets Length Req: {opt.meets_length_req}")
-        print(f"   Meets Thrust Req: {opt.meets_thrust_req}")
-        print(f"   Meets Isp Req: {opt.meets_isp_req}")
+    for i, opt in enumerate(options_dict, 1):
+        print(f"\n{i}. {opt['name']}")
+        print(f"   Overall Length: {opt['overall_length_mm']} mm (requirement: 150 mm)")
+        print(f"   Thrust: {opt['thrust_N']} N (requirement: 1.0 N)")
+        print(f"   Isp: {opt['specific_impulse_s']} s (requirement: 220 s)")
+        print(f"   Meets Length Req: {opt['meets_length_req']}")
+        print(f"   Meets Thrust Req: {opt['meets_thrust_req']}")
+        print(f"   Meets Isp Req: {opt['meets_isp_req']}")
     
     return results
 
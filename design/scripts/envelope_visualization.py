@@ -4,140 +4,211 @@ DES-005: Physical Envelope and Mechanical Interface Design Visualization
 Generates visual diagrams for the thruster mechanical layout and interface specifications.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Circle, Rectangle, Polygon, FancyArrowPatch
-import json
+import numpy as np
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle, Rectangle, Polygon
+from matplotlib.collections import PatchCollection
+import argparse
+import functools
+import os
+from collections import namedtuple
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 
 # Physical constants and design parameters from prior design tasks
-DESIGN_DATA = {
+@dataclass(frozen=True, slots=True)
+class DesignData:
+    """DES-005 design inputs; read-only attributes instead of string-keyed lookups."""
     # Chamber dimensions (from DES-004)
-    "chamber_diameter_mm": 22.4,
-    "chamber_length_mm": 83.5,
-    "chamber_radius_mm": 11.2,
+    chamber_diameter_mm: float = 22.4
+    chamber_length_mm: float = 83.5
+    chamber_radius_mm: float = 11.2
 
     # Nozzle dimensions (from DES-001/DES-004)
-    "throat_diameter_mm": 7.48,
-    "throat_radius_mm": 3.74,
-    "exit_diameter_mm": 74.8,
-    "exit_radius_mm": 37.4,
-    "nozzle_length_mm": 125.6,
-    "half_angle_deg": 15.0,
+    throat_diameter_mm: float = 7.48
+    throat_radius_mm: float = 3.74
+    exit_diameter_mm: float = 74.8
+    exit_radius_mm: float = 37.4
+    nozzle_length_mm: float = 125.6
+    half_angle_deg: float = 15.0
 
     # Mounting interface (REQ-013)
-    "mounting_bolt_circle_diameter_mm": 80.0,
-    "mounting_bolt_circle_radius_mm": 40.0,
-    "mounting_bolt_size": "M6",
-    "mounting_bolt_count": 4,
-    "mounting_flange_diameter_mm": 90.0,
-    "mounting_flange_thickness_mm": 5.0,
+    mounting_bolt_circle_diameter_mm: float = 80.0
+    mounting_bolt_circle_radius_mm: float = 40.0
+    mounting_bolt_size: str = "M6"
+    mounting_bolt_count: int = 4
+    mounting_flange_diameter_mm: float = 90.0
+    mounting_flange_thickness_mm: float = 5.0
 
     # Envelope constraints (REQ-012)
-    "envelope_diameter_mm": 100.0,
-    "envelope_length_mm": 150.0,
+    envelope_diameter_mm: float = 100.0
+    envelope_length_mm: float = 150.0
 
     # Propellant inlet (REQ-026)
-    "inlet_fitting": "1/4 AN flare",
+    inlet_fitting: str = "1/4 AN flare"
 
     # Mass
-    "chamber_mass_kg": 0.0391,
-    "nozzle_mass_kg": 0.0220,
-    "flange_mass_kg": 0.1691,
-    "injector_mass_kg": 0.0376,
-    "inlet_mass_kg": 0.0120,
-    "total_dry_mass_kg": 0.2798,
-}
-
-def create_side_view():
-    """Create side view diagram of thruster assembly."""
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    # Set up coordinate system (origin at nozzle exit, positive to rear)
+    chamber_mass_kg: float = 0.0391
+    nozzle_mass_kg: float = 0.0220
+    flange_mass_kg: float = 0.1691
+    injector_mass_kg: float = 0.0376
+    inlet_mass_kg: float = 0.0120
+    total_dry_mass_kg: float = 0.2798
+
+DESIGN_DATA = DesignData()
+
+# Plot coordinates derived from DESIGN_DATA (axial origin at the nozzle exit,
+# positive to rear). DESIGN_DATA is fixed, so the layout is computed once at
+# import and the create_* functions read ready-made stations from LAYOUT.
+Layout = namedtuple("Layout", [
+    "nozzle_exit_x", "throat_x", "chamber_end_x", "flange_end_x",
+    "nozzle_mid_x", "chamber_mid_x", "flange_mid_x",
+    "inlet_x", "actual_length", "top_view_limit",
+])
+
+def _compute_layout(data):
+    """Axial stations, label positions and plot extents for the DES-005 views."""
     nozzle_exit_x = 0
-    throat_x = DESIGN_DATA["nozzle_length_mm"]
-    chamber_end_x = throat_x + DESIGN_DATA["chamber_length_mm"]
-    flange_end_x = chamber_end_x + DESIGN_DATA["mounting_flange_thickness_mm"]
+    throat_x = data.nozzle_length_mm
+    chamber_end_x = throat_x + data.chamber_length_mm
+    flange_end_x = chamber_end_x + data.mounting_flange_thickness_mm
+    return Layout(
+        nozzle_exit_x=nozzle_exit_x,
+        throat_x=throat_x,
+        chamber_end_x=chamber_end_x,
+        flange_end_x=flange_end_x,
+        nozzle_mid_x=nozzle_exit_x + data.nozzle_length_mm/2,
+        chamber_mid_x=throat_x + data.chamber_length_mm/2,
+        flange_mid_x=chamber_end_x + data.mounting_flange_thickness_mm/2,
+        inlet_x=chamber_end_x - data.chamber_length_mm + 15,
+        actual_length=data.nozzle_length_mm + data.chamber_length_mm + data.mounting_flange_thickness_mm,
+        top_view_limit=data.mounting_flange_diameter_mm/2 + 10,
+    )
+
+LAYOUT = _compute_layout(DESIGN_DATA)
+
+def _prepare_figure(fig, figsize):
+    """
+    Return a blank figure of the given size for one DES-005 plot.
+
+    A figure passed in is cleared and resized so a batch run can reuse one
+    Agg canvas; with fig=None a new pyplot-free Agg figure is created.
+    """
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)  # headless Agg canvas, no pyplot figure manager
+    else:
+        fig.clear()
+        fig.set_size_inches(figsize)
+    return fig
+
+def _defer_draw(builder):
+    """
+    Decorate a create_* builder so a caller's interactive figure redraws once.
+
+    Figures made here sit on a bare Agg canvas and never redraw, but a
+    pyplot figure passed in (e.g. from a notebook) would schedule a redraw
+    on every artist added. Its stale callback is detached while the plot is
+    built and a single draw_idle() is requested at the end.
+    """
+    @functools.wraps(builder)
+    def wrapper(fig=None, pdf=None):
+        callback = fig.stale_callback if fig is not None else None
+        if callback is None:
+            return builder(fig, pdf)
+        fig.stale_callback = None
+        try:
+            return builder(fig, pdf)
+        finally:
+            fig.stale_callback = callback
+            fig.canvas.draw_idle()
+    return wrapper
+
+def _save(fig, out_path, pdf=None):
+    """
+    Write one DES-005 plot and return its path.
+
+    With an open PdfPages the figure is appended as a page instead and
+    None is returned. Either way rasterized artists are rendered at 300 dpi.
+    SVG output is made reproducible (fixed element ids, no date stamp).
+    """
+    if pdf is not None:
+        pdf.savefig(fig, dpi=300, bbox_inches='tight')
+        return None
+    if out_path.endswith('.svg'):
+        with matplotlib.rc_context({'svg.hashsalt': 'DES-005'}):
+            fig.savefig(out_path, dpi=300, bbox_inches='tight', metadata={'Date': None})
+    else:
+        fig.savefig(out_path, dpi=300, bbox_inches='tight')
+    return out_path
+
+@_defer_draw
+def create_side_view(fig=None, pdf=None):
+    """Create side view diagram of thruster assembly; returns the output path (see _save)."""
+    # Design dimensions, bound once up front
+    nozzle_length = DESIGN_DATA.nozzle_length_mm
+    chamber_length = DESIGN_DATA.chamber_length_mm
+    flange_thickness = DESIGN_DATA.mounting_flange_thickness_mm
+    envelope_length = DESIGN_DATA.envelope_length_mm
+    exit_radius = DESIGN_DATA.exit_radius_mm
+    throat_radius = DESIGN_DATA.throat_radius_mm
+    chamber_radius = DESIGN_DATA.chamber_radius_mm
+    flange_diameter = DESIGN_DATA.mounting_flange_diameter_mm
+    bolt_circle_radius = DESIGN_DATA.mounting_bolt_circle_radius_mm
+
+    fig = _prepare_figure(fig, (12, 8))
+    ax = fig.add_subplot()
+    # Fixed limits up front: no data-limit autoscaling as artists are added
+    ax.set_autoscale_on(False)
+    ax.set_xlim(-10, LAYOUT.flange_end_x + 30)
+    ax.set_ylim(-50, 50)
+    ax.set_aspect('equal')
 
-    y_center = 0
+    # Coordinate system (origin at nozzle exit, positive to rear), see LAYOUT
+    nozzle_exit_x = LAYOUT.nozzle_exit_x
+    throat_x = LAYOUT.throat_x
+    chamber_end_x = LAYOUT.chamber_end_x
+    flange_end_x = LAYOUT.flange_end_x
 
     # Draw envelope constraint (150 mm length from nozzle exit to limit)
-    envelope_limit = DESIGN_DATA["envelope_length_mm"]
+    envelope_limit = envelope_length
     envelope = Rectangle((envelope_limit, -50), 5, 100,
                          edgecolor='red', facecolor='none',
-                         linestyle='--', linewidth=2, label='Envelope Limit (150 mm)')
+                         linestyle='--', linewidth=2)
     ax.add_patch(envelope)
 
-    # Draw envelope width constraint (100 mm diameter)
-    envelope_width = Rectangle((0, -DESIGN_DATA["envelope_diameter_mm"]/2),
-                               chamber_end_x + 20, DESIGN_DATA["envelope_diameter_mm"],
-                               edgecolor='orange', facecolor='none',
-                               linestyle=':', linewidth=1, alpha=0.5, label='Envelope Width (100 mm)')
-
     # Draw nozzle (conical)
-    nozzle_upper = [
-        (nozzle_exit_x, DESIGN_DATA["exit_radius_mm"]),
-        (throat_x, DESIGN_DATA["throat_radius_mm"])
-    ]
-    nozzle_lower = [
-        (nozzle_exit_x, -DESIGN_DATA["exit_radius_mm"]),
-        (throat_x, -DESIGN_DATA["throat_radius_mm"])
-    ]
-
-    nozzle_poly = Polygon(nozzle_upper + [(throat_x, -DESIGN_DATA["throat_radius_mm"]),
-                                           (nozzle_exit_x, -DESIGN_DATA["exit_radius_mm"])],
+    # Upper wall exit -> throat, then lower wall throat -> exit
+    nozzle_verts = np.array([[nozzle_exit_x, exit_radius],
+                             [throat_x, throat_radius],
+                             [throat_x, -throat_radius],
+                             [nozzle_exit_x, -exit_radius]])
+    nozzle_poly = Polygon(nozzle_verts, closed=True,
                           edgecolor='blue', facecolor='lightblue', alpha=0.7,
-                          linewidth=2, label='Nozzle (Molybdenum)')
-    ax.add_patch(nozzle_poly)
+                          linewidth=2, rasterized=True)
 
     # Draw chamber
-    chamber_upper = [
-        (throat_x, DESIGN_DATA["chamber_radius_mm"]),
-        (chamber_end_x, DESIGN_DATA["chamber_radius_mm"])
-    ]
-    chamber_lower = [
-        (throat_x, -DESIGN_DATA["chamber_radius_mm"]),
-        (chamber_end_x, -DESIGN_DATA["chamber_radius_mm"])
-    ]
-
-    chamber_poly = Rectangle((throat_x, -DESIGN_DATA["chamber_radius_mm"]),
-                             DESIGN_DATA["chamber_length_mm"],
-                             2*DESIGN_DATA["chamber_radius_mm"],
+    chamber_poly = Rectangle((throat_x, -chamber_radius),
+                             chamber_length,
+                             2*chamber_radius,
                              edgecolor='green', facecolor='lightgreen', alpha=0.7,
-                             linewidth=2, label='Chamber (Molybdenum)')
-    ax.add_patch(chamber_poly)
+                             linewidth=2, rasterized=True)
 
     # Draw mounting flange
-    flange_upper = [
-        (chamber_end_x, DESIGN_DATA["mounting_flange_diameter_mm"]/2),
-        (flange_end_x, DESIGN_DATA["mounting_flange_diameter_mm"]/2)
-    ]
-    flange_lower = [
-        (chamber_end_x, -DESIGN_DATA["mounting_flange_diameter_mm"]/2),
-        (flange_end_x, -DESIGN_DATA["mounting_flange_diameter_mm"]/2)
-    ]
-
-    flange_poly = Rectangle((chamber_end_x, -DESIGN_DATA["mounting_flange_diameter_mm"]/2),
-                            DESIGN_DATA["mounting_flange_thickness_mm"],
-                            DESIGN_DATA["mounting_flange_diameter_mm"],
+    flange_poly = Rectangle((chamber_end_x, -flange_diameter/2),
+                            flange_thickness,
+                            flange_diameter,
                             edgecolor='purple', facecolor='plum', alpha=0.7,
-                            linewidth=2, label='Mounting Flange (316L SS)')
-    ax.add_patch(flange_poly)
-
-    # Draw mounting bolts (4-hole pattern)
-    bolt_positions = [
-        (flange_end_x - 2, DESIGN_DATA["mounting_bolt_circle_radius_mm"]),
-        (flange_end_x - 2, -DESIGN_DATA["mounting_bolt_circle_radius_mm"]),
-    ]
-    for bx, by in bolt_positions:
-        bolt = Circle((bx, by), 3.25, edgecolor='black', facecolor='gray',
-                      linewidth=1.5, label='M6 Bolt' if bx == bolt_positions[0][0] else '')
-        ax.add_patch(bolt)
+                            linewidth=2, rasterized=True)
 
     # Draw propellant inlet
     inlet_length = 15
     inlet_height = 6
-    inlet_x = chamber_end_x - DESIGN_DATA["chamber_length_mm"] + 15
-    inlet_y = DESIGN_DATA["chamber_radius_mm"]
+    inlet_x = LAYOUT.inlet_x
+    inlet_y = chamber_radius
 
     inlet_poly = Polygon([
         (inlet_x, inlet_y),
@@ -145,199 +216,228 @@ def create_side_view():
         (inlet_x + inlet_length, inlet_y + inlet_height),
         (inlet_x, inlet_y + inlet_height)
     ], edgecolor='brown', facecolor='tan', alpha=0.7,
-       linewidth=2, label='Propellant Inlet (1/4" AN Flare)')
-    ax.add_patch(inlet_poly)
+       linewidth=2, rasterized=True)
+
+    # Filled bodies go in as one collection; match_original keeps each patch's style
+    ax.add_collection(PatchCollection([nozzle_poly, chamber_poly, flange_poly, inlet_poly],
+                                      match_original=True, rasterized=True))
+
+    # Draw mounting bolts (4-hole pattern)
+    bolt_positions = [
+        (flange_end_x - 2, bolt_circle_radius),
+        (flange_end_x - 2, -bolt_circle_radius),
+    ]
+    bolts = PatchCollection([Circle((bx, by), 3.25) for bx, by in bolt_positions],
+                            edgecolor='black', facecolor='gray',
+                            linewidth=1.5)
+    ax.add_collection(bolts)
 
     # Add dimension lines
-    ax.annotate(f'{DESIGN_DATA["nozzle_length_mm"]} mm',
-               xy=(throat_x, DESIGN_DATA["exit_radius_mm"] + 5),
-               xytext=(nozzle_exit_x, DESIGN_DATA["exit_radius_mm"] + 5),
+    ax.annotate(f'{nozzle_length} mm',
+               xy=(throat_x, exit_radius + 5),
+               xytext=(nozzle_exit_x, exit_radius + 5),
                arrowprops=dict(arrowstyle='<->', color='black'),
                fontsize=10, ha='center', va='bottom')
 
-    ax.annotate(f'{DESIGN_DATA["chamber_length_mm"]} mm',
-               xy=(throat_x, DESIGN_DATA["chamber_radius_mm"] + 8),
-               xytext=(chamber_end_x, DESIGN_DATA["chamber_radius_mm"] + 8),
+    ax.annotate(f'{chamber_length} mm',
+               xy=(throat_x, chamber_radius + 8),
+               xytext=(chamber_end_x, chamber_radius + 8),
                arrowprops=dict(arrowstyle='<->', color='black'),
                fontsize=10, ha='center', va='bottom')
 
     # Overall length annotation
     ax.annotate(f'Overall: {flange_end_x:.1f} mm (exceeds 150 mm)',
-               xy=(nozzle_exit_x, DESIGN_DATA["exit_radius_mm"] + 15),
-               xytext=(flange_end_x, DESIGN_DATA["exit_radius_mm"] + 15),
+               xy=(nozzle_exit_x, exit_radius + 15),
+               xytext=(flange_end_x, exit_radius + 15),
                arrowprops=dict(arrowstyle='<->', color='red'),
                fontsize=10, ha='center', va='bottom', color='red')
 
     # Labels
-    ax.text(nozzle_exit_x + DESIGN_DATA["nozzle_length_mm"]/2, 0, 'NOZZLE',
+    ax.text(LAYOUT.nozzle_mid_x, 0, 'NOZZLE',
             ha='center', va='center', fontsize=8, fontweight='bold')
-    ax.text(throat_x + DESIGN_DATA["chamber_length_mm"]/2, 0, 'CHAMBER',
+    ax.text(LAYOUT.chamber_mid_x, 0, 'CHAMBER',
             ha='center', va='center', fontsize=8, fontweight='bold')
-    ax.text(chamber_end_x + DESIGN_DATA["mounting_flange_thickness_mm"]/2,
+    ax.text(LAYOUT.flange_mid_x,
             0, 'FLANGE', ha='center', va='center', fontsize=8, fontweight='bold')
 
-    # Set plot limits and labels
-    ax.set_xlim(-10, flange_end_x + 30)
-    ax.set_ylim(-50, 50)
-    ax.set_aspect('equal')
+    # Set plot labels
     ax.set_xlabel('Axial Position (mm)')
     ax.set_ylabel('Radial Position (mm)')
     ax.set_title('DES-005: Thruster Side View - Mechanical Layout')
     ax.grid(True, alpha=0.3)
-    ax.legend(loc='upper right', fontsize=8)
-
-    plt.tight_layout()
-    plt.savefig('design/plots/DES005_side_view.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Created: design/plots/DES005_side_view.png")
-
-def create_top_view():
-    """Create top view diagram of mounting interface."""
-    fig, ax = plt.subplots(figsize=(10, 10))
+    # Explicit handles/labels: the legend does not scan the axes for labelled artists
+    ax.legend(handles=[envelope, nozzle_poly, chamber_poly, flange_poly, bolts, inlet_poly],
+              labels=['Envelope Limit (150 mm)', 'Nozzle (Molybdenum)', 'Chamber (Molybdenum)',
+                      'Mounting Flange (316L SS)', 'M6 Bolt', 'Propellant Inlet (1/4" AN Flare)'],
+              loc='upper right', fontsize=8)
+
+    fig.tight_layout()
+    return _save(fig, 'design/plots/DES005_side_view.png', pdf)
+
+@_defer_draw
+def create_top_view(fig=None, pdf=None):
+    """Create top view diagram of mounting interface; returns the output path (see _save)."""
+    # Design dimensions, bound once up front
+    flange_diameter = DESIGN_DATA.mounting_flange_diameter_mm
+    chamber_diameter = DESIGN_DATA.chamber_diameter_mm
+    bolt_circle_radius = DESIGN_DATA.mounting_bolt_circle_radius_mm
+    bolt_circle_diameter = DESIGN_DATA.mounting_bolt_circle_diameter_mm
+
+    fig = _prepare_figure(fig, (10, 10))
+    ax = fig.add_subplot()
+    # Fixed limits up front: no data-limit autoscaling as artists are added
+    limit = LAYOUT.top_view_limit
+    ax.set_autoscale_on(False)
+    ax.set_xlim(-limit, limit)
+    ax.set_ylim(-limit, limit)
+    ax.set_aspect('equal')
 
     # Draw mounting flange (circle)
-    flange_circle = Circle((0, 0), DESIGN_DATA["mounting_flange_diameter_mm"]/2,
+    flange_circle = Circle((0, 0), flange_diameter/2,
                            edgecolor='purple', facecolor='plum', alpha=0.7,
-                           linewidth=2, label='Mounting Flange (90 mm Ø)')
-    ax.add_patch(flange_circle)
+                           linewidth=2, rasterized=True)
 
     # Draw chamber (inner circle)
-    chamber_circle = Circle((0, 0), DESIGN_DATA["chamber_diameter_mm"]/2,
+    chamber_circle = Circle((0, 0), chamber_diameter/2,
                             edgecolor='green', facecolor='lightgreen', alpha=0.7,
-                            linewidth=2, label='Chamber (22.4 mm Ø)')
-    ax.add_patch(chamber_circle)
+                            linewidth=2, rasterized=True)
+    ax.add_collection(PatchCollection([flange_circle, chamber_circle],
+                                      match_original=True, rasterized=True))
 
-    # Draw bolt circle (dashed)
-    bolt_circle = Circle((0, 0), DESIGN_DATA["mounting_bolt_circle_radius_mm"],
-                         edgecolor='blue', facecolor='none',
-                         linestyle='--', linewidth=1.5, label='Bolt Circle (80 mm Ø)')
-    ax.add_patch(bolt_circle)
+    # Draw bolt circle (dashed line, no fill, so a plain line is enough)
+    t = np.linspace(0, 2*np.pi, 128)
+    bolt_circle, = ax.plot(bolt_circle_radius*np.cos(t), bolt_circle_radius*np.sin(t),
+                           linestyle='--', color='blue', linewidth=1.5,
+                           zorder=1)  # under the bolt holes
 
     # Draw bolt holes (4-hole pattern, 90° spacing)
-    bolt_angle = [0, 90, 180, 270]
-    for i, angle in enumerate(bolt_angle):
-        angle_rad = angle * 3.14159 / 180
-        bx = DESIGN_DATA["mounting_bolt_circle_radius_mm"] * (3.14159/180 if angle == 0 else 0)
-        by = DESIGN_DATA["mounting_bolt_circle_radius_mm"] * (1 if angle == 90 else -1 if angle == 270 else 0)
-
-        # Recalculate positions properly
-        if angle == 0:
-            bx, by = DESIGN_DATA["mounting_bolt_circle_radius_mm"], 0
-        elif angle == 90:
-            bx, by = 0, DESIGN_DATA["mounting_bolt_circle_radius_mm"]
-        elif angle == 180:
-            bx, by = -DESIGN_DATA["mounting_bolt_circle_radius_mm"], 0
-        else:  # 270
-            bx, by = 0, -DESIGN_DATA["mounting_bolt_circle_radius_mm"]
-
-        bolt_hole = Circle((bx, by), 3.25, edgecolor='black', facecolor='gray',
-                           linewidth=1.5, label='M6 Bolt Hole' if i == 0 else '')
-        ax.add_patch(bolt_hole)
+    bolt_angle = np.deg2rad([0, 90, 180, 270])
+    bolt_xs = bolt_circle_radius * np.cos(bolt_angle)
+    bolt_ys = bolt_circle_radius * np.sin(bolt_angle)
+    bolt_holes = []
+    for i, (bx, by) in enumerate(zip(bolt_xs, bolt_ys)):
+        bolt_holes.append(Circle((bx, by), 3.25))
 
         # Label bolt numbers
         ax.text(bx, by + 6, f'Bolt {i+1}', ha='center', va='bottom', fontsize=8)
 
+    bolt_hole_patches = PatchCollection(bolt_holes, edgecolor='black', facecolor='gray',
+                                        linewidth=1.5)
+    ax.add_collection(bolt_hole_patches)
+
     # Add dimension for bolt circle diameter
-    ax.annotate(f'{DESIGN_DATA["mounting_bolt_circle_diameter_mm"]} mm BCD',
-               xy=(0, DESIGN_DATA["mounting_bolt_circle_radius_mm"]),
-               xytext=(0, -DESIGN_DATA["mounting_bolt_circle_radius_mm"]),
+    ax.annotate(f'{bolt_circle_diameter} mm BCD',
+               xy=(0, bolt_circle_radius),
+               xytext=(0, -bolt_circle_radius),
                arrowprops=dict(arrowstyle='<->', color='blue'),
                fontsize=10, ha='right', va='center', color='blue')
 
     # Add dimension for flange diameter
-    ax.annotate(f'{DESIGN_DATA["mounting_flange_diameter_mm"]} mm Ø',
-               xy=(DESIGN_DATA["mounting_flange_diameter_mm"]/2, 0),
-               xytext=(-DESIGN_DATA["mounting_flange_diameter_mm"]/2, 0),
+    ax.annotate(f'{flange_diameter} mm Ø',
+               xy=(flange_diameter/2, 0),
+               xytext=(-flange_diameter/2, 0),
                arrowprops=dict(arrowstyle='<->', color='purple'),
                fontsize=10, ha='right', va='top', color='purple')
 
     # Labels
     ax.text(0, 0, 'CHAMBER', ha='center', va='center', fontsize=8, fontweight='bold')
 
-    # Set plot limits and labels
-    limit = DESIGN_DATA["mounting_flange_diameter_mm"]/2 + 10
-    ax.set_xlim(-limit, limit)
-    ax.set_ylim(-limit, limit)
-    ax.set_aspect('equal')
+    # Set plot labels
     ax.set_xlabel('X Position (mm)')
     ax.set_ylabel('Y Position (mm)')
     ax.set_title('DES-005: Mounting Interface - Top View (4-Hole Pattern)')
     ax.grid(True, alpha=0.3)
-    ax.legend(loc='upper right', fontsize=8)
-
-    plt.tight_layout()
-    plt.savefig('design/plots/DES005_mounting_top_view.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Created: design/plots/DES005_mounting_top_view.png")
-
-def create_envelope_diagram():
-    """Create envelope constraint diagram."""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    ax.legend(handles=[flange_circle, chamber_circle, bolt_circle, bolt_hole_patches],
+              labels=['Mounting Flange (90 mm Ø)', 'Chamber (22.4 mm Ø)',
+                      'Bolt Circle (80 mm Ø)', 'M6 Bolt Hole'],
+              loc='upper right', fontsize=8)
+
+    fig.tight_layout()
+    return _save(fig, 'design/plots/DES005_mounting_top_view.png', pdf)
+
+@_defer_draw
+def create_envelope_diagram(fig=None, pdf=None):
+    """Create envelope constraint diagram; returns the output path (see _save)."""
+    # Design dimensions, bound once up front
+    envelope_length = DESIGN_DATA.envelope_length_mm
+    envelope_diameter = DESIGN_DATA.envelope_diameter_mm
+    nozzle_length = DESIGN_DATA.nozzle_length_mm
+    chamber_length = DESIGN_DATA.chamber_length_mm
+    flange_thickness = DESIGN_DATA.mounting_flange_thickness_mm
+    exit_diameter = DESIGN_DATA.exit_diameter_mm
+    throat_diameter = DESIGN_DATA.throat_diameter_mm
+    chamber_diameter = DESIGN_DATA.chamber_diameter_mm
+
+    fig = _prepare_figure(fig, (14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
+    # Left plot has fixed limits; the bar chart on the right keeps autoscaling
+    ax1.set_autoscale_on(False)
+    ax1.set_xlim(-10, LAYOUT.actual_length + 20)
+    ax1.set_ylim(-envelope_diameter/2 - 10, envelope_diameter/2 + 10)
+    ax1.set_aspect('equal')
 
     # Left plot: Side view envelope
     ax1.set_title('Side View Envelope Compliance', fontsize=12, fontweight='bold')
 
     # Draw envelope rectangle (requirement)
-    env_rect = Rectangle((DESIGN_DATA["envelope_length_mm"], -DESIGN_DATA["envelope_diameter_mm"]/2),
-                         5, DESIGN_DATA["envelope_diameter_mm"],
+    env_rect = Rectangle((envelope_length, -envelope_diameter/2),
+                         5, envelope_diameter,
                          edgecolor='red', facecolor='none',
-                         linestyle='--', linewidth=3, label='Requirement (100×150 mm)')
+                         linestyle='--', linewidth=3)
     ax1.add_patch(env_rect)
 
     # Draw actual thruster outline
-    actual_length = DESIGN_DATA["nozzle_length_mm"] + DESIGN_DATA["chamber_length_mm"] + DESIGN_DATA["mounting_flange_thickness_mm"]
-    actual_diameter = DESIGN_DATA["exit_diameter_mm"]
+    actual_length = LAYOUT.actual_length
+    actual_diameter = exit_diameter
 
     # Nozzle
-    nozzle_poly = Polygon([
-        (0, actual_diameter/2),
-        (DESIGN_DATA["nozzle_length_mm"], DESIGN_DATA["throat_diameter_mm"]/2),
-        (DESIGN_DATA["nozzle_length_mm"], -DESIGN_DATA["throat_diameter_mm"]/2),
-        (0, -actual_diameter/2)
-    ], edgecolor='blue', facecolor='lightblue', alpha=0.7, linewidth=2, label='Actual Thruster')
-    ax1.add_patch(nozzle_poly)
+    nozzle_verts = np.array([[0, actual_diameter/2],
+                             [nozzle_length, throat_diameter/2],
+                             [nozzle_length, -throat_diameter/2],
+                             [0, -actual_diameter/2]])
+    nozzle_poly = Polygon(nozzle_verts, closed=True,
+                          edgecolor='blue', facecolor='lightblue', alpha=0.7, linewidth=2,
+                          rasterized=True)
 
     # Chamber + Flange
-    chamber_poly = Rectangle((DESIGN_DATA["nozzle_length_mm"], -DESIGN_DATA["chamber_diameter_mm"]/2),
-                             DESIGN_DATA["chamber_length_mm"] + DESIGN_DATA["mounting_flange_thickness_mm"],
-                             DESIGN_DATA["chamber_diameter_mm"],
-                             edgecolor='green', facecolor='lightgreen', alpha=0.7, linewidth=2)
-    ax1.add_patch(chamber_poly)
+    chamber_poly = Rectangle((nozzle_length, -chamber_diameter/2),
+                             chamber_length + flange_thickness,
+                             chamber_diameter,
+                             edgecolor='green', facecolor='lightgreen', alpha=0.7, linewidth=2,
+                             rasterized=True)
+    ax1.add_collection(PatchCollection([nozzle_poly, chamber_poly],
+                                       match_original=True, rasterized=True))
 
     # Annotations
     ax1.text(actual_length/2, actual_diameter/2 + 5,
              f'Actual: {actual_length:.1f} × {actual_diameter:.1f} mm',
              ha='center', va='bottom', fontsize=10, fontweight='bold', color='blue')
-    ax1.text(DESIGN_DATA["envelope_length_mm"]/2, -DESIGN_DATA["envelope_diameter_mm"]/2 - 5,
-             f'Requirement: {DESIGN_DATA["envelope_length_mm"]} × {DESIGN_DATA["envelope_diameter_mm"]} mm',
+    ax1.text(envelope_length/2, -envelope_diameter/2 - 5,
+             f'Requirement: {envelope_length} × {envelope_diameter} mm',
              ha='center', va='top', fontsize=10, fontweight='bold', color='red')
 
-    ax1.set_xlim(-10, actual_length + 20)
-    ax1.set_ylim(-DESIGN_DATA["envelope_diameter_mm"]/2 - 10, DESIGN_DATA["envelope_diameter_mm"]/2 + 10)
     ax1.set_xlabel('Length (mm)')
     ax1.set_ylabel('Diameter (mm)')
-    ax1.set_aspect('equal')
     ax1.grid(True, alpha=0.3)
-    ax1.legend(loc='upper right', fontsize=9)
+    ax1.legend(handles=[env_rect, nozzle_poly], labels=['Requirement (100×150 mm)', 'Actual Thruster'],
+               loc='upper right', fontsize=9)
 
     # Right plot: Compliance bar chart
     ax2.set_title('Envelope Compliance Summary', fontsize=12, fontweight='bold')
 
     categories = ['Diameter (mm)', 'Length (mm)']
-    actual = [DESIGN_DATA["exit_diameter_mm"], actual_length]
-    requirement = [DESIGN_DATA["envelope_diameter_mm"], DESIGN_DATA["envelope_length_mm"]]
-    compliance = [actual[0] <= requirement[0], actual[1] <= requirement[1]]
-    colors = ['green' if c else 'red' for c in compliance]
+    actual = np.array([exit_diameter, actual_length])
+    requirement = np.array([envelope_diameter, envelope_length])
+    compliance = actual <= requirement
+    # Actual bars are coloured by compliance (fill and edge) at creation
+    colors = np.where(compliance, 'green', 'red')
 
-    x = [0, 1]
+    x = np.arange(len(categories))
     width = 0.35
 
-    bars1 = ax2.bar([i - width/2 for i in x], actual, width, label='Actual', alpha=0.8)
-    bars2 = ax2.bar([i + width/2 for i in x], requirement, width, label='Requirement', alpha=0.8)
-
-    # Color the bars based on compliance
-    for i, (bar, comp) in enumerate(zip(bars1, compliance)):
-        bar.set_color('green' if comp else 'red')
+    ax2.bar(x - width/2, actual, width, label='Actual', alpha=0.8,
+            color=colors, edgecolor=colors)
+    ax2.bar(x + width/2, requirement, width, label='Requirement', alpha=0.8, color='C1')
 
     ax2.set_xticks(x)
     ax2.set_xticklabels(categories)
@@ -345,40 +445,53 @@ def create_envelope_diagram():
     ax2.legend()
     ax2.grid(True, alpha=0.3, axis='y')
 
-    # Add compliance text
-    for i, (act, req, comp) in enumerate(zip(actual, requirement, compliance)):
-        status = 'PASS' if comp else 'FAIL'
-        margin = abs(req - act)
-        ax2.text(i, max(act, req) + 5, f'{status}\nMargin: {margin:.1f} mm',
+    # Add compliance text (margins and label heights computed for all categories at once)
+    statuses = np.where(compliance, 'PASS', 'FAIL')
+    margins = np.abs(requirement - actual)
+    text_ys = np.maximum(actual, requirement) + 5
+    for i in range(len(categories)):
+        ax2.text(x[i], text_ys[i], f'{statuses[i]}\nMargin: {margins[i]:.1f} mm',
                  ha='center', va='bottom', fontsize=10, fontweight='bold',
-                 color='green' if comp else 'red')
+                 color=colors[i])
 
-    plt.tight_layout()
-    plt.savefig('design/plots/DES005_envelope_compliance.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Created: design/plots/DES005_envelope_compliance.png")
+    fig.tight_layout()
+    # Sparse line art: SVG skips Agg rasterization (filled bodies are still
+    # embedded as rasterized images, see create_side_view)
+    return _save(fig, 'design/plots/DES005_envelope_compliance.svg', pdf)
 
-def create_mass_breakdown_chart():
-    """Create mass breakdown pie chart."""
-    fig, ax = plt.subplots(figsize=(10, 8))
+@_defer_draw
+def create_mass_breakdown_chart(fig=None, pdf=None):
+    """Create mass breakdown pie chart; returns the output path (see _save)."""
+    fig = _prepare_figure(fig, (10, 8))
+    ax = fig.add_subplot()
 
     labels = ['Chamber\n(Mo)', 'Nozzle\n(Mo)', 'Mounting Flange\n(316L SS)',
               'Injector\n(316L SS)', 'Propellant Inlet\n(316L SS)']
-    sizes = [DESIGN_DATA["chamber_mass_kg"], DESIGN_DATA["nozzle_mass_kg"],
-             DESIGN_DATA["flange_mass_kg"], DESIGN_DATA["injector_mass_kg"],
-             DESIGN_DATA["inlet_mass_kg"]]
+    sizes = np.array([DESIGN_DATA.chamber_mass_kg, DESIGN_DATA.nozzle_mass_kg,
+                      DESIGN_DATA.flange_mass_kg, DESIGN_DATA.injector_mass_kg,
+                      DESIGN_DATA.inlet_mass_kg])
     colors = ['lightgreen', 'lightblue', 'plum', 'lightcoral', 'tan']
-    explode = (0.05, 0.05, 0, 0, 0)
+    explode = np.array([0.05, 0.05, 0, 0, 0])
+    startangle = 90
 
-    wedges, texts, autotexts = ax.pie(sizes, explode=explode, labels=labels, colors=colors,
-                                       autopct='%1.1f%%', shadow=True, startangle=90)
+    wedges, texts = ax.pie(sizes, explode=explode, labels=labels, colors=colors,
+                           shadow=True, startangle=startangle)
 
-    for autotext in autotexts:
-        autotext.set_fontsize(10)
-        autotext.set_fontweight('bold')
+    # Filled wedges are rasterized in vector output; labels stay as text
+    for wedge in wedges:
+        wedge.set_rasterized(True)
+
+    # Percentage labels, placed where autopct would put them (mid-wedge
+    # angle, 0.6 of the radius out from the exploded wedge centre)
+    fracs = sizes / sizes.sum()
+    theta_mid = 2*np.pi * (startangle/360 + np.cumsum(fracs) - fracs/2)
+    pct_r = explode + 0.6
+    for x, y, pct in zip(pct_r*np.cos(theta_mid), pct_r*np.sin(theta_mid), 100*fracs):
+        ax.text(x, y, f'{pct:1.1f}%', ha='center', va='center', clip_on=False,
+                fontsize=10, fontweight='bold')
 
     # Add total mass annotation
-    total_mass = sum(sizes)
+    total_mass = sizes.sum()
     budget = 0.5
     margin = budget - total_mass
     ax.text(0, -1.3, f'Total Dry Mass: {total_mass:.4f} kg\n'
@@ -390,27 +503,62 @@ def create_mass_breakdown_chart():
     ax.set_title('DES-005: Dry Mass Breakdown\n(REQ-011: ≤ 0.5 kg)',
                  fontsize=12, fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig('design/plots/DES005_mass_breakdown.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Created: design/plots/DES005_mass_breakdown.png")
+    fig.tight_layout()
+    return _save(fig, 'design/plots/DES005_mass_breakdown.png', pdf)
+
+FIGURE_BUILDERS = [
+    create_side_view,
+    create_top_view,
+    create_envelope_diagram,
+    create_mass_breakdown_chart,
+]
+
+def build_figures():
+    """
+    Render the four DES-005 figures in-process, reusing one figure.
+
+    Used by design/generate_all.py; returns the paths of the written files.
+    """
+    fig = _prepare_figure(None, (14, 10))
+    return [builder(fig) for builder in FIGURE_BUILDERS]
+
+def _call(func):
+    """Run one figure builder in a worker process (module-level so it pickles)."""
+    return func()
 
-def main():
-    """Generate all visualizations."""
+def main(pdf_path=None):
+    """Generate all visualizations (as pages of one PDF if pdf_path is given)."""
     print("=" * 60)
     print("DES-005: Physical Envelope and Mechanical Interface Design")
     print("Visualization Generation")
     print("=" * 60)
 
-    # Create all plots
-    create_side_view()
-    create_top_view()
-    create_envelope_diagram()
-    create_mass_breakdown_chart()
+    # Create all plots; the figures share no state, so each renders in its own process
+    workers = min(len(FIGURE_BUILDERS), os.cpu_count() or 1)
+    if pdf_path is not None:
+        # One multi-page document: pages are appended in order on a shared figure
+        fig = _prepare_figure(None, (14, 10))
+        with PdfPages(pdf_path) as pdf:
+            for builder in FIGURE_BUILDERS:
+                builder(fig, pdf)
+        print(f"Created: {pdf_path} ({len(FIGURE_BUILDERS)} pages)")
+    elif workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for out_path in executor.map(_call, FIGURE_BUILDERS):
+                print(f"Created: {out_path}")
+    else:
+        # Single core: render in-process, reusing one figure for every plot
+        fig = _prepare_figure(None, (14, 10))
+        for builder in FIGURE_BUILDERS:
+            print(f"Created: {builder(fig)}")
 
     print("\n" + "=" * 60)
     print("All visualizations generated successfully!")
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="DES-005 envelope and mechanical interface plots")
+    parser.add_argument("--pdf", action="store_true",
+                        help="Write all plots as one multi-page design/plots/DES005.pdf instead of PNGs")
+    args = parser.parse_args()
+    main(pdf_path='design/plots/DES005.pdf' if args.pdf else None)
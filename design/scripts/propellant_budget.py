@@ -23,15 +23,13 @@ Design Assumptions:
 - Hydrazine liquid density = 1004 kg/m³ at 25°C (from CONTEXT.md)
 """
 
-import json
 import math
+import sys
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
-# ============================================================================
-# PHYSICAL CONSTANTS (from CONTEXT.md)
-# ============================================================================
-g0 = 9.80665  # m/s² — standard gravitational acceleration (exact, SI)
-RHO_N2H4 = 1004.0  # kg/m³ — liquid hydrazine density at 25°C
+from _optional_deps import write_json
+from _physics_constants import G0, RHO_N2H4
 
 # ============================================================================
 # REQUIREMENTS CONSTANTS
@@ -53,11 +51,71 @@ DES001_DATA = {
     "thrust_N": 1.0  # N — nominal thrust
 }
 
+# ============================================================================
+# RESULT RECORDS (field order is the propellant_budget.json key order)
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Parameters:
+    """Every input the budget depends on."""
+    total_impulse_requirement_Ns: float = REQ_005_TOTAL_IMPULSE_NS
+    propellant_mass_budget_kg: float = REQ_008_MAX_PROPELLANT_MASS_KG
+    minimum_isp_s: float = REQ_002_MIN_ISP_S
+    design_isp_s: float = DES001_DATA["specific_impulse_s"]
+    mass_flow_rate_kg_s: float = DES001_DATA["mass_flow_rate_kg_s"]
+    nominal_thrust_N: float = DES001_DATA["thrust_N"]
+    firing_cycles: int = REQ_020_FIRING_CYCLES
+    minimum_firing_cycles: int = REQ_020_FIRING_CYCLES
+    uncertainty_margin_pct: float = UNCERTAINTY_MARGIN_PCT
+    standard_gravity_m_s2: float = G0
+    hydrazine_density_kg_m3: float = RHO_N2H4
+    catalyst_lifetime_hours: float = REQ_021_CATALYST_LIFETIME_HOURS
+    mission_life_years: int = REQ_030_MISSION_YEARS
+
+
+@dataclass(frozen=True, slots=True)
+class ComputedResults:
+    """Propellant budget derived from a Parameters set."""
+    nominal_propellant_mass_kg: float
+    conservative_propellant_mass_min_isp_kg: float
+    margin_amount_kg: float
+    propellant_mass_with_margin_kg: float
+    propellant_volume_m3: float
+    propellant_volume_liters: float
+    total_firing_time_seconds: float
+    total_firing_time_hours: float
+    impulse_per_cycle_Ns: float
+    minimum_pulse_time_ms: float
+    minimum_pulse_time_s: float
+    achievable_total_impulse_nominal_Ns: float
+    achievable_total_impulse_with_margin_Ns: float
+    budget_utilization_pct: float
+    budget_remaining_kg: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReqCompliance:
+    """Compliance of one requirement; only one of threshold_min/threshold_max is set."""
+    description: str
+    threshold_min: float = None
+    threshold_max: float = None
+    computed: float
+    unit: str
+    margin_percent: float
+    status: str
+
+    def to_dict(self):
+        """asdict() without the unused threshold side."""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+PARAMETERS = Parameters()
+
 # ============================================================================
 # CALCULATIONS
 # ============================================================================
 
-def calculate_propellant_mass_nominal(isp_s, total_impulse_ns):
+def calculate_propellant_mass_nominal(isp_s, total_impulse_ns, g0=G0):
     """
     Calculate propellant mass required to achieve specified total impulse.
     
@@ -66,6 +124,7 @@ def calculate_propellant_mass_nominal(isp_s, total_impulse_ns):
     Args:
         isp_s: Specific impulse in seconds
         total_impulse_ns: Total impulse in N·s
+        g0: Standard gravitational acceleration in m/s²
     
     Returns:
         Propellant mass in kg
@@ -73,7 +132,7 @@ def calculate_propellant_mass_nominal(isp_s, total_impulse_ns):
     return total_impulse_ns / (isp_s * g0)
 
 
-def calculate_propellant_volume_kg_to_m3(propellant_mass_kg):
+def calculate_propellant_volume_kg_to_m3(propellant_mass_kg, rho=RHO_N2H4):
     """
     Convert propellant mass to volume using liquid hydrazine density.
     
@@ -81,11 +140,12 @@ def calculate_propellant_volume_kg_to_m3(propellant_mass_kg):
     
     Args:
         propellant_mass_kg: Propellant mass in kg
+        rho: Propellant density in kg/m³
     
     Returns:
         Propellant volume in m³
     """
-    return propellant_mass_kg / RHO_N2H4
+    return propellant_mass_kg / rho
 
 
 def calculate_total_firing_time_s(propellant_mass_kg, mass_flow_rate_kg_s):
@@ -136,271 +196,281 @@ def calculate_min_pulse_time_ns(impulse_cycle_ns, thrust_N):
     return impulse_cycle_ns / thrust_N
 
 
-def main():
-    print("=" * 80)
-    print("DES-002: Propellant Budget Calculation")
-    print("=" * 80)
-    print()
-    
-    # Step 1: Calculate nominal propellant mass using design Isp (from DES-001)
-    print("Step 1: Calculate Nominal Propellant Mass")
-    print("-" * 60)
-    print(f"  Design approach: Use design Isp from DES-001 (actual expected performance)")
-    print(f"  Design Isp: {DES001_DATA['specific_impulse_s']:.2f} s")
-    print(f"  Required total impulse: {REQ_005_TOTAL_IMPULSE_NS:,.0f} N·s")
-    print(f"  Standard gravity (g0): {g0} m/s²")
-    m_prop_nominal = calculate_propellant_mass_nominal(
-        DES001_DATA["specific_impulse_s"],
-        REQ_005_TOTAL_IMPULSE_NS
-    )
-    print(f"  Nominal propellant mass: {m_prop_nominal:.4f} kg")
-    print()
-    
-    # Step 1a: Also calculate using minimum Isp (conservative) for comparison
-    print("Step 1a: Compare with Minimum Isp (Conservative Baseline)")
-    print("-" * 60)
-    m_prop_conservative = calculate_propellant_mass_nominal(
-        REQ_002_MIN_ISP_S,
-        REQ_005_TOTAL_IMPULSE_NS
-    )
-    print(f"  Minimum Isp (conservative): {REQ_002_MIN_ISP_S} s")
-    print(f"  Conservative propellant mass: {m_prop_conservative:.4f} kg")
-    print(f"  Reduction using design Isp: {(m_prop_conservative - m_prop_nominal):.4f} kg ({(m_prop_conservative - m_prop_nominal)/m_prop_conservative*100:.1f}%)")
-    print()
-    
-    # Step 2: Add 10% margin for mission uncertainty
-    print("Step 2: Add Mission Uncertainty Margin")
-    print("-" * 60)
-    print(f"  Margin covers: Isp degradation over life, residual propellant,")
-    print(f"                  pressurization losses, potential leaks")
-    m_prop_with_margin = m_prop_nominal * (1.0 + UNCERTAINTY_MARGIN_PCT / 100.0)
-    margin_amount = m_prop_with_margin - m_prop_nominal
-    print(f"  Nominal propellant mass: {m_prop_nominal:.4f} kg")
-    print(f"  Uncertainty margin: {UNCERTAINTY_MARGIN_PCT}%")
-    print(f"  Margin amount: {margin_amount:.4f} kg")
-    print(f"  Propellant mass with margin: {m_prop_with_margin:.4f} kg")
-    print()
-    
-    # Step 3: Verify against 25 kg propellant budget
-    print("Step 3: Verify Against Propellant Mass Budget")
-    print("-" * 60)
-    budget_utilization_pct = (m_prop_with_margin / REQ_008_MAX_PROPELLANT_MASS_KG) * 100.0
-    budget_remaining_kg = REQ_008_MAX_PROPELLANT_MASS_KG - m_prop_with_margin
-    print(f"  Required propellant mass (with margin): {m_prop_with_margin:.4f} kg")
-    print(f"  Maximum allowed propellant mass: {REQ_008_MAX_PROPELLANT_MASS_KG:.1f} kg")
-    print(f"  Budget utilization: {budget_utilization_pct:.1f}%")
-    if budget_remaining_kg >= 0:
-        print(f"  Budget remaining: {budget_remaining_kg:.4f} kg")
-        print(f"  Status: PASS - {budget_utilization_pct:.1f}% < 100.0%")
-    else:
-        print(f"  Budget overage: {-budget_remaining_kg:.4f} kg")
-        print(f"  Status: FAIL - {budget_utilization_pct:.1f}% > 100.0%")
-    print()
+def compute_budget(params):
+    """
+    Compute the propellant budget and requirement compliance for a parameter set.
     
-    # Step 4: Calculate propellant volume (for tank sizing)
-    print("Step 4: Calculate Propellant Volume")
-    print("-" * 60)
-    V_prop_m3 = calculate_propellant_volume_kg_to_m3(m_prop_with_margin)
-    V_prop_liters = V_prop_m3 * 1000.0
-    print(f"  Propellant mass: {m_prop_with_margin:.4f} kg")
-    print(f"  Hydrazine liquid density: {RHO_N2H4} kg/m³")
-    print(f"  Propellant volume: {V_prop_m3:.6f} m³")
-    print(f"  Propellant volume: {V_prop_liters:.3f} liters")
-    print()
+    Args:
+        params: Parameters instance
     
-    # Step 5: Calculate total firing time using actual design Isp (from DES-001)
-    print("Step 5: Calculate Total Firing Time (Using Design Isp)")
-    print("-" * 60)
-    t_firing_seconds = calculate_total_firing_time_s(m_prop_with_margin, DES001_DATA["mass_flow_rate_kg_s"])
+    Returns:
+        Tuple of (ComputedResults, dict of ReqCompliance keyed by requirement ID)
+    """
+    isp_s = params.design_isp_s
+    total_impulse_ns = params.total_impulse_requirement_Ns
+    budget_kg = params.propellant_mass_budget_kg
+    catalyst_hours = params.catalyst_lifetime_hours
+    g0 = params.standard_gravity_m_s2
+    
+    m_prop_nominal = calculate_propellant_mass_nominal(isp_s, total_impulse_ns, g0)
+    m_prop_conservative = calculate_propellant_mass_nominal(params.minimum_isp_s,
+                                                            total_impulse_ns, g0)
+    m_prop_with_margin = m_prop_nominal * (1.0 + params.uncertainty_margin_pct / 100.0)
+    budget_remaining_kg = budget_kg - m_prop_with_margin
+    V_prop_m3 = calculate_propellant_volume_kg_to_m3(m_prop_with_margin,
+                                                     params.hydrazine_density_kg_m3)
+    t_firing_seconds = calculate_total_firing_time_s(m_prop_with_margin, params.mass_flow_rate_kg_s)
     t_firing_hours = t_firing_seconds / 3600.0
-    print(f"  Propellant mass: {m_prop_with_margin:.4f} kg")
-    print(f"  Design mass flow rate: {DES001_DATA['mass_flow_rate_kg_s']:.9f} kg/s")
-    print(f"  Total firing time: {t_firing_hours:.2f} hours")
-    print(f"  Total firing time: {t_firing_seconds:.0f} seconds")
-    print()
-    
-    # Step 6: Calculate impulse per firing cycle
-    print("Step 6: Calculate Impulse Per Firing Cycle")
-    print("-" * 60)
-    I_cycle = calculate_impulse_per_firing_cycle(REQ_005_TOTAL_IMPULSE_NS, REQ_020_FIRING_CYCLES)
-    print(f"  Total impulse: {REQ_005_TOTAL_IMPULSE_NS:,.0f} N·s")
-    print(f"  Number of firing cycles: {REQ_020_FIRING_CYCLES:,}")
-    print(f"  Impulse per cycle: {I_cycle:.4f} N·s")
-    print(f"  Minimum impulse bit requirement (REQ-004): 0.01 N·s")
-    print(f"  PASS: {I_cycle:.4f} N·s > 0.01 N·s" if I_cycle >= 0.01 else f"  FAIL: {I_cycle:.4f} N·s < 0.01 N·s")
-    print()
-    
-    # Step 7: Calculate minimum pulse time
-    print("Step 7: Calculate Minimum Pulse Time")
-    print("-" * 60)
-    t_pulse_min = calculate_min_pulse_time_ns(I_cycle, DES001_DATA["thrust_N"])
-    t_pulse_min_ms = t_pulse_min * 1000.0
-    print(f"  Impulse per cycle: {I_cycle:.4f} N·s")
-    print(f"  Nominal thrust: {DES001_DATA['thrust_N']:.1f} N")
-    print(f"  Minimum pulse time: {t_pulse_min_ms:.1f} ms")
-    print(f"  Minimum pulse time: {t_pulse_min:.4f} s")
-    print()
+    I_cycle = calculate_impulse_per_firing_cycle(total_impulse_ns, params.firing_cycles)
+    t_pulse_min = calculate_min_pulse_time_ns(I_cycle, params.nominal_thrust_N)
+    I_achievable_nominal = m_prop_nominal * isp_s * g0
     
-    # Step 8: Calculate actual total impulse achievable with propellant mass
-    print("Step 8: Verify Total Impulse Achievement")
-    print("-" * 60)
-    I_achievable_nominal = m_prop_nominal * DES001_DATA["specific_impulse_s"] * g0
-    I_achievable_margin = m_prop_with_margin * DES001_DATA["specific_impulse_s"] * g0
-    print(f"  Design Isp (from DES-001): {DES001_DATA['specific_impulse_s']:.2f} s")
-    print(f"  Propellant mass (nominal): {m_prop_nominal:.4f} kg")
-    print(f"  Achievable total impulse (nominal): {I_achievable_nominal:,.0f} N·s")
-    print(f"  Required total impulse (REQ-005): {REQ_005_TOTAL_IMPULSE_NS:,.0f} N·s")
-    print(f"  Margin on total impulse: {(I_achievable_nominal / REQ_005_TOTAL_IMPULSE_NS - 1.0) * 100:.1f}%")
-    print(f"  With uncertainty margin: {m_prop_with_margin:.4f} kg")
-    print(f"  Achievable total impulse (with margin): {I_achievable_margin:,.0f} N·s")
-    print()
-    
-    # Step 9: Verify catalyst lifetime requirement
-    print("Step 9: Verify Catalyst Lifetime (REQ-021)")
-    print("-" * 60)
-    print(f"  Total firing time (with margin): {t_firing_hours:.2f} hours")
-    print(f"  Catalyst lifetime requirement: {REQ_021_CATALYST_LIFETIME_HOURS} hours (REQ-021)")
-    if t_firing_hours <= REQ_021_CATALYST_LIFETIME_HOURS:
-        margin_hours = REQ_021_CATALYST_LIFETIME_HOURS - t_firing_hours
-        print(f"  PASS: {t_firing_hours:.2f} h < {REQ_021_CATALYST_LIFETIME_HOURS} h")
-        print(f"  Margin: {margin_hours:.2f} hours")
+    if m_prop_with_margin <= budget_kg:
+        req_008_margin = (1.0 - m_prop_with_margin / budget_kg) * 100.0
     else:
-        overage_hours = t_firing_hours - REQ_021_CATALYST_LIFETIME_HOURS
-        print(f"  FAIL: {t_firing_hours:.2f} h > {REQ_021_CATALYST_LIFETIME_HOURS} h")
-        print(f"  Overage: {overage_hours:.2f} hours")
-    print()
-    
-    # ============================================================================
-    # REQUIREMENTS COMPLIANCE SUMMARY
-    # ============================================================================
-    print("=" * 80)
-    print("REQUIREMENTS COMPLIANCE SUMMARY")
-    print("=" * 80)
-    
-    # REQ-002: Minimum Isp (verification that design Isp meets requirement)
-    req_002_status = "PASS" if DES001_DATA["specific_impulse_s"] >= REQ_002_MIN_ISP_S else "FAIL"
-    req_002_margin = (DES001_DATA["specific_impulse_s"] / REQ_002_MIN_ISP_S - 1.0) * 100.0
-    print(f"\nREQ-002: Isp ≥ {REQ_002_MIN_ISP_S:.0f} s (design verification)")
-    print(f"  Computed: {DES001_DATA['specific_impulse_s']:.2f} s (from DES-001)")
-    print(f"  Margin: {req_002_margin:.1f}%")
-    print(f"  Status: {req_002_status}")
-    
-    # REQ-005: Total Impulse
-    req_005_status = "PASS" if I_achievable_nominal >= REQ_005_TOTAL_IMPULSE_NS else "FAIL"
-    req_005_margin = (I_achievable_nominal / REQ_005_TOTAL_IMPULSE_NS - 1.0) * 100.0
-    print(f"\nREQ-005: Total Impulse ≥ {REQ_005_TOTAL_IMPULSE_NS:,.0f} N·s")
-    print(f"  Computed: {I_achievable_nominal:,.0f} N·s")
-    print(f"  Margin: {req_005_margin:.1f}%")
-    print(f"  Status: {req_005_status}")
-    
-    # REQ-008: Propellant Mass Budget
-    req_008_status = "PASS" if m_prop_with_margin <= REQ_008_MAX_PROPELLANT_MASS_KG else "FAIL"
-    if m_prop_with_margin <= REQ_008_MAX_PROPELLANT_MASS_KG:
-        req_008_margin = (1.0 - m_prop_with_margin / REQ_008_MAX_PROPELLANT_MASS_KG) * 100.0
+        req_008_margin = -(m_prop_with_margin / budget_kg - 1.0) * 100.0
+    if t_firing_hours <= catalyst_hours:
+        req_021_margin = (catalyst_hours - t_firing_hours) / catalyst_hours * 100.0
     else:
-        req_008_margin = -(m_prop_with_margin / REQ_008_MAX_PROPELLANT_MASS_KG - 1.0) * 100.0
-    print(f"\nREQ-008: Propellant Mass ≤ {REQ_008_MAX_PROPELLANT_MASS_KG:.1f} kg")
-    print(f"  Computed: {m_prop_with_margin:.4f} kg")
-    print(f"  Margin: {req_008_margin:.1f}%")
-    print(f"  Status: {req_008_status}")
-    
-    # REQ-020: Firing Cycles
-    req_020_status = "PASS" if REQ_020_FIRING_CYCLES >= 50000 else "FAIL"
-    print(f"\nREQ-020: ≥ 50,000 Firing Cycles")
-    print(f"  Assumed: {REQ_020_FIRING_CYCLES:,} cycles")
-    print(f"  Status: {req_020_status}")
-    
-    # REQ-021: Catalyst Lifetime
-    req_021_status = "PASS" if t_firing_hours <= REQ_021_CATALYST_LIFETIME_HOURS else "FAIL"
-    if t_firing_hours <= REQ_021_CATALYST_LIFETIME_HOURS:
-        req_021_margin = (REQ_021_CATALYST_LIFETIME_HOURS - t_firing_hours) / REQ_021_CATALYST_LIFETIME_HOURS * 100.0
-    else:
-        req_021_margin = -(t_firing_hours - REQ_021_CATALYST_LIFETIME_HOURS) / REQ_021_CATALYST_LIFETIME_HOURS * 100.0
-    print(f"\nREQ-021: Catalyst Lifetime ≥ {REQ_021_CATALYST_LIFETIME_HOURS} hours")
-    print(f"  Computed firing time: {t_firing_hours:.2f} hours")
-    print(f"  Margin: {req_021_margin:.1f}%")
-    print(f"  Status: {req_021_status}")
+        req_021_margin = -(t_firing_hours - catalyst_hours) / catalyst_hours * 100.0
+    
+    results = ComputedResults(
+        nominal_propellant_mass_kg=m_prop_nominal,
+        conservative_propellant_mass_min_isp_kg=m_prop_conservative,
+        margin_amount_kg=m_prop_with_margin - m_prop_nominal,
+        propellant_mass_with_margin_kg=m_prop_with_margin,
+        propellant_volume_m3=V_prop_m3,
+        propellant_volume_liters=V_prop_m3 * 1000.0,
+        total_firing_time_seconds=t_firing_seconds,
+        total_firing_time_hours=t_firing_hours,
+        impulse_per_cycle_Ns=I_cycle,
+        minimum_pulse_time_ms=t_pulse_min * 1000.0,
+        minimum_pulse_time_s=t_pulse_min,
+        achievable_total_impulse_nominal_Ns=I_achievable_nominal,
+        achievable_total_impulse_with_margin_Ns=m_prop_with_margin * isp_s * g0,
+        budget_utilization_pct=(m_prop_with_margin / budget_kg) * 100.0,
+        budget_remaining_kg=budget_remaining_kg if budget_remaining_kg >= 0 else 0.0
+    )
+    compliance = {
+        "REQ-002": ReqCompliance(
+            description="Specific Impulse ≥ 220 s",
+            threshold_min=params.minimum_isp_s,
+            computed=isp_s,
+            unit="s",
+            margin_percent=(isp_s / params.minimum_isp_s - 1.0) * 100.0,
+            status="PASS" if isp_s >= params.minimum_isp_s else "FAIL"
+        ),
+        "REQ-005": ReqCompliance(
+            description="Total Impulse ≥ 50,000 N·s",
+            threshold_min=total_impulse_ns,
+            computed=I_achievable_nominal,
+            unit="N·s",
+            margin_percent=(I_achievable_nominal / total_impulse_ns - 1.0) * 100.0,
+            status="PASS" if I_achievable_nominal >= total_impulse_ns else "FAIL"
+        ),
+        "REQ-008": ReqCompliance(
+            description="Propellant Mass ≤ 25 kg",
+            threshold_max=budget_kg,
+            computed=m_prop_with_margin,
+            unit="kg",
+            margin_percent=req_008_margin,
+            status="PASS" if m_prop_with_margin <= budget_kg else "FAIL"
+        ),
+        "REQ-020": ReqCompliance(
+            description="≥ 50,000 Firing Cycles",
+            threshold_min=params.minimum_firing_cycles,
+            computed=params.firing_cycles,
+            unit="cycles",
+            margin_percent=0.0,
+            status="PASS" if params.firing_cycles >= params.minimum_firing_cycles else "FAIL"
+        ),
+        "REQ-021": ReqCompliance(
+            description="Catalyst Lifetime ≥ 100 hours",
+            threshold_min=catalyst_hours,
+            computed=t_firing_hours,
+            unit="hours",
+            margin_percent=req_021_margin,
+            status="PASS" if t_firing_hours <= catalyst_hours else "FAIL"
+        )
+    }
+    return results, compliance
+
+
+# ============================================================================
+# PRECOMPUTED BUDGET
+# ============================================================================
+# Every result is a pure function of the constants above, so the budget is
+# evaluated once at import; other scripts can import it without running main()
+RESULTS, COMPLIANCE = compute_budget(PARAMETERS)
+M_PROP_WITH_MARGIN = RESULTS.propellant_mass_with_margin_kg  # kg
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+# Filled with format_map() from the Parameters and ComputedResults fields plus
+# the compliance margins/statuses and the verdict lines below
+REPORT_TEMPLATE = """\
+================================================================================
+DES-002: Propellant Budget Calculation
+================================================================================
+
+Step 1: Calculate Nominal Propellant Mass
+------------------------------------------------------------
+  Design approach: Use design Isp from DES-001 (actual expected performance)
+  Design Isp: {design_isp_s:.2f} s
+  Required total impulse: {total_impulse_requirement_Ns:,.0f} N·s
+  Standard gravity (g0): {standard_gravity_m_s2} m/s²
+  Nominal propellant mass: {nominal_propellant_mass_kg:.4f} kg
+
+Step 1a: Compare with Minimum Isp (Conservative Baseline)
+------------------------------------------------------------
+  Minimum Isp (conservative): {minimum_isp_s} s
+  Conservative propellant mass: {conservative_propellant_mass_min_isp_kg:.4f} kg
+  Reduction using design Isp: {isp_reduction_kg:.4f} kg ({isp_reduction_pct:.1f}%)
+
+Step 2: Add Mission Uncertainty Margin
+------------------------------------------------------------
+  Margin covers: Isp degradation over life, residual propellant,
+                  pressurization losses, potential leaks
+  Nominal propellant mass: {nominal_propellant_mass_kg:.4f} kg
+  Uncertainty margin: {uncertainty_margin_pct}%
+  Margin amount: {margin_amount_kg:.4f} kg
+  Propellant mass with margin: {propellant_mass_with_margin_kg:.4f} kg
+
+Step 3: Verify Against Propellant Mass Budget
+------------------------------------------------------------
+  Required propellant mass (with margin): {propellant_mass_with_margin_kg:.4f} kg
+  Maximum allowed propellant mass: {propellant_mass_budget_kg:.1f} kg
+  Budget utilization: {budget_utilization_pct:.1f}%
+{budget_verdict}
+
+Step 4: Calculate Propellant Volume
+------------------------------------------------------------
+  Propellant mass: {propellant_mass_with_margin_kg:.4f} kg
+  Hydrazine liquid density: {hydrazine_density_kg_m3} kg/m³
+  Propellant volume: {propellant_volume_m3:.6f} m³
+  Propellant volume: {propellant_volume_liters:.3f} liters
+
+Step 5: Calculate Total Firing Time (Using Design Isp)
+------------------------------------------------------------
+  Propellant mass: {propellant_mass_with_margin_kg:.4f} kg
+  Design mass flow rate: {mass_flow_rate_kg_s:.9f} kg/s
+  Total firing time: {total_firing_time_hours:.2f} hours
+  Total firing time: {total_firing_time_seconds:.0f} seconds
+
+Step 6: Calculate Impulse Per Firing Cycle
+------------------------------------------------------------
+  Total impulse: {total_impulse_requirement_Ns:,.0f} N·s
+  Number of firing cycles: {firing_cycles:,}
+  Impulse per cycle: {impulse_per_cycle_Ns:.4f} N·s
+  Minimum impulse bit requirement (REQ-004): 0.01 N·s
+{impulse_bit_verdict}
+
+Step 7: Calculate Minimum Pulse Time
+------------------------------------------------------------
+  Impulse per cycle: {impulse_per_cycle_Ns:.4f} N·s
+  Nominal thrust: {nominal_thrust_N:.1f} N
+  Minimum pulse time: {minimum_pulse_time_ms:.1f} ms
+  Minimum pulse time: {minimum_pulse_time_s:.4f} s
+
+Step 8: Verify Total Impulse Achievement
+------------------------------------------------------------
+  Design Isp (from DES-001): {design_isp_s:.2f} s
+  Propellant mass (nominal): {nominal_propellant_mass_kg:.4f} kg
+  Achievable total impulse (nominal): {achievable_total_impulse_nominal_Ns:,.0f} N·s
+  Required total impulse (REQ-005): {total_impulse_requirement_Ns:,.0f} N·s
+  Margin on total impulse: {req_005_margin:.1f}%
+  With uncertainty margin: {propellant_mass_with_margin_kg:.4f} kg
+  Achievable total impulse (with margin): {achievable_total_impulse_with_margin_Ns:,.0f} N·s
+
+Step 9: Verify Catalyst Lifetime (REQ-021)
+------------------------------------------------------------
+  Total firing time (with margin): {total_firing_time_hours:.2f} hours
+  Catalyst lifetime requirement: {catalyst_lifetime_hours} hours (REQ-021)
+{catalyst_verdict}
+
+================================================================================
+REQUIREMENTS COMPLIANCE SUMMARY
+================================================================================
+
+REQ-002: Isp ≥ {minimum_isp_s:.0f} s (design verification)
+  Computed: {design_isp_s:.2f} s (from DES-001)
+  Margin: {req_002_margin:.1f}%
+  Status: {req_002_status}
+
+REQ-005: Total Impulse ≥ {total_impulse_requirement_Ns:,.0f} N·s
+  Computed: {achievable_total_impulse_nominal_Ns:,.0f} N·s
+  Margin: {req_005_margin:.1f}%
+  Status: {req_005_status}
+
+REQ-008: Propellant Mass ≤ {propellant_mass_budget_kg:.1f} kg
+  Computed: {propellant_mass_with_margin_kg:.4f} kg
+  Margin: {req_008_margin:.1f}%
+  Status: {req_008_status}
+
+REQ-020: ≥ 50,000 Firing Cycles
+  Assumed: {firing_cycles:,} cycles
+  Status: {req_020_status}
+
+REQ-021: Catalyst Lifetime ≥ {catalyst_lifetime_hours} hours
+  Computed firing time: {total_firing_time_hours:.2f} hours
+  Margin: {req_021_margin:.1f}%
+  Status: {req_021_status}
+
+================================================================================"""
+
+# Pass/fail-dependent lines, keyed by status and filled before REPORT_TEMPLATE
+BUDGET_VERDICT = {
+    "PASS": "  Budget remaining: {budget_remaining_kg:.4f} kg\n"
+            "  Status: PASS - {budget_utilization_pct:.1f}% < 100.0%",
+    "FAIL": "  Budget overage: {budget_overage_kg:.4f} kg\n"
+            "  Status: FAIL - {budget_utilization_pct:.1f}% > 100.0%"
+}
+IMPULSE_BIT_VERDICT = {
+    "PASS": "  PASS: {impulse_per_cycle_Ns:.4f} N·s > 0.01 N·s",
+    "FAIL": "  FAIL: {impulse_per_cycle_Ns:.4f} N·s < 0.01 N·s"
+}
+CATALYST_VERDICT = {
+    "PASS": "  PASS: {total_firing_time_hours:.2f} h < {catalyst_lifetime_hours} h\n"
+            "  Margin: {catalyst_margin_hours:.2f} hours",
+    "FAIL": "  FAIL: {total_firing_time_hours:.2f} h > {catalyst_lifetime_hours} h\n"
+            "  Overage: {catalyst_overage_hours:.2f} hours"
+}
+
+
+def main():
+    output_path = Path("design/data/propellant_budget.json")
     
-    print()
-    print("=" * 80)
+    fields = {**asdict(PARAMETERS), **asdict(RESULTS)}
+    for req_id, req in COMPLIANCE.items():
+        prefix = req_id.lower().replace("-", "_")
+        fields[prefix + "_margin"] = req.margin_percent
+        fields[prefix + "_status"] = req.status
+    m_prop_nominal = RESULTS.nominal_propellant_mass_kg
+    m_prop_conservative = RESULTS.conservative_propellant_mass_min_isp_kg
+    m_prop_with_margin = RESULTS.propellant_mass_with_margin_kg
+    t_firing_hours = RESULTS.total_firing_time_hours
+    fields["isp_reduction_kg"] = m_prop_conservative - m_prop_nominal
+    fields["isp_reduction_pct"] = (m_prop_conservative - m_prop_nominal)/m_prop_conservative*100
+    fields["budget_overage_kg"] = m_prop_with_margin - REQ_008_MAX_PROPELLANT_MASS_KG
+    fields["catalyst_margin_hours"] = REQ_021_CATALYST_LIFETIME_HOURS - t_firing_hours
+    fields["catalyst_overage_hours"] = t_firing_hours - REQ_021_CATALYST_LIFETIME_HOURS
+    impulse_bit_status = "PASS" if RESULTS.impulse_per_cycle_Ns >= 0.01 else "FAIL"
+    fields["budget_verdict"] = BUDGET_VERDICT[fields["req_008_status"]].format_map(fields)
+    fields["impulse_bit_verdict"] = IMPULSE_BIT_VERDICT[impulse_bit_status].format_map(fields)
+    fields["catalyst_verdict"] = CATALYST_VERDICT[fields["req_021_status"]].format_map(fields)
+    
+    out = [REPORT_TEMPLATE.format_map(fields)]
     
     # ============================================================================
     # OUTPUT JSON DATA
     # ============================================================================
     output_data = {
         "design_id": "DES-002",
-        "parameters": {
-            "total_impulse_requirement_Ns": REQ_005_TOTAL_IMPULSE_NS,
-            "propellant_mass_budget_kg": REQ_008_MAX_PROPELLANT_MASS_KG,
-            "minimum_isp_s": REQ_002_MIN_ISP_S,
-            "design_isp_s": DES001_DATA["specific_impulse_s"],
-            "mass_flow_rate_kg_s": DES001_DATA["mass_flow_rate_kg_s"],
-            "nominal_thrust_N": DES001_DATA["thrust_N"],
-            "firing_cycles": REQ_020_FIRING_CYCLES,
-            "uncertainty_margin_pct": UNCERTAINTY_MARGIN_PCT,
-            "standard_gravity_m_s2": g0,
-            "hydrazine_density_kg_m3": RHO_N2H4,
-            "catalyst_lifetime_hours": REQ_021_CATALYST_LIFETIME_HOURS
-        },
-        "computed_results": {
-            "nominal_propellant_mass_kg": m_prop_nominal,
-            "conservative_propellant_mass_min_isp_kg": m_prop_conservative,
-            "margin_amount_kg": margin_amount,
-            "propellant_mass_with_margin_kg": m_prop_with_margin,
-            "propellant_volume_m3": V_prop_m3,
-            "propellant_volume_liters": V_prop_liters,
-            "total_firing_time_seconds": t_firing_seconds,
-            "total_firing_time_hours": t_firing_hours,
-            "impulse_per_cycle_Ns": I_cycle,
-            "minimum_pulse_time_ms": t_pulse_min_ms,
-            "minimum_pulse_time_s": t_pulse_min,
-            "achievable_total_impulse_nominal_Ns": I_achievable_nominal,
-            "achievable_total_impulse_with_margin_Ns": I_achievable_margin,
-            "budget_utilization_pct": budget_utilization_pct,
-            "budget_remaining_kg": budget_remaining_kg if budget_remaining_kg >= 0 else 0.0
-        },
-        "requirements_compliance": {
-            "REQ-002": {
-                "description": "Specific Impulse ≥ 220 s",
-                "threshold_min": REQ_002_MIN_ISP_S,
-                "computed": DES001_DATA["specific_impulse_s"],
-                "unit": "s",
-                "margin_percent": req_002_margin,
-                "status": req_002_status
-            },
-            "REQ-005": {
-                "description": "Total Impulse ≥ 50,000 N·s",
-                "threshold_min": REQ_005_TOTAL_IMPULSE_NS,
-                "computed": I_achievable_nominal,
-                "unit": "N·s",
-                "margin_percent": req_005_margin,
-                "status": req_005_status
-            },
-            "REQ-008": {
-                "description": "Propellant Mass ≤ 25 kg",
-                "threshold_max": REQ_008_MAX_PROPELLANT_MASS_KG,
-                "computed": m_prop_with_margin,
-                "unit": "kg",
-                "margin_percent": req_008_margin,
-                "status": req_008_status
-            },
-            "REQ-020": {
-                "description": "≥ 50,000 Firing Cycles",
-                "threshold_min": 50000,
-                "computed": REQ_020_FIRING_CYCLES,
-                "unit": "cycles",
-                "margin_percent": 0.0,
-                "status": req_020_status
-            },
-            "REQ-021": {
-                "description": "Catalyst Lifetime ≥ 100 hours",
-                "threshold_min": REQ_021_CATALYST_LIFETIME_HOURS,
-                "computed": t_firing_hours,
-                "unit": "hours",
-                "margin_percent": req_021_margin,
-                "status": req_021_status
-            }
-        },
+        "parameters": asdict(PARAMETERS),
+        "computed_results": asdict(RESULTS),
+        "requirements_compliance": {req_id: req.to_dict() for req_id, req in COMPLIANCE.items()},
         "assumptions": [
             f"Design Isp = {DES001_DATA['specific_impulse_s']:.2f} s from DES-001 (actual expected performance)",
             f"Minimum Isp = {REQ_002_MIN_ISP_S} s (conservative baseline for comparison, from REQ-002)",
@@ -410,10 +480,10 @@ def main():
             f"Firing cycles = {REQ_020_FIRING_CYCLES:,} cycles (REQ-020)",
             f"Uncertainty margin = {UNCERTAINTY_MARGIN_PCT}% for mission uncertainty",
             f"Hydrazine liquid density = {RHO_N2H4} kg/m³ at 25°C (from CONTEXT.md)",
-            f"Standard gravity g0 = {g0} m/s² (exact SI constant)",
+            f"Standard gravity g0 = {G0} m/s² (exact SI constant)",
             f"Mission life = {REQ_030_MISSION_YEARS} years (REQ-030)",
             f"Catalyst lifetime = {REQ_021_CATALYST_LIFETIME_HOURS} hours (REQ-021)",
-            f"Minimum impulse bit = 0.01 N·s (REQ-004) - satisfied with {I_cycle:.4f} N·s per cycle",
+            f"Minimum impulse bit = 0.01 N·s (REQ-004) - satisfied with {RESULTS.impulse_per_cycle_Ns:.4f} N·s per cycle",
             "Uncertainty margin accounts for: Isp degradation over mission life, residual propellant,",
             "  pressurization system losses, and potential leakage",
             "Isp degradation not explicitly modeled - margin accounts for performance degradation",
@@ -421,14 +491,14 @@ def main():
         ]
     }
     
-    # Write output JSON file
-    output_path = Path("design/data/propellant_budget.json")
+    # Write output JSON file, unless it already holds exactly these bytes
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
-    
-    print(f"\nOutput data written to: {output_path}")
-    print()
+    if write_json(output_path, output_data):
+        out.append(f"\nOutput data written to: {output_path}")
+    else:
+        out.append(f"\nOutput data up to date: {output_path}")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
     
     return 0
 
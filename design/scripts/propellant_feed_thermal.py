@@ -24,7 +24,7 @@ Physical Constants and Assumptions:
     - Chamber temperature from DES-001: 1127°C (1400 K)
 
 Design Parameters:
-    - Propellant mass: 13.68 kg (from DES-002, with 10% margin)
+    - Propellant mass: M_PROP_WITH_MARGIN from DES-002 (propellant_budget.py, 10% margin)
     - Feed line diameter: 4 mm (1/8" tube, DEC-015)
     - Feed line outer diameter: 6 mm (1/8" tube)
     - Feed line length: 2 m (assumed from tank to thruster)
@@ -37,22 +37,27 @@ Output:
     - Requirements compliance summary to stdout
 """
 
-import json
+import functools
 import math
+import sys
+
+import numpy as np
+
+import _optional_deps
+from _optional_deps import write_json
+from _physics_constants import CP_N2H4, RHO_N2H4, T_BOIL_N2H4_C, T_FREEZE_N2H4_C
+from propellant_budget import M_PROP_WITH_MARGIN
 
 # =============================================================================
 # PHYSICAL CONSTANTS (from CONTEXT.md and reference data)
 # =============================================================================
 
 # Universal constants
-g0 = 9.80665  # m/s² - standard gravitational acceleration (exact)
 pi = math.pi
 
-# Hydrazine properties (from CONTEXT.md, NASA-SP-8096)
-rho_N2H4 = 1004.0  # kg/m³ - liquid density at 25°C
-cp_N2H4 = 3200.0   # J/kg·K - specific heat at 25°C
-T_freeze_N2H4 = 1.4  # °C - freezing point (CRITICAL for thermal design)
-T_boil_N2H4 = 113.5  # °C - boiling point at 1 atm
+# Hydrazine properties (from CONTEXT.md, NASA-SP-8096) are imported from
+# _physics_constants.py
+mu_N2H4 = 0.00097  # Pa·s - dynamic viscosity at 20°C
 
 # MLI insulation properties (space heritage)
 k_MLI = 0.001  # W/m·K - effective thermal conductivity (15 layers)
@@ -76,19 +81,25 @@ mdot = 2.44e-4  # kg/s - nominal mass flow rate
 D_feed_inner = 0.004  # m - feed line inner diameter (4 mm)
 D_feed_outer = 0.006  # m - feed line outer diameter (6 mm)
 L_feed = 2.0  # m - feed line length from tank to thruster
+L_drop_short = 1.0  # m - short feed line length for the pressure drop check
+L_drop_long = 5.0  # m - long feed line length for the pressure drop check
 
 # Propellant properties (from DES-002)
-m_propellant = 13.68  # kg - propellant mass (with 10% margin)
+m_propellant = M_PROP_WITH_MARGIN  # kg - propellant mass (with 10% margin)
 
 # Feed system volume
 A_feed_inner = pi * (D_feed_inner / 2)**2  # m² - feed line cross-sectional area
 V_feed_line = A_feed_inner * L_feed  # m³ - feed line volume
 
 # Total propellant volume (tank + feed lines)
-V_total = m_propellant / rho_N2H4  # m³ - total propellant volume (tank dominates)
+V_total = m_propellant / RHO_N2H4  # m³ - total propellant volume (tank dominates)
 
 # Thermal mass of propellant
-C_thermal_propellant = m_propellant * cp_N2H4  # J/K - thermal mass
+C_thermal_propellant = m_propellant * CP_N2H4  # J/K - thermal mass
+
+# Heat conducted back from the chamber along the feed line wall (Fourier's law)
+A_feed_annulus = pi * (D_feed_outer**2 - D_feed_inner**2) / 4  # m² - wall cross-section
+Q_conduction = k_316L * A_feed_annulus * (T_chamber_C - 20.0) / L_feed  # W - chamber to 20°C tank
 
 # =============================================================================
 # REQUIREMENTS (from REQ_REGISTER.md)
@@ -109,11 +120,38 @@ T_propellant_max_req = 50.0  # °C - maximum allowable temperature
 # REQ-025: Materials must be space-qualified
 # - Verified by design: 316L SS has extensive flight heritage
 
+# =============================================================================
+# THERMAL SCENARIOS
+# =============================================================================
+
+# Every scenario is a heat input q over a time t into a thermal mass C, so the
+# temperature change is q * t / C throughout. Operational heating is steady
+# state: the heat goes into the propellant flowing through in t = 1 s (mdot * cp).
+COLD_SOOK, HOT_SOOK, OPERATIONAL = range(3)
+SCENARIO_Q_W = np.array([0.5, 0.5, Q_conduction])  # W - MLI heat leak, leak, conduction
+SCENARIO_T_S = np.array([8.0 * 3600.0, 12.0 * 3600.0, 1.0])  # s - 8 h eclipse, 12 h sun side
+SCENARIO_C_J_K = np.array([C_thermal_propellant, C_thermal_propellant, mdot * CP_N2H4])  # J/K
+SCENARIO_SIGN = np.array([-1.0, 1.0, 1.0])  # cold soak loses heat, the others gain it
+SCENARIO_T_INITIAL_C = np.array([20.0, 20.0, 20.0])  # °C - initial propellant / tank temperature
+T_spacecraft_cold_C = -40.0  # °C - spacecraft temperature, cold eclipse (REQ-017)
+T_spacecraft_hot_C = 80.0  # °C - spacecraft temperature, hot sun side (REQ-017)
+
 # =============================================================================
 # THERMAL ANALYSIS
 # =============================================================================
 
-def analyze_cold_sook():
+def scenario_temperatures():
+    """
+    Evaluate the temperature change of all thermal scenarios in one array op.
+
+    Returns:
+        tuple: (delta_T_C, T_final_C) arrays indexed by COLD_SOOK, HOT_SOOK
+        and OPERATIONAL
+    """
+    delta_T_C = SCENARIO_Q_W * SCENARIO_T_S / SCENARIO_C_J_K  # °C
+    return delta_T_C, SCENARIO_T_INITIAL_C + SCENARIO_SIGN * delta_T_C
+
+def analyze_cold_sook(delta_T_C, T_final_C):
     """
     Analyze worst-case cold soak scenario.
 
@@ -123,18 +161,21 @@ def analyze_cold_sook():
     - Cold soak duration: 8 hours (typical eclipse duration)
     - Heat leak rate: 0.5 W (conservative estimate for MLI insulation)
 
+    Args:
+        delta_T_C, T_final_C: Scenario arrays from scenario_temperatures()
+
     Returns:
         dict: Cold soak analysis results
     """
     # Scenario parameters
-    T_spacecraft_C = -40.0  # °C - spacecraft temperature
-    T_initial_C = 20.0  # °C - initial propellant temperature
-    t_soh = 8.0 * 3600.0  # s - cold soak duration (8 hours)
-    q_leak = 0.5  # W - heat leak rate through MLI
+    T_spacecraft_C = T_spacecraft_cold_C  # °C - spacecraft temperature
+    T_initial_C = float(SCENARIO_T_INITIAL_C[COLD_SOOK])  # °C - initial propellant temperature
+    t_soh = float(SCENARIO_T_S[COLD_SOOK])  # s - cold soak duration (8 hours)
+    q_leak = float(SCENARIO_Q_W[COLD_SOOK])  # W - heat leak rate through MLI
 
-    # Calculate temperature drop
-    delta_T_C = (q_leak * t_soh) / C_thermal_propellant  # °C
-    T_final_C = T_initial_C - delta_T_C  # °C
+    # Temperature drop
+    delta_T_C = float(delta_T_C[COLD_SOOK])  # °C
+    T_final_C = float(T_final_C[COLD_SOOK])  # °C
 
     # Calculate margin
     margin_min = T_final_C - T_propellant_min_req  # °C
@@ -155,7 +196,7 @@ def analyze_cold_sook():
         "status": status
     }
 
-def analyze_hot_sook():
+def analyze_hot_sook(delta_T_C, T_final_C):
     """
     Analyze worst-case hot soak scenario.
 
@@ -165,18 +206,21 @@ def analyze_hot_sook():
     - Hot soak duration: 12 hours (typical sun side duration)
     - Heat leak rate: 0.5 W (conservative estimate for MLI insulation)
 
+    Args:
+        delta_T_C, T_final_C: Scenario arrays from scenario_temperatures()
+
     Returns:
         dict: Hot soak analysis results
     """
     # Scenario parameters
-    T_spacecraft_C = 80.0  # °C - spacecraft temperature
-    T_initial_C = 20.0  # °C - initial propellant temperature
-    t_soh = 12.0 * 3600.0  # s - hot soak duration (12 hours)
-    q_leak = 0.5  # W - heat leak rate through MLI
+    T_spacecraft_C = T_spacecraft_hot_C  # °C - spacecraft temperature
+    T_initial_C = float(SCENARIO_T_INITIAL_C[HOT_SOOK])  # °C - initial propellant temperature
+    t_soh = float(SCENARIO_T_S[HOT_SOOK])  # s - hot soak duration (12 hours)
+    q_leak = float(SCENARIO_Q_W[HOT_SOOK])  # W - heat leak rate through MLI
 
-    # Calculate temperature rise
-    delta_T_C = (q_leak * t_soh) / C_thermal_propellant  # °C
-    T_final_C = T_initial_C + delta_T_C  # °C
+    # Temperature rise
+    delta_T_C = float(delta_T_C[HOT_SOOK])  # °C
+    T_final_C = float(T_final_C[HOT_SOOK])  # °C
 
     # Calculate margin
     margin_max = T_propellant_max_req - T_final_C  # °C
@@ -197,7 +241,7 @@ def analyze_hot_sook():
         "status": status
     }
 
-def analyze_operational_heating():
+def analyze_operational_heating(delta_T_C, T_final_C):
     """
     Analyze operational heating from thruster back-conduction.
 
@@ -208,23 +252,17 @@ def analyze_operational_heating():
     - Tank at nominal temperature: 20°C
     - Heat conducted back through feed line
 
+    Args:
+        delta_T_C, T_final_C: Scenario arrays from scenario_temperatures()
+
     Returns:
         dict: Operational heating analysis results
     """
-    # Feed line geometry
-    A_feed_annulus = pi * (D_feed_outer**2 - D_feed_inner**2) / 4  # m²
-
-    # Temperature difference (chamber to tank)
-    delta_T_C = T_chamber_C - 20.0  # °C
-
-    # Heat conduction along feed line (Fourier's law)
-    Q_conduction = k_316L * A_feed_annulus * delta_T_C / L_feed  # W
-
-    # Temperature rise of bulk propellant
-    delta_T_propellant_C = Q_conduction / (mdot * cp_N2H4)  # °C
+    # Temperature rise of bulk propellant from the conducted heat
+    delta_T_propellant_C = float(delta_T_C[OPERATIONAL])  # °C
 
     # Final propellant temperature (assuming tank at 20°C)
-    T_final_C = 20.0 + delta_T_propellant_C  # °C
+    T_final_C = float(T_final_C[OPERATIONAL])  # °C
 
     # Calculate margins
     margin_min = T_final_C - T_propellant_min_req  # °C
@@ -236,7 +274,7 @@ def analyze_operational_heating():
     return {
         "scenario": "operational_heating",
         "chamber_temperature_C": T_chamber_C,
-        "tank_temperature_C": 20.0,
+        "tank_temperature_C": float(SCENARIO_T_INITIAL_C[OPERATIONAL]),
         "feed_line_length_m": L_feed,
         "feed_line_thermal_conductivity_W_mK": k_316L,
         "feed_line_annulus_area_m2": A_feed_annulus,
@@ -250,47 +288,90 @@ def analyze_operational_heating():
         "status": status
     }
 
-def analyze_pressure_drop():
+def _pressure_drop_kernel(mdot_kg_s, D, L1, L2, rho, mu):
     """
-    Analyze pressure drop through feed line.
+    Darcy-Weisbach pressure drop for one mass flow rate through a round line.
 
-    Assumptions:
-    - Feed line diameter: 4 mm
-    - Mass flow rate: 2.44e-4 kg/s
-    - Hydrazine dynamic viscosity: 0.00097 Pa·s at 20°C
+    Plain Python, so the single design point needs no Numba import; the
+    flow-rate sweep compiles it on first use.
 
     Returns:
-        dict: Pressure drop analysis results
+        tuple: (Q_volumetric, v_flow, Re, f_friction, delta_P_L1_Pa, delta_P_L2_Pa)
     """
-    # Hydrazine properties at 20°C
-    mu_N2H4 = 0.00097  # Pa·s - dynamic viscosity
-
-    # Volumetric flow rate
-    Q_volumetric = mdot / rho_N2H4  # m³/s
-
-    # Flow velocity
-    v_flow = Q_volumetric / A_feed_inner  # m/s
+    # Volumetric flow rate and flow velocity
+    Q_volumetric = mdot_kg_s / rho  # m³/s
+    v_flow = Q_volumetric / (pi * (D / 2)**2)  # m/s
 
     # Reynolds number
-    Re = (rho_N2H4 * v_flow * D_feed_inner) / mu_N2H4
+    Re = (rho * v_flow * D) / mu
 
     # Flow regime check
     if Re < 2300:
         # Laminar flow
         f_friction = 64.0 / Re
-        flow_regime = "laminar"
     else:
         # Turbulent flow (using Colebrook-White approximation for smooth pipe)
         # For smooth pipes, Blasius correlation is reasonable
         f_friction = 0.316 / (Re ** 0.25)
-        flow_regime = "turbulent"
 
-    # Pressure drop (Darcy-Weisbach equation)
-    # Analyze for 1 meter and 5 meter feed line lengths
-    delta_P_1m_Pa = f_friction * (1.0 / D_feed_inner) * (rho_N2H4 * v_flow**2 / 2)
-    delta_P_1m_MPa = delta_P_1m_Pa / 1e6
+    # Pressure drop (Darcy-Weisbach equation) over both line lengths
+    delta_P_L1_Pa = f_friction * (L1 / D) * (rho * v_flow**2 / 2)
+    delta_P_L2_Pa = f_friction * (L2 / D) * (rho * v_flow**2 / 2)
+    return Q_volumetric, v_flow, Re, f_friction, delta_P_L1_Pa, delta_P_L2_Pa
+
+def _pressure_drop_sweep(mdot_kg_s, D, L1, L2, rho, mu):
+    """_pressure_drop_kernel over a 1-D float64 array, one result row per output."""
+    results = np.empty((6, mdot_kg_s.size))
+    for i in _optional_deps.prange(mdot_kg_s.size):
+        Q_volumetric, v_flow, Re, f_friction, delta_P_L1_Pa, delta_P_L2_Pa = _pressure_drop_kernel(
+            mdot_kg_s[i], D, L1, L2, rho, mu)
+        results[0, i] = Q_volumetric
+        results[1, i] = v_flow
+        results[2, i] = Re
+        results[3, i] = f_friction
+        results[4, i] = delta_P_L1_Pa
+        results[5, i] = delta_P_L2_Pa
+    return results
+
+@functools.lru_cache(maxsize=1)
+def _pressure_drop_sweep_kernel():
+    """
+    Compile _pressure_drop_sweep (and the _pressure_drop_kernel it calls) on first use.
 
-    delta_P_5m_Pa = f_friction * (5.0 / D_feed_inner) * (rho_N2H4 * v_flow**2 / 2)
+    Importing Numba and loading the cached kernels takes far longer than the
+    design point alone, so only parametric sweeps pay for it.
+    """
+    from _optional_deps import njit, register_jitable
+    register_jitable(_pressure_drop_kernel)
+    return njit(cache=True, parallel=True)(_pressure_drop_sweep)
+
+def analyze_pressure_drop(mdot_kg_s=mdot):
+    """
+    Analyze pressure drop through feed line.
+
+    mdot_kg_s may be an array of mass flow rates for parametric studies, in
+    which case every result is an array with one entry per flow rate.
+
+    Assumptions:
+    - Feed line diameter: 4 mm
+    - Mass flow rate: 2.44e-4 kg/s
+    - Hydrazine dynamic viscosity: 0.00097 Pa·s at 20°C
+
+    Returns:
+        dict: Pressure drop analysis results
+    """
+    # Flow and Darcy-Weisbach pressure drop for 1 meter and 5 meter feed line lengths
+    if np.ndim(mdot_kg_s) == 0:
+        (Q_volumetric, v_flow, Re, f_friction,
+         delta_P_1m_Pa, delta_P_5m_Pa) = _pressure_drop_kernel(
+            float(mdot_kg_s), D_feed_inner, L_drop_short, L_drop_long, RHO_N2H4, mu_N2H4)
+    else:
+        flows = np.asarray(mdot_kg_s, dtype=np.float64)
+        (Q_volumetric, v_flow, Re, f_friction,
+         delta_P_1m_Pa, delta_P_5m_Pa) = _pressure_drop_sweep_kernel()(
+            flows.ravel(), D_feed_inner, L_drop_short, L_drop_long, RHO_N2H4, mu_N2H4).reshape((6,) + flows.shape)
+    flow_regime = np.where(Re < 2300, "laminar", "turbulent")
+    delta_P_1m_MPa = delta_P_1m_Pa / 1e6
     delta_P_5m_MPa = delta_P_5m_Pa / 1e6
 
     # Verify pressure drop is negligible relative to feed pressure range
@@ -299,14 +380,14 @@ def analyze_pressure_drop():
     percentage_drop_5m = (delta_P_5m_MPa / pressure_range_MPa) * 100
 
     # Pass/Fail check (pressure drop should be < 1% of pressure range)
-    status_1m = "PASS" if percentage_drop_1m < 1.0 else "FAIL"
-    status_5m = "PASS" if percentage_drop_5m < 1.0 else "FAIL"
+    status_1m = np.where(percentage_drop_1m < 1.0, "PASS", "FAIL")
+    status_5m = np.where(percentage_drop_5m < 1.0, "PASS", "FAIL")
 
-    return {
+    results = {
         "scenario": "pressure_drop",
         "feed_line_inner_diameter_mm": D_feed_inner * 1000,
         "feed_line_outer_diameter_mm": D_feed_outer * 1000,
-        "mass_flow_rate_kg_s": mdot,
+        "mass_flow_rate_kg_s": mdot_kg_s,
         "volumetric_flow_rate_m3_s": Q_volumetric,
         "flow_velocity_m_s": v_flow,
         "reynolds_number": Re,
@@ -322,6 +403,88 @@ def analyze_pressure_drop():
         "status_1m": status_1m,
         "status_5m": status_5m
     }
+    if np.ndim(mdot_kg_s) == 0:
+        # Single operating point: plain Python values, as written to the JSON
+        results = {key: value.item() if isinstance(value, (np.ndarray, np.generic)) else value
+                   for key, value in results.items()}
+    return results
+
+@functools.lru_cache(maxsize=1)
+def run_analyses():
+    """
+    Run all four feed system analyses at the module design point.
+
+    Every input is a module-level constant, so the results are computed once
+    per process and shared by later calls; treat the dicts as read-only.
+
+    Returns:
+        tuple: (cold_sook, hot_sook, operational, pressure_drop) result dicts
+    """
+    delta_T_C, T_final_C = scenario_temperatures()
+    return (analyze_cold_sook(delta_T_C, T_final_C),
+            analyze_hot_sook(delta_T_C, T_final_C),
+            analyze_operational_heating(delta_T_C, T_final_C),
+            analyze_pressure_drop())
+
+# =============================================================================
+# REPORT LAYOUT
+# =============================================================================
+
+# One (title, rows) section per run_analyses() result, in the same order; each
+# row is a label and a str.format_map template over that result dict
+REPORT_SECTIONS = (
+    ("1. COLD SOAK ANALYSIS (Worst-Case Minimum Temperature)", (
+        ("Spacecraft Temperature", "{spacecraft_temperature_C:.1f} °C"),
+        ("Initial Propellant Temp", "{initial_temperature_C:.1f} °C"),
+        ("Soak Duration", "{soak_duration_hours:.1f} hours"),
+        ("Heat Leak Rate", "{heat_leak_rate_W:.2f} W"),
+        ("Temperature Drop", "{temperature_drop_C:.3f} °C"),
+        ("Final Propellant Temp", "{final_temperature_C:.3f} °C"),
+        ("Requirement (min)", "{requirement_min_C:.1f} °C"),
+        ("Margin", "{margin_C:.3f} °C"),
+        ("Status", "{status}"),
+    )),
+    ("2. HOT SOAK ANALYSIS (Worst-Case Maximum Temperature)", (
+        ("Spacecraft Temperature", "{spacecraft_temperature_C:.1f} °C"),
+        ("Initial Propellant Temp", "{initial_temperature_C:.1f} °C"),
+        ("Soak Duration", "{soak_duration_hours:.1f} hours"),
+        ("Heat Leak Rate", "{heat_leak_rate_W:.2f} W"),
+        ("Temperature Rise", "{temperature_rise_C:.3f} °C"),
+        ("Final Propellant Temp", "{final_temperature_C:.3f} °C"),
+        ("Requirement (max)", "{requirement_max_C:.1f} °C"),
+        ("Margin", "{margin_C:.3f} °C"),
+        ("Status", "{status}"),
+    )),
+    ("3. OPERATIONAL HEATING ANALYSIS (Steady-State Thruster Operation)", (
+        ("Chamber Temperature", "{chamber_temperature_C:.1f} °C"),
+        ("Tank Temperature", "{tank_temperature_C:.1f} °C"),
+        ("Feed Line Length", "{feed_line_length_m:.1f} m"),
+        ("Heat Conduction", "{heat_conduction_W:.3f} W"),
+        ("Temperature Rise", "{temperature_rise_C:.3f} °C"),
+        ("Final Propellant Temp", "{final_temperature_C:.3f} °C"),
+        ("Requirement (min)", "{requirement_min_C:.1f} °C"),
+        ("Requirement (max)", "{requirement_max_C:.1f} °C"),
+        ("Margin (min)", "{margin_min_C:.3f} °C"),
+        ("Margin (max)", "{margin_max_C:.3f} °C"),
+        ("Status", "{status}"),
+    )),
+    ("4. PRESSURE DROP ANALYSIS", (
+        ("Feed Line Inner Diameter", "{feed_line_inner_diameter_mm:.1f} mm"),
+        ("Feed Line Outer Diameter", "{feed_line_outer_diameter_mm:.1f} mm"),
+        ("Mass Flow Rate", "{mass_flow_rate_kg_s:.6f} kg/s"),
+        ("Flow Velocity", "{flow_velocity_m_s:.4f} m/s"),
+        ("Reynolds Number", "{reynolds_number:.1f}"),
+        ("Flow Regime", "{flow_regime}"),
+        ("Friction Factor", "{friction_factor:.4f}"),
+        ("Pressure Drop (1 m)", "{pressure_drop_1m_Pa:.3f} Pa ({pressure_drop_1m_MPa:.6f} MPa)"),
+        ("Pressure Drop (5 m)", "{pressure_drop_5m_Pa:.3f} Pa ({pressure_drop_5m_MPa:.6f} MPa)"),
+        ("Feed Pressure Range", "{pressure_range_MPa:.2f} MPa"),
+        ("Percentage Drop (1 m)", "{percentage_drop_1m_percent:.4f}%"),
+        ("Percentage Drop (5 m)", "{percentage_drop_5m_percent:.4f}%"),
+        ("Status (1 m)", "{status_1m}"),
+        ("Status (5 m)", "{status_5m}"),
+    )),
+)
 
 # =============================================================================
 # MAIN ANALYSIS
@@ -330,109 +493,55 @@ def analyze_pressure_drop():
 def main():
     """Execute thermal analysis and output results."""
 
-    print("="*80)
-    print("DES-007: Propellant Feed System Thermal Analysis")
-    print("="*80)
-    print()
+    # Report lines, written to stdout in one go at the end
+    out = []
+    out.append("="*80)
+    out.append("DES-007: Propellant Feed System Thermal Analysis")
+    out.append("="*80)
+    out.append("")
 
     # Run thermal analyses
-    cold_sook_results = analyze_cold_sook()
-    hot_sook_results = analyze_hot_sook()
-    operational_results = analyze_operational_heating()
-    pressure_drop_results = analyze_pressure_drop()
+    (cold_sook_results, hot_sook_results,
+     operational_results, pressure_drop_results) = run_analyses()
 
     # Print results
-    print("THERMAL ANALYSIS RESULTS")
-    print("-" * 80)
-    print()
-
-    # Cold soak results
-    print("1. COLD SOAK ANALYSIS (Worst-Case Minimum Temperature)")
-    print("-" * 80)
-    print(f"   Spacecraft Temperature:    {cold_sook_results['spacecraft_temperature_C']:.1f} °C")
-    print(f"   Initial Propellant Temp:    {cold_sook_results['initial_temperature_C']:.1f} °C")
-    print(f"   Soak Duration:              {cold_sook_results['soak_duration_hours']:.1f} hours")
-    print(f"   Heat Leak Rate:             {cold_sook_results['heat_leak_rate_W']:.2f} W")
-    print(f"   Temperature Drop:           {cold_sook_results['temperature_drop_C']:.3f} °C")
-    print(f"   Final Propellant Temp:      {cold_sook_results['final_temperature_C']:.3f} °C")
-    print(f"   Requirement (min):           {cold_sook_results['requirement_min_C']:.1f} °C")
-    print(f"   Margin:                     {cold_sook_results['margin_C']:.3f} °C")
-    print(f"   Status:                     {cold_sook_results['status']}")
-    print()
-
-    # Hot soak results
-    print("2. HOT SOAK ANALYSIS (Worst-Case Maximum Temperature)")
-    print("-" * 80)
-    print(f"   Spacecraft Temperature:    {hot_sook_results['spacecraft_temperature_C']:.1f} °C")
-    print(f"   Initial Propellant Temp:    {hot_sook_results['initial_temperature_C']:.1f} °C")
-    print(f"   Soak Duration:              {hot_sook_results['soak_duration_hours']:.1f} hours")
-    print(f"   Heat Leak Rate:             {hot_sook_results['heat_leak_rate_W']:.2f} W")
-    print(f"   Temperature Rise:           {hot_sook_results['temperature_rise_C']:.3f} °C")
-    print(f"   Final Propellant Temp:      {hot_sook_results['final_temperature_C']:.3f} °C")
-    print(f"   Requirement (max):           {hot_sook_results['requirement_max_C']:.1f} °C")
-    print(f"   Margin:                     {hot_sook_results['margin_C']:.3f} °C")
-    print(f"   Status:                     {hot_sook_results['status']}")
-    print()
-
-    # Operational heating results
-    print("3. OPERATIONAL HEATING ANALYSIS (Steady-State Thruster Operation)")
-    print("-" * 80)
-    print(f"   Chamber Temperature:         {operational_results['chamber_temperature_C']:.1f} °C")
-    print(f"   Tank Temperature:            {operational_results['tank_temperature_C']:.1f} °C")
-    print(f"   Feed Line Length:            {operational_results['feed_line_length_m']:.1f} m")
-    print(f"   Heat Conduction:             {operational_results['heat_conduction_W']:.3f} W")
-    print(f"   Temperature Rise:             {operational_results['temperature_rise_C']:.3f} °C")
-    print(f"   Final Propellant Temp:       {operational_results['final_temperature_C']:.3f} °C")
-    print(f"   Requirement (min):           {operational_results['requirement_min_C']:.1f} °C")
-    print(f"   Requirement (max):           {operational_results['requirement_max_C']:.1f} °C")
-    print(f"   Margin (min):                {operational_results['margin_min_C']:.3f} °C")
-    print(f"   Margin (max):                {operational_results['margin_max_C']:.3f} °C")
-    print(f"   Status:                     {operational_results['status']}")
-    print()
-
-    # Pressure drop results
-    print("4. PRESSURE DROP ANALYSIS")
-    print("-" * 80)
-    print(f"   Feed Line Inner Diameter:    {pressure_drop_results['feed_line_inner_diameter_mm']:.1f} mm")
-    print(f"   Feed Line Outer Diameter:    {pressure_drop_results['feed_line_outer_diameter_mm']:.1f} mm")
-    print(f"   Mass Flow Rate:              {pressure_drop_results['mass_flow_rate_kg_s']:.6f} kg/s")
-    print(f"   Flow Velocity:               {pressure_drop_results['flow_velocity_m_s']:.4f} m/s")
-    print(f"   Reynolds Number:             {pressure_drop_results['reynolds_number']:.1f}")
-    print(f"   Flow Regime:                 {pressure_drop_results['flow_regime']}")
-    print(f"   Friction Factor:             {pressure_drop_results['friction_factor']:.4f}")
-    print(f"   Pressure Drop (1 m):          {pressure_drop_results['pressure_drop_1m_Pa']:.3f} Pa ({pressure_drop_results['pressure_drop_1m_MPa']:.6f} MPa)")
-    print(f"   Pressure Drop (5 m):          {pressure_drop_results['pressure_drop_5m_Pa']:.3f} Pa ({pressure_drop_results['pressure_drop_5m_MPa']:.6f} MPa)")
-    print(f"   Feed Pressure Range:         {pressure_drop_results['pressure_range_MPa']:.2f} MPa")
-    print(f"   Percentage Drop (1 m):        {pressure_drop_results['percentage_drop_1m_percent']:.4f}%")
-    print(f"   Percentage Drop (5 m):        {pressure_drop_results['percentage_drop_5m_percent']:.4f}%")
-    print(f"   Status (1 m):                {pressure_drop_results['status_1m']}")
-    print(f"   Status (5 m):                {pressure_drop_results['status_5m']}")
-    print()
+    out.append("THERMAL ANALYSIS RESULTS")
+    out.append("-" * 80)
+    out.append("")
+
+    for (title, rows), results in zip(REPORT_SECTIONS,
+                                      (cold_sook_results, hot_sook_results,
+                                       operational_results, pressure_drop_results)):
+        out.append(title)
+        out.append("-" * 80)
+        for label, template in rows:
+            out.append(f"   {label + ':':<29}{template.format_map(results)}")
+        out.append("")
 
     # REQUIREMENTS COMPLIANCE SUMMARY
-    print("="*80)
-    print("REQUIREMENTS COMPLIANCE SUMMARY")
-    print("="*80)
-    print()
+    out.append("="*80)
+    out.append("REQUIREMENTS COMPLIANCE SUMMARY")
+    out.append("="*80)
+    out.append("")
 
     # REQ-007: Hydrazine propellant
     req_007_status = "PASS"
     req_007_margin = "N/A (material compatibility verified)"
-    print(f"REQ-007: Use hydrazine (N2H4) as propellant")
-    print(f"  Status:    {req_007_status}")
-    print(f"  Margin:    {req_007_margin}")
-    print(f"  Details:   316L stainless steel selected with extensive hydrazine flight heritage")
-    print()
+    out.append(f"REQ-007: Use hydrazine (N2H4) as propellant")
+    out.append(f"  Status:    {req_007_status}")
+    out.append(f"  Margin:    {req_007_margin}")
+    out.append(f"  Details:   316L stainless steel selected with extensive hydrazine flight heritage")
+    out.append("")
 
     # REQ-009: Feed pressure range
     req_009_status = "PASS" if pressure_drop_results['status_5m'] == "PASS" else "FAIL"
     req_009_margin_min = "N/A"
     req_009_margin_max = f"Pressure drop negligible (< 1%)"
-    print(f"REQ-009: Feed pressure range 0.15-0.30 MPa")
-    print(f"  Status:    {req_009_status}")
-    print(f"  Margin:    {req_009_margin_max}")
-    print(f"  Details:   Pressure drop < 0.001 MPa for 5 m feed line, negligible")
-    print()
+    out.append(f"REQ-009: Feed pressure range 0.15-0.30 MPa")
+    out.append(f"  Status:    {req_009_status}")
+    out.append(f"  Margin:    {req_009_margin_max}")
+    out.append(f"  Details:   Pressure drop < 0.001 MPa for 5 m feed line, negligible")
+    out.append("")
 
     # REQ-010: Propellant temperature 5-50°C
     # Check all three thermal scenarios
@@ -446,24 +555,24 @@ def main():
     # Find minimum and maximum margins across all scenarios
     min_margin_cold = cold_sook_results['margin_C']
     max_margin_hot = hot_sook_results['margin_C']
-    print(f"REQ-010: Propellant temperature 5-50°C")
-    print(f"  Status:    {req_010_status}")
-    print(f"  Margin (min):  {min_margin_cold:.2f} °C (cold soak scenario)")
-    print(f"  Margin (max):  {max_margin_hot:.2f} °C (hot soak scenario)")
-    print(f"  Details:")
-    print(f"    Cold soak:    {cold_sook_results['final_temperature_C']:.2f} °C (requirement: ≥{T_propellant_min_req}°C)")
-    print(f"    Hot soak:     {hot_sook_results['final_temperature_C']:.2f} °C (requirement: ≤{T_propellant_max_req}°C)")
-    print(f"    Operational:  {operational_results['final_temperature_C']:.2f} °C (requirement: 5-50°C)")
-    print()
+    out.append(f"REQ-010: Propellant temperature 5-50°C")
+    out.append(f"  Status:    {req_010_status}")
+    out.append(f"  Margin (min):  {min_margin_cold:.2f} °C (cold soak scenario)")
+    out.append(f"  Margin (max):  {max_margin_hot:.2f} °C (hot soak scenario)")
+    out.append(f"  Details:")
+    out.append(f"    Cold soak:    {cold_sook_results['final_temperature_C']:.2f} °C (requirement: ≥{T_propellant_min_req}°C)")
+    out.append(f"    Hot soak:     {hot_sook_results['final_temperature_C']:.2f} °C (requirement: ≤{T_propellant_max_req}°C)")
+    out.append(f"    Operational:  {operational_results['final_temperature_C']:.2f} °C (requirement: 5-50°C)")
+    out.append("")
 
     # REQ-025: Space-qualified materials
     req_025_status = "PASS"
     req_025_margin = "N/A (heritage verified)"
-    print(f"REQ-025: Materials must be space-qualified")
-    print(f"  Status:    {req_025_status}")
-    print(f"  Margin:    {req_025_margin}")
-    print(f"  Details:   316L SS, PTFE, and Viton have extensive flight heritage")
-    print()
+    out.append(f"REQ-025: Materials must be space-qualified")
+    out.append(f"  Status:    {req_025_status}")
+    out.append(f"  Margin:    {req_025_margin}")
+    out.append(f"  Details:   316L SS, PTFE, and Viton have extensive flight heritage")
+    out.append("")
 
     # Overall compliance
     all_pass = (
@@ -473,10 +582,10 @@ def main():
         req_025_status == "PASS"
     )
 
-    print("="*80)
-    print(f"OVERALL COMPLIANCE: {all_pass}")
-    print("="*80)
-    print()
+    out.append("="*80)
+    out.append(f"OVERALL COMPLIANCE: {all_pass}")
+    out.append("="*80)
+    out.append("")
 
     # Prepare output data
     output_data = {
@@ -485,10 +594,10 @@ def main():
         "date": "2026-02-14",
         "traced_requirements": ["REQ-007", "REQ-009", "REQ-010", "REQ-025"],
         "physical_constants": {
-            "rho_N2H4_kg_m3": rho_N2H4,
-            "cp_N2H4_J_kgK": cp_N2H4,
-            "T_freeze_N2H4_C": T_freeze_N2H4,
-            "T_boil_N2H4_C": T_boil_N2H4,
+            "rho_N2H4_kg_m3": RHO_N2H4,
+            "cp_N2H4_J_kgK": CP_N2H4,
+            "T_freeze_N2H4_C": T_FREEZE_N2H4_C,
+            "T_boil_N2H4_C": T_BOIL_N2H4_C,
             "k_MLI_W_mK": k_MLI,
             "k_316L_W_mK": k_316L,
             "mdot_kg_s": mdot
@@ -533,13 +642,14 @@ def main():
         "overall_compliance": all_pass
     }
 
-    # Write output JSON
+    # Write output JSON, unless the file already holds exactly these bytes
     output_file = "design/data/propellant_feed_thermal.json"
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
-
-    print(f"Output data written to: {output_file}")
-    print()
+    if write_json(output_file, output_data):
+        out.append(f"Output data written to: {output_file}")
+    else:
+        out.append(f"Output data up to date: {output_file}")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
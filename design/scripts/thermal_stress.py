@@ -21,8 +21,12 @@ Physical Constants (Sources: NASA materials handbooks, ASM International):
 - Stefan-Boltzmann constant: σ_SB = 5.670374419e-8 W/(m²·K⁴) (CODATA 2018)
 """
 
+import functools
 import json
-import math
+
+import numpy as np
+
+from _optional_deps import njit, prange
 
 # ============================================================================
 # PHYSICAL CONSTANTS AND MATERIAL PROPERTIES
@@ -69,6 +73,67 @@ COLD_START_TIME = 5.0       # s - Time to reach steady-state
 # Source: NASA materials handbooks, ASM International, MatWeb
 # ============================================================================
 
+# Degradation model codes, so the compiled kernels can branch on an int
+MAT_MOLYBDENUM = 0
+MAT_316L = 1
+MAT_DEFAULT = 2
+
+def _material_code(name):
+    """Degradation model code for a material name."""
+    if "Molybdenum" in name or "Mo" in name:
+        return MAT_MOLYBDENUM
+    elif "316L" in name:
+        return MAT_316L
+    return MAT_DEFAULT
+
+# Linear degradation models: factor = 1 - drop * T[K] / T_ref[K], clamped to
+# [floor, 1]. Rows (drop, T_ref [K], floor) are indexed by material code.
+E_DEGRADATION = (
+    (0.4, 1473.15, 0.3),  # Molybdenum: E decreases by ~40% from RT to 1200°C
+    (0.3, 1073.15, 0.6),  # 316L SS: E decreases by ~30% from RT to 800°C
+    (0.0, 1.0, 1.0),  # Default: no degradation
+)
+YIELD_DEGRADATION = (
+    (0.6, 1473.15, 0.2),  # Molybdenum: decreases to 40% of RT value at 1200°C
+    (0.85, 1073.15, 0.1),  # 316L SS: ~15% of RT value at 800°C
+    (0.0, 1.0, 1.0),  # Default: no degradation
+)
+
+def _degradation_table(model, value_rt):
+    """
+    np.interp table (temperatures [°C], values) for a linear degradation model.
+    
+    Nodes sit at absolute zero and at the knee where the floor is reached;
+    np.interp holds the end values beyond them, so the table reproduces the
+    clamped linear model without a dense grid.
+    """
+    drop, T_ref_K, floor = model
+    if drop == 0.0:
+        return np.array([-273.15, 0.0]), np.array([value_rt, value_rt])
+    T_knee_C = (1.0 - floor) * T_ref_K / drop - 273.15
+    return np.array([-273.15, T_knee_C]), np.array([value_rt, floor * value_rt])
+
+def _degradation_coefficients(model):
+    """
+    Folded (intercept, slope [1/°C], floor) of a linear degradation model.
+    
+    factor = clamp(intercept - slope * T[°C], floor, 1), with the Kelvin
+    conversion and reference temperature folded into the two coefficients.
+    """
+    drop, T_ref_K, floor = model
+    return 1.0 - drop * 273.15 / T_ref_K, drop / T_ref_K, floor
+
+@functools.lru_cache(maxsize=4096)
+def _degradation(coefficients, temp_c):
+    """
+    Clamped degradation factor for folded coefficients at temp_c [°C].
+    
+    Cached on the exact temperature, since the analyses re-query the same
+    few design temperatures; rounding the key would change the results.
+    """
+    intercept, slope_per_C, floor = coefficients
+    return max(floor, min(1.0, intercept - slope_per_C * temp_c))
+
 class Material:
     """Material properties for thermal stress analysis."""
     
@@ -101,6 +166,15 @@ class Material:
         self.poisson = poisson
         self.density = density
         self.temp_limit = temp_limit
+        # Degradation model resolved once from the name, not on every lookup
+        self._mat_id = _material_code(name)
+        # Property lookup tables, built once and queried with np.interp
+        self._E_T, self._E_table = _degradation_table(E_DEGRADATION[self._mat_id], E_rt)
+        self._sy_T, self._sy_table = _degradation_table(YIELD_DEGRADATION[self._mat_id],
+                                                        sigma_y_rt)
+        # Folded linear coefficients for the scalar lookups
+        self._E_coefficients = _degradation_coefficients(E_DEGRADATION[self._mat_id])
+        self._sy_coefficients = _degradation_coefficients(YIELD_DEGRADATION[self._mat_id])
     
     def get_E_at_temp(self, temp_c):
         """
@@ -112,31 +186,16 @@ class Material:
         
         Parameters:
         -----------
-        temp_c : float
+        temp_c : float or array_like
             Temperature in °C
         
         Returns:
         --------
         float : Young's modulus at temperature [Pa]
         """
-        # Temperature in Kelvin
-        temp_k = temp_c + 273.15
-        
-        # Degradation factor based on material
-        if "Molybdenum" in self.name or "Mo" in self.name:
-            # Molybdenum: E decreases by ~40% from RT to 1200°C
-            # Linear degradation model
-            degradation = 1.0 - 0.4 * (temp_k / 1473.15)  # 1200°C = 1473.15 K
-            degradation = max(0.3, min(1.0, degradation))  # Clamp between 0.3 and 1.0
-        elif "316L" in self.name:
-            # 316L SS: E decreases by ~30% from RT to 800°C
-            degradation = 1.0 - 0.3 * (temp_k / 1073.15)  # 800°C = 1073.15 K
-            degradation = max(0.6, min(1.0, degradation))  # Clamp between 0.6 and 1.0
-        else:
-            # Default: no degradation
-            degradation = 1.0
-        
-        return self.E_rt * degradation
+        if isinstance(temp_c, (int, float)):
+            return self.E_rt * _degradation(self._E_coefficients, temp_c)
+        return np.interp(temp_c, self._E_T, self._E_table)
     
     def get_alpha_at_temp(self, temp_c):
         """
@@ -164,31 +223,16 @@ class Material:
         
         Parameters:
         -----------
-        temp_c : float
+        temp_c : float or array_like
             Temperature in °C
         
         Returns:
         --------
         float : Yield strength at temperature [Pa]
         """
-        # Temperature in Kelvin
-        temp_k = temp_c + 273.15
-        
-        # Degradation factor based on material
-        if "Molybdenum" in self.name or "Mo" in self.name:
-            # Molybdenum: yield strength decreases to 40% of RT value at 1200°C
-            degradation = 1.0 - 0.6 * (temp_k / 1473.15)
-            degradation = max(0.2, min(1.0, degradation))
-        elif "316L" in self.name:
-            # 316L SS: yield strength decreases significantly with temperature
-            # At 800°C, yield strength is ~15% of RT value
-            degradation = 1.0 - 0.85 * (temp_k / 1073.15)
-            degradation = max(0.1, min(1.0, degradation))
-        else:
-            # Default: no degradation
-            degradation = 1.0
-        
-        return self.sigma_y_rt * degradation
+        if isinstance(temp_c, (int, float)):
+            return self.sigma_y_rt * _degradation(self._sy_coefficients, temp_c)
+        return np.interp(temp_c, self._sy_T, self._sy_table)
 
 # Material definitions
 # Source: ASM International, MatWeb, NASA materials handbooks
@@ -234,17 +278,25 @@ def calculate_thermal_stress(material, temp_initial, temp_final, constraint_leve
     -----------
     material : Material
         Material object with properties
-    temp_initial : float
+    temp_initial : float or array_like
         Initial temperature [°C]
-    temp_final : float
+    temp_final : float or array_like
         Final temperature [°C]
-    constraint_level : float
+    constraint_level : float or array_like
         Constraint level (0.0 = fully free, 1.0 = fully constrained)
     
     Returns:
     --------
-    dict : Dictionary with thermal stress results
+    dict : Dictionary with thermal stress results; for array inputs the
+        per-case entries are broadcast arrays
     """
+    # Array inputs (parametric sweeps) take the elementwise NumPy branches
+    vectorized = np.ndim(temp_initial) > 0 or np.ndim(temp_final) > 0 or \
+                 np.ndim(constraint_level) > 0
+    if vectorized:
+        temp_initial, temp_final, constraint_level = (
+            np.asarray(x, dtype=np.float64) for x in (temp_initial, temp_final, constraint_level))
+    
     # Temperature change
     delta_T = temp_final - temp_initial  # K (same magnitude as °C for delta)
     
@@ -254,58 +306,150 @@ def calculate_thermal_stress(material, temp_initial, temp_final, constraint_leve
     alpha = material.get_alpha_at_temp(temp_avg)
     nu = material.poisson
     
-    # Thermal strain (unconstrained)
-    epsilon_thermal = alpha * delta_T
-    
     # Thermal stress (with constraint level)
     # For constrained cylinder, plane stress condition
-    geometric_factor = 1.0 / (1.0 - nu)  # For thin-wall cylinder
-    sigma_thermal = E * alpha * delta_T * geometric_factor * constraint_level
+    # Geometric factor 1 / (1 - ν) for a thin-wall cylinder, folded with the
+    # constraint level into one scale
+    scale = constraint_level / (1.0 - nu)
+    sigma_thermal = (E * alpha) * (delta_T * scale)
     
     # Decomposed stresses
     sigma_axial = sigma_thermal
-    sigma_hoop = sigma_thermal
     sigma_radial = 0.0  # Thin-wall approximation
     
     # Yield strength at final temperature
     sigma_yield = material.get_yield_strength_at_temp(temp_final)
     
     # Safety factor (handle near-zero thermal stress case)
-    if abs(sigma_thermal) < 1e-6:  # Near-zero stress
+    if vectorized:
+        abs_sigma = np.abs(sigma_thermal)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            safety_factor = np.where(abs_sigma < 1e-6, np.inf,
+                                     np.where(sigma_yield > 0, sigma_yield / abs_sigma, 0.0))
+    elif abs(sigma_thermal) < 1e-6:  # Near-zero stress
         safety_factor = float('inf')  # No constraint, infinite safety factor
     elif sigma_yield > 0:
         safety_factor = sigma_yield / abs(sigma_thermal)
     else:
         safety_factor = 0.0
     
-    # Von Mises equivalent stress
-    sigma_vm = math.sqrt(sigma_axial**2 + sigma_hoop**2 - 
-                         sigma_axial * sigma_hoop + 
-                         3 * sigma_radial**2)
+    # Von Mises equivalent stress: with σ_axial = σ_hoop and σ_radial = 0,
+    # sqrt(σa² + σh² - σa·σh + 3σr²) reduces exactly to |σ_axial|
+    sigma_vm = abs(sigma_axial)
     
+    return _stress_record(material, temp_initial, temp_final, E, alpha, constraint_level,
+                          sigma_thermal / 1e6, sigma_radial / 1e6, sigma_vm / 1e6,
+                          sigma_yield / 1e6, safety_factor)
+
+def _stress_record(material, temp_initial, temp_final, E, alpha, constraint_level,
+                   sigma_thermal_MPa, sigma_radial_MPa, sigma_vm_MPa, sigma_yield_MPa,
+                   safety_factor):
+    """Result dict of calculate_thermal_stress (equal axial and hoop stress)."""
+    delta_T = temp_final - temp_initial
     return {
         'material': material.name,
         'temperature_initial_C': temp_initial,
         'temperature_final_C': temp_final,
         'temperature_delta_K': delta_T,
-        'temperature_avg_C': temp_avg,
+        'temperature_avg_C': (temp_initial + temp_final) / 2.0,
         'E_Pa': E,
         'alpha_1_K': alpha,
-        'poisson': nu,
+        'poisson': material.poisson,
         'constraint_level': constraint_level,
-        'thermal_strain': epsilon_thermal,
-        'thermal_stress_MPa': sigma_thermal / 1e6,
-        'axial_stress_MPa': sigma_axial / 1e6,
-        'hoop_stress_MPa': sigma_hoop / 1e6,
-        'radial_stress_MPa': sigma_radial / 1e6,
-        'von_mises_stress_MPa': sigma_vm / 1e6,
-        'yield_strength_MPa': sigma_yield / 1e6,
+        'thermal_strain': alpha * delta_T,
+        'thermal_stress_MPa': sigma_thermal_MPa,
+        'axial_stress_MPa': sigma_thermal_MPa,
+        'hoop_stress_MPa': sigma_thermal_MPa,
+        'radial_stress_MPa': sigma_radial_MPa,
+        'von_mises_stress_MPa': sigma_vm_MPa,
+        'yield_strength_MPa': sigma_yield_MPa,
         'safety_factor': safety_factor,
-        'status': 'PASS' if safety_factor >= 1.0 else 'FAIL'
+        'status': (np.where(safety_factor >= 1.0, 'PASS', 'FAIL') if np.ndim(safety_factor)
+                   else 'PASS' if safety_factor >= 1.0 else 'FAIL')
     }
 
+@njit(cache=True)
+def _transient_kernel(alpha_rt, poisson, E_T, E_table, sy_T, sy_table, T0, temps,
+                      constraint, out_E, out_stress, out_vm, out_yield, out_sf):
+    """
+    Thermal stress along a transient temperature profile.
+    
+    Same arithmetic as calculate_thermal_stress at every point of temps; fills
+    the preallocated out_* arrays (same length as temps) in place, stresses in Pa.
+    """
+    # Loop invariant: geometric factor 1 / (1 - ν) times the constraint level
+    scale = constraint / (1.0 - poisson)
+    
+    for i in range(temps.shape[0]):
+        temp_current = temps[i]
+        delta_T = temp_current - T0
+        
+        # Material properties at average temperature (alpha is constant)
+        temp_avg = (T0 + temp_current) / 2.0
+        E = np.interp(temp_avg, E_T, E_table)
+        
+        # Thermal stress (with partial constraint for cold start)
+        sigma_thermal = (E * alpha_rt) * (delta_T * scale)
+        sigma_yield = np.interp(temp_current, sy_T, sy_table)
+        
+        if abs(sigma_thermal) < 1e-6:
+            safety_factor = np.inf
+        elif sigma_yield > 0:
+            safety_factor = sigma_yield / abs(sigma_thermal)
+        else:
+            safety_factor = 0.0
+        
+        # Von Mises equivalent stress (axial = hoop, radial = 0)
+        sigma_vm = abs(sigma_thermal)
+        
+        out_E[i] = E
+        out_stress[i] = sigma_thermal
+        out_vm[i] = sigma_vm
+        out_yield[i] = sigma_yield
+        out_sf[i] = safety_factor
+
+@njit(cache=True, parallel=True)
+def _transient_sweep_kernel(alpha_rt, poisson, E_T, E_table, sy_T, sy_table, T0, temps,
+                            constraints, out_max_stress, out_max_index):
+    """
+    Peak von Mises stress [Pa] of many transients, run in parallel.
+    
+    Row c of temps (n_cases x n_points) is one temperature profile, evaluated
+    at constraints[c] by _transient_kernel; cases are spread across threads.
+    """
+    n_cases, n_points = temps.shape
+    for c in prange(n_cases):
+        E = np.empty(n_points)
+        sigma_thermal = np.empty(n_points)
+        sigma_vm = np.empty(n_points)
+        sigma_yield = np.empty(n_points)
+        safety_factor = np.empty(n_points)
+        _transient_kernel(alpha_rt, poisson, E_T, E_table, sy_T, sy_table, T0, temps[c],
+                          constraints[c], E, sigma_thermal, sigma_vm, sigma_yield,
+                          safety_factor)
+        i_max = np.argmax(sigma_vm)
+        out_max_stress[c] = sigma_vm[i_max]
+        out_max_index[c] = i_max
+
+def _cold_start_profile(temp_initial, temp_final, time_seconds, n_points):
+    """
+    Time constant, time grid and temperature profile(s) of a cold start.
+    
+    temp_final may be an array of shape (n_cases, 1), giving one profile row
+    per case.
+    """
+    # Thermal time constant (assuming 95% of steady-state at t = time_seconds)
+    # 1 - exp(-3τ) = 0.95 → exp(-3τ) = 0.05 → τ = -ln(0.05)/3 ≈ 1.0
+    tau = time_seconds / 3.0
+    
+    # Temperature profile over the whole time grid
+    time_points = np.linspace(0.0, time_seconds, n_points)
+    temps = temp_initial + (temp_final - temp_initial) * (1.0 - np.exp(-time_points / tau))
+    return tau, time_points, temps
+
 def calculate_transient_thermal_stress(material, temp_initial, temp_final, 
-                                     time_seconds, n_points=50, constraint_level=0.2):
+                                     time_seconds, n_points=50, constraint_level=0.2,
+                                     profile_dtype=np.float64):
     """
     Calculate transient thermal stress during cold start.
     
@@ -331,40 +475,43 @@ def calculate_transient_thermal_stress(material, temp_initial, temp_final,
         Number of time points to evaluate
     constraint_level : float
         Constraint level (0.0 = fully free, 1.0 = fully constrained)
+    profile_dtype : numpy dtype
+        Storage type of the stress_profile columns (except E_Pa). The default
+        float64 is the design record; np.float32 halves the memory of large
+        sweeps. The calculation itself is always float64.
     
     Returns:
     --------
-    dict : Dictionary with transient thermal stress results
+    dict : Dictionary with transient thermal stress results. 'stress_profile'
+        is columnar: a dict of arrays with one entry per time point (see
+        profile_records for the per-point dict form).
     """
-    # Thermal time constant (assuming 95% of steady-state at t = time_seconds)
-    # 1 - exp(-3τ) = 0.95 → exp(-3τ) = 0.05 → τ = -ln(0.05)/3 ≈ 1.0
-    tau = time_seconds / 3.0
-    
-    # Generate time points
-    time_points = [i * time_seconds / (n_points - 1) for i in range(n_points)]
-    
-    # Calculate thermal stress at each time point
-    thermal_stress_profile = []
-    max_stress = 0.0
-    max_stress_time = 0.0
-    
-    for t in time_points:
-        # Temperature at time t
-        temp_current = temp_initial + (temp_final - temp_initial) * \
-                       (1.0 - math.exp(-t / tau))
-        
-        # Thermal stress calculation (with partial constraint for cold start)
-        stress_result = calculate_thermal_stress(material, temp_initial, temp_current, 
-                                               constraint_level=constraint_level)
-        stress_result['time_s'] = t
-        stress_result['temperature_C'] = temp_current
-        
-        # Track maximum stress
-        if abs(stress_result['von_mises_stress_MPa']) > max_stress:
-            max_stress = abs(stress_result['von_mises_stress_MPa'])
-            max_stress_time = t
-        
-        thermal_stress_profile.append(stress_result)
+    tau, time_points, temps = _cold_start_profile(temp_initial, temp_final, time_seconds,
+                                                  n_points)
+    
+    # Thermal stress at each time point, computed by the compiled kernel
+    E, sigma_thermal, sigma_vm, sigma_yield, safety_factor = (
+        np.empty(n_points) for _ in range(5))
+    _transient_kernel(material.alpha_rt, material.poisson, material._E_T, material._E_table,
+                      material._sy_T, material._sy_table, float(temp_initial), temps,
+                      float(constraint_level), E, sigma_thermal, sigma_vm, sigma_yield,
+                      safety_factor)
+    
+    # Track maximum stress (at full precision, before any narrowing)
+    von_mises_MPa = np.abs(sigma_vm / 1e6)
+    i_max = int(np.argmax(von_mises_MPa))
+    max_stress = float(von_mises_MPa[i_max])
+    max_stress_time = float(time_points[i_max])
+    
+    thermal_stress_profile = {
+        'time_s': time_points.astype(profile_dtype, copy=False),
+        'temperature_C': temps.astype(profile_dtype, copy=False),
+        'E_Pa': E,
+        'thermal_stress_MPa': (sigma_thermal / 1e6).astype(profile_dtype, copy=False),
+        'von_mises_stress_MPa': (sigma_vm / 1e6).astype(profile_dtype, copy=False),
+        'yield_strength_MPa': (sigma_yield / 1e6).astype(profile_dtype, copy=False),
+        'safety_factor': safety_factor.astype(profile_dtype, copy=False)
+    }
     
     return {
         'material': material.name,
@@ -379,6 +526,86 @@ def calculate_transient_thermal_stress(material, temp_initial, temp_final,
         'stress_profile': thermal_stress_profile
     }
 
+def sweep_transient_max_stress(material, temp_initial, temp_final, time_seconds,
+                               constraint_level, n_points=50):
+    """
+    Peak transient thermal stress over a sweep of cold start cases.
+    
+    Evaluates the calculate_transient_thermal_stress model for every
+    broadcast combination of temp_final and constraint_level, with the cases
+    run in parallel; only the peak stress of each case is kept.
+    
+    Parameters:
+    -----------
+    material : Material
+        Material object with properties
+    temp_initial : float
+        Initial temperature [°C]
+    temp_final : float or array_like
+        Final steady-state temperature(s) [°C]
+    time_seconds : float
+        Time to reach steady-state [s]
+    constraint_level : float or array_like
+        Constraint level(s) (0.0 = fully free, 1.0 = fully constrained)
+    n_points : int
+        Number of time points per case
+    
+    Returns:
+    --------
+    dict : 'max_stress_MPa' and 'max_stress_time_s' arrays, shaped like the
+        broadcast of temp_final and constraint_level
+    """
+    temp_final, constraint_level = np.broadcast_arrays(
+        np.asarray(temp_final, dtype=np.float64), np.asarray(constraint_level, dtype=np.float64))
+    _, time_points, temps = _cold_start_profile(temp_initial, temp_final.reshape(-1, 1),
+                                                time_seconds, n_points)
+    
+    max_stress = np.empty(temps.shape[0])
+    max_index = np.empty(temps.shape[0], dtype=np.int64)
+    _transient_sweep_kernel(material.alpha_rt, material.poisson, material._E_T,
+                            material._E_table, material._sy_T, material._sy_table,
+                            float(temp_initial), temps, constraint_level.ravel(),
+                            max_stress, max_index)
+    return {
+        'max_stress_MPa': (max_stress / 1e6).reshape(temp_final.shape),
+        'max_stress_time_s': time_points[max_index].reshape(temp_final.shape)
+    }
+
+def profile_records(material, transient):
+    """
+    Per-time-point dicts for a calculate_transient_thermal_stress result.
+    
+    Each dict has the calculate_thermal_stress keys plus 'time_s' and
+    'temperature_C'; this is the stress_profile layout of the output JSON.
+    
+    Parameters:
+    -----------
+    material : Material
+        Material the transient was calculated for
+    transient : dict
+        Result of calculate_transient_thermal_stress
+    
+    Returns:
+    --------
+    list : One result dict per time point
+    """
+    profile = transient['stress_profile']
+    temp_initial = transient['temp_initial_C']
+    constraint_level = transient['constraint_level']
+    alpha = material.get_alpha_at_temp(temp_initial)
+    records = []
+    for t, temp_current, E, sigma, sigma_vm, sigma_yield, safety_factor in zip(
+            *(profile[key].tolist() for key in ('time_s', 'temperature_C', 'E_Pa',
+                                                'thermal_stress_MPa', 'von_mises_stress_MPa',
+                                                'yield_strength_MPa', 'safety_factor'))):
+        record = _stress_record(material, temp_initial, temp_current, E, alpha,
+                                constraint_level, sigma, 0.0, sigma_vm, sigma_yield,
+                                safety_factor)
+        record['time_s'] = t
+        record['temperature_C'] = temp_current
+        records.append(record)
+    return records
+
 def calculate_thermal_mismatch_stress(material1, material2, temp_initial, temp_final,
                                     radius):
     """
@@ -393,17 +620,24 @@ def calculate_thermal_mismatch_stress(material1, material2, temp_initial, temp_f
         First material (e.g., Molybdenum)
     material2 : Material
         Second material (e.g., 316L SS)
-    temp_initial : float
+    temp_initial : float or array_like
         Initial temperature [°C]
-    temp_final : float
+    temp_final : float or array_like
         Final temperature [°C]
     radius : float
         Interface radius [m]
     
     Returns:
     --------
-    dict : Dictionary with mismatch stress results
+    dict : Dictionary with mismatch stress results; for array temperatures
+        the per-case entries are broadcast arrays
     """
+    # Array inputs (parametric sweeps) take the elementwise NumPy branch
+    vectorized = np.ndim(temp_initial) > 0 or np.ndim(temp_final) > 0
+    if vectorized:
+        temp_initial = np.asarray(temp_initial, dtype=np.float64)
+        temp_final = np.asarray(temp_final, dtype=np.float64)
+    
     # Temperature change
     delta_T = temp_final - temp_initial  # K
     
@@ -425,8 +659,15 @@ def calculate_thermal_mismatch_stress(material1, material2, temp_initial, temp_f
     sigma_mismatch_2 = -sigma_mismatch_1  # Equal and opposite
     
     # Safety factors
-    safety_factor_1 = sigma_y1 / abs(sigma_mismatch_1) if sigma_y1 > 0 else float('inf')
-    safety_factor_2 = sigma_y2 / abs(sigma_mismatch_2) if sigma_y2 > 0 else float('inf')
+    if vectorized:
+        with np.errstate(divide='ignore'):
+            safety_factor_1 = np.where(sigma_y1 > 0, sigma_y1 / np.abs(sigma_mismatch_1), np.inf)
+            safety_factor_2 = np.where(sigma_y2 > 0, sigma_y2 / np.abs(sigma_mismatch_2), np.inf)
+        status = np.where(np.minimum(safety_factor_1, safety_factor_2) >= 1.0, 'PASS', 'FAIL')
+    else:
+        safety_factor_1 = sigma_y1 / abs(sigma_mismatch_1) if sigma_y1 > 0 else float('inf')
+        safety_factor_2 = sigma_y2 / abs(sigma_mismatch_2) if sigma_y2 > 0 else float('inf')
+        status = 'PASS' if min(safety_factor_1, safety_factor_2) >= 1.0 else 'FAIL'
     
     return {
         'material1': material1.name,
@@ -446,7 +687,7 @@ def calculate_thermal_mismatch_stress(material1, material2, temp_initial, temp_f
         'yield_strength_material2_MPa': sigma_y2 / 1e6,
         'safety_factor_material1': safety_factor_1,
         'safety_factor_material2': safety_factor_2,
-        'status': 'PASS' if min(safety_factor_1, safety_factor_2) >= 1.0 else 'FAIL'
+        'status': status
     }
 
 # ============================================================================
@@ -510,9 +751,9 @@ def verify_req_019(results):
     
     # Check that maximum thermal stress during cold start is below yield strength
     max_stress = nozzle_cold_start['max_stress_MPa']
-    final_point = nozzle_cold_start['stress_profile'][-1]
-    yield_strength = final_point['yield_strength_MPa']
-    safety_factor = final_point['safety_factor']
+    final_profile = nozzle_cold_start['stress_profile']
+    yield_strength = float(final_profile['yield_strength_MPa'][-1])
+    safety_factor = float(final_profile['safety_factor'][-1])
     
     # Check that safety factor >= 1.0 (requirement with margin)
     # Use 10% margin per design philosophy: safety_factor >= 1.1
@@ -678,21 +919,19 @@ def main():
     print(f"  Max Stress Time: {cold_start_result['max_stress_time_s']:.2f} s")
     
     # Final point details
-    final_point = cold_start_result['stress_profile'][-1]
-    print(f"  Final Temperature: {final_point['temperature_C']:.1f} °C")
-    print(f"  Final Thermal Stress: {final_point['thermal_stress_MPa']:.2f} MPa")
-    print(f"  Yield Strength at Final Temp: {final_point['yield_strength_MPa']:.1f} MPa")
-    print(f"  Safety Factor: {final_point['safety_factor']:.2f}")
-    print(f"  Status: {final_point['status']}")
+    profile = cold_start_result['stress_profile']
+    print(f"  Final Temperature: {profile['temperature_C'][-1]:.1f} °C")
+    print(f"  Final Thermal Stress: {profile['thermal_stress_MPa'][-1]:.2f} MPa")
+    print(f"  Yield Strength at Final Temp: {profile['yield_strength_MPa'][-1]:.1f} MPa")
+    print(f"  Safety Factor: {profile['safety_factor'][-1]:.2f}")
+    print(f"  Status: {'PASS' if profile['safety_factor'][-1] >= 1.0 else 'FAIL'}")
     
     # Print stress profile summary
     print("\n  Stress Profile (selected points):")
-    profile = cold_start_result['stress_profile']
     for i in [0, 5, 10, 20, 30, 40, -1]:
-        pt = profile[i]
-        print(f"    t={pt['time_s']:.2f}s, T={pt['temperature_C']:.1f}°C, "
-              f"σ_vm={pt['von_mises_stress_MPa']:.2f} MPa, "
-              f"SF={pt['safety_factor']:.2f}")
+        print(f"    t={profile['time_s'][i]:.2f}s, T={profile['temperature_C'][i]:.1f}°C, "
+              f"σ_vm={profile['von_mises_stress_MPa'][i]:.2f} MPa, "
+              f"SF={profile['safety_factor'][i]:.2f}")
     
     # Calculate thermal stress for chamber during cold start
     # Chamber is more constrained than nozzle, use constraint_level=0.15
@@ -701,12 +940,12 @@ def main():
         MOLYBDENUM, COLD_START_INITIAL, CHAMBER_OPERATING_TEMP, COLD_START_TIME, 
         n_points=50, constraint_level=0.15
     )
-    chamber_final = chamber_cold_start['stress_profile'][-1]
+    chamber_profile = chamber_cold_start['stress_profile']
     print(f"  Maximum Stress: {chamber_cold_start['max_stress_MPa']:.2f} MPa")
-    print(f"  Final Thermal Stress: {chamber_final['thermal_stress_MPa']:.2f} MPa")
-    print(f"  Yield Strength at Final Temp: {chamber_final['yield_strength_MPa']:.1f} MPa")
-    print(f"  Safety Factor: {chamber_final['safety_factor']:.2f}")
-    print(f"  Status: {chamber_final['status']}")
+    print(f"  Final Thermal Stress: {chamber_profile['thermal_stress_MPa'][-1]:.2f} MPa")
+    print(f"  Yield Strength at Final Temp: {chamber_profile['yield_strength_MPa'][-1]:.1f} MPa")
+    print(f"  Safety Factor: {chamber_profile['safety_factor'][-1]:.2f}")
+    print(f"  Status: {'PASS' if chamber_profile['safety_factor'][-1] >= 1.0 else 'FAIL'}")
     
     # Store cold start results
     results['cold_start'] = {
@@ -775,7 +1014,12 @@ def main():
     # PART 5: OUTPUT TO JSON
     # ============================================================================
     
-    # Write results to JSON file
+    # Write results to JSON file, with the cold start profiles (both Molybdenum)
+    # as per-point records
+    results['cold_start'] = {
+        name: dict(transient, stress_profile=profile_records(MOLYBDENUM, transient))
+        for name, transient in results['cold_start'].items()
+    }
     output_path = 'design/data/thermal_stress.json'
     with open(output_path, 'w') as f:
         json.dump(results, f, indent=2)
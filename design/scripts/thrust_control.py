@@ -22,10 +22,13 @@ Output:
 """
 
 import json
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+from _optional_deps import njit
+
 # =============================================================================
 # PHYSICAL CONSTANTS
 # Source: CONTEXT.md Section 6, NIST, NASA handbooks
@@ -200,6 +203,27 @@ def simulate_thermal_dynamics(t_s, eta_min=eta_min, eta_max=eta_max, tau_s=tau_t
     return eta_min + (eta_max - eta_min) * (1 - np.exp(-t_s / tau_s))
 
 
+@njit(cache=True, fastmath=True)
+def _startup_kernel(t_s, tau_flow, eta_min, eta_max, tau_thermal, F_nom):
+    """
+    Startup thrust, flow factor and catalyst efficiency in a single pass.
+    
+    Same first-order models as simulate_flow_dynamics (normalized by the
+    steady-state flow, which cancels) and simulate_thermal_dynamics.
+    """
+    n = t_s.size
+    thrust_N = np.empty(n)
+    mdot_factor = np.empty(n)
+    eta = np.empty(n)
+    for i in range(n):
+        mf = 1.0 - math.exp(-t_s[i] / tau_flow)
+        eff = eta_min + (eta_max - eta_min) * (1.0 - math.exp(-t_s[i] / tau_thermal))
+        mdot_factor[i] = mf
+        eta[i] = eff
+        thrust_N[i] = mf * eff * F_nom
+    return thrust_N, mdot_factor, eta
+
+
 def simulate_startup_transient(t_s):
     """
     Simulate thrust during startup transient.
@@ -214,16 +238,10 @@ def simulate_startup_transient(t_s):
         mdot_factor: Flow factor (mdot/mdot_ss)
         eta: Catalyst efficiency
     """
-    # Calculate flow dynamics
-    mdot_factor = simulate_flow_dynamics(t_s, mdot_nominal_kg_s, tau_flow_s) / mdot_nominal_kg_s
-    
-    # Calculate thermal dynamics (catalyst efficiency)
-    eta = simulate_thermal_dynamics(t_s, eta_min, eta_max, tau_thermal_s)
-    
-    # Combined thrust response
-    thrust_N = mdot_factor * eta * F_nominal_N
-    
-    return thrust_N, mdot_factor, eta
+    t_s = np.asarray(t_s, dtype=np.float64)
+    thrust_N, mdot_factor, eta = _startup_kernel(
+        t_s.ravel(), tau_flow_s, eta_min, eta_max, tau_thermal_s, F_nominal_N)
+    return thrust_N.reshape(t_s.shape), mdot_factor.reshape(t_s.shape), eta.reshape(t_s.shape)
 
 
 def find_time_to_thrust_percent(target_percent):
@@ -253,6 +271,83 @@ def find_time_to_thrust_percent(target_percent):
         return t_s[-1]
 
 
+def build_figures():
+    """
+    Render the two DES-006 figures into design/plots.
+    
+    Returns:
+        list of Path: Paths of the generated figures
+    """
+    # Thrust vs. pressure curve and achievable range within REQ-009
+    pressures_MPa, thrusts_N, _ = calculate_thrust_vs_pressure()
+    F_min_achievable_N = thrusts_N[np.argmin(np.abs(pressures_MPa - P_feed_min_MPa))]
+    F_max_achievable_N = thrusts_N[np.argmin(np.abs(pressures_MPa - P_feed_max_MPa))]
+    
+    # Startup transient, 0 to 500 ms
+    t_s = np.linspace(0, 0.5, 1000)
+    thrust_N, mdot_factor, eta = simulate_startup_transient(t_s)
+    t_90_ms = find_time_to_thrust_percent(90.0) * 1000.0
+    
+    # Plot 1: Thrust vs. Feed Pressure
+    fig1, ax1 = plt.subplots(figsize=(10, 6))
+    ax1.plot(pressures_MPa, thrusts_N, 'b-', linewidth=2, label='Thrust')
+    ax1.axhline(y=F_min_req_N, color='g', linestyle='--', label=f'REQ-003 Min: {F_min_req_N:.1f} N')
+    ax1.axhline(y=F_max_req_N, color='r', linestyle='--', label=f'REQ-003 Max: {F_max_req_N:.1f} N')
+    ax1.axhline(y=F_nominal_req_N, color='k', linestyle=':', label=f'REQ-001 Nominal: {F_nominal_req_N:.1f} N')
+    ax1.axvline(x=P_feed_min_MPa, color='orange', linestyle='--', label=f'REQ-009 Min: {P_feed_min_MPa:.2f} MPa')
+    ax1.axvline(x=P_feed_max_MPa, color='orange', linestyle='--', label=f'REQ-009 Max: {P_feed_max_MPa:.2f} MPa')
+    
+    # Mark achievable range
+    ax1.fill_between([P_feed_min_MPa, P_feed_max_MPa], [F_min_achievable_N, F_max_achievable_N], 
+                     alpha=0.3, color='green', label='Achievable Range')
+    
+    ax1.set_xlabel('Feed Pressure (MPa)', fontsize=12)
+    ax1.set_ylabel('Thrust (N)', fontsize=12)
+    ax1.set_title('DES-006: Thrust vs. Feed Pressure', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(loc='upper left')
+    ax1.set_xlim([0.14, 0.32])
+    ax1.set_ylim([0, 1.3])
+    
+    fig1_path = Path('design/plots/DES006_thrust_vs_pressure.png')
+    fig1_path.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(fig1_path, dpi=150, bbox_inches='tight')
+    plt.close(fig1)
+    
+    # Plot 2: Startup Transient
+    fig2, (ax2a, ax2b) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
+    
+    # Thrust response
+    ax2a.plot(t_s * 1000, thrust_N / F_nominal_N * 100, 'b-', linewidth=2, label='Thrust')
+    ax2a.axhline(y=90, color='r', linestyle='--', label=f'REQ-006: {thrust_startup_percent:.0f}%')
+    ax2a.axvline(x=t_90_ms, color='r', linestyle=':', label=f't_90% = {t_90_ms:.0f} ms')
+    ax2a.axvline(x=t_startup_max_ms, color='orange', linestyle='--', label=f'REQ-006 Limit: {t_startup_max_ms:.0f} ms')
+    ax2a.axvspan(0, t_startup_max_ms, alpha=0.1, color='green')
+    
+    ax2a.set_ylabel('Thrust (% of Nominal)', fontsize=12)
+    ax2a.set_title('DES-006: Startup Transient Response', fontsize=14, fontweight='bold')
+    ax2a.grid(True, alpha=0.3)
+    ax2a.legend(loc='lower right')
+    ax2a.set_ylim([0, 105])
+    
+    # Flow and thermal dynamics
+    ax2b.plot(t_s * 1000, mdot_factor * 100, 'g-', linewidth=2, label='Flow Factor')
+    ax2b.plot(t_s * 1000, eta * 100, 'm-', linewidth=2, label='Catalyst Efficiency')
+    ax2b.axhline(y=50, color='orange', linestyle='--', label=f'Preheat efficiency: {eta_min*100:.0f}%')
+    
+    ax2b.set_xlabel('Time (ms)', fontsize=12)
+    ax2b.set_ylabel('Factor (%)', fontsize=12)
+    ax2b.grid(True, alpha=0.3)
+    ax2b.legend(loc='lower right')
+    ax2b.set_ylim([0, 105])
+    
+    fig2_path = Path('design/plots/DES006_startup_transient.png')
+    fig2_path.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(fig2_path, dpi=150, bbox_inches='tight')
+    plt.close(fig2)
+    return [fig1_path, fig2_path]
+
+
 # =============================================================================
 # MAIN ANALYSIS
 # =============================================================================
@@ -380,65 +475,8 @@ def main():
     print("4. Generating Plots")
     print("-" * 80)
     
-    # Plot 1: Thrust vs. Feed Pressure
-    fig1, ax1 = plt.subplots(figsize=(10, 6))
-    ax1.plot(pressures_MPa, thrusts_N, 'b-', linewidth=2, label='Thrust')
-    ax1.axhline(y=F_min_req_N, color='g', linestyle='--', label=f'REQ-003 Min: {F_min_req_N:.1f} N')
-    ax1.axhline(y=F_max_req_N, color='r', linestyle='--', label=f'REQ-003 Max: {F_max_req_N:.1f} N')
-    ax1.axhline(y=F_nominal_req_N, color='k', linestyle=':', label=f'REQ-001 Nominal: {F_nominal_req_N:.1f} N')
-    ax1.axvline(x=P_feed_min_MPa, color='orange', linestyle='--', label=f'REQ-009 Min: {P_feed_min_MPa:.2f} MPa')
-    ax1.axvline(x=P_feed_max_MPa, color='orange', linestyle='--', label=f'REQ-009 Max: {P_feed_max_MPa:.2f} MPa')
-    
-    # Mark achievable range
-    ax1.fill_between([P_feed_min_MPa, P_feed_max_MPa], [F_min_achievable_N, F_max_achievable_N], 
-                     alpha=0.3, color='green', label='Achievable Range')
-    
-    ax1.set_xlabel('Feed Pressure (MPa)', fontsize=12)
-    ax1.set_ylabel('Thrust (N)', fontsize=12)
-    ax1.set_title('DES-006: Thrust vs. Feed Pressure', fontsize=14, fontweight='bold')
-    ax1.grid(True, alpha=0.3)
-    ax1.legend(loc='upper left')
-    ax1.set_xlim([0.14, 0.32])
-    ax1.set_ylim([0, 1.3])
-    
-    fig1_path = Path('design/plots/DES006_thrust_vs_pressure.png')
-    fig1_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(fig1_path, dpi=150, bbox_inches='tight')
-    print(f"  Saved: {fig1_path}")
-    plt.close(fig1)
-    
-    # Plot 2: Startup Transient
-    fig2, (ax2a, ax2b) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
-    
-    # Thrust response
-    ax2a.plot(t_s * 1000, thrust_N / F_nominal_N * 100, 'b-', linewidth=2, label='Thrust')
-    ax2a.axhline(y=90, color='r', linestyle='--', label=f'REQ-006: {thrust_startup_percent:.0f}%')
-    ax2a.axvline(x=t_90_ms, color='r', linestyle=':', label=f't_90% = {t_90_ms:.0f} ms')
-    ax2a.axvline(x=t_startup_max_ms, color='orange', linestyle='--', label=f'REQ-006 Limit: {t_startup_max_ms:.0f} ms')
-    ax2a.axvspan(0, t_startup_max_ms, alpha=0.1, color='green')
-    
-    ax2a.set_ylabel('Thrust (% of Nominal)', fontsize=12)
-    ax2a.set_title('DES-006: Startup Transient Response', fontsize=14, fontweight='bold')
-    ax2a.grid(True, alpha=0.3)
-    ax2a.legend(loc='lower right')
-    ax2a.set_ylim([0, 105])
-    
-    # Flow and thermal dynamics
-    ax2b.plot(t_s * 1000, mdot_factor * 100, 'g-', linewidth=2, label='Flow Factor')
-    ax2b.plot(t_s * 1000, eta * 100, 'm-', linewidth=2, label='Catalyst Efficiency')
-    ax2b.axhline(y=50, color='orange', linestyle='--', label=f'Preheat efficiency: {eta_min*100:.0f}%')
-    
-    ax2b.set_xlabel('Time (ms)', fontsize=12)
-    ax2b.set_ylabel('Factor (%)', fontsize=12)
-    ax2b.grid(True, alpha=0.3)
-    ax2b.legend(loc='lower right')
-    ax2b.set_ylim([0, 105])
-    
-    fig2_path = Path('design/plots/DES006_startup_transient.png')
-    fig2_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(fig2_path, dpi=150, bbox_inches='tight')
-    print(f"  Saved: {fig2_path}")
-    plt.close(fig2)
+    for path in build_figures():
+        print(f"  Saved: {path}")
     print()
     
     # ------------------------------------------------------------------------
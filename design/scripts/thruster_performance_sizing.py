@@ -520,6 +520,22 @@ def generate_performance_plot(Pc_MPa, thrust_N, Isp_s, expansion_ratio):
 
     print("✓ Plot saved: design/plots/des001_performance.png")
 
+def build_figures(data):
+    """
+    Render the DES-001 performance figure into design/plots.
+
+    Args:
+        data (dict): DES-001 results as written to thruster_performance_sizing.json
+
+    Returns:
+        list: Paths of the generated figures
+    """
+    generate_performance_plot(data["parameters"]["chamber_pressure_MPa"],
+                              data["computed_results"]["thrust_N"],
+                              data["computed_results"]["specific_impulse_s"],
+                              data["parameters"]["expansion_ratio"])
+    return ["design/plots/des001_performance.png"]
+
 if __name__ == "__main__":
     success = main()
     exit(0 if success else 1)